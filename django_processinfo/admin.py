@@ -16,18 +16,39 @@ from bx_django_utils.humanize.time import human_timedelta
 from bx_django_utils.templatetags.humanize_time import human_duration
 from django.conf import settings
 from django.contrib import admin
-from django.db.models.aggregates import Avg, Max, Min, Sum
-from django.http import HttpResponseRedirect
+from django.core.cache import cache
+from django.core.exceptions import PermissionDenied
+from django.db.models import Q
+from django.db.models.aggregates import Avg, Count, Max, Min, Sum
+from django.http import HttpResponseRedirect, StreamingHttpResponse
 from django.template.defaultfilters import filesizeformat
+from django.template.response import TemplateResponse
 from django.urls import path
+from django.utils import timezone
 from django.utils.safestring import mark_safe
 from django.utils.translation import gettext as _
 
 from django_processinfo import __version__
-from django_processinfo.models import ProcessInfo, SiteStatistics
+from django_processinfo.api import api_response
+from django_processinfo.export import FORMATS, iter_export
+from django_processinfo.models import (
+    ConnectionStatistics,
+    HostSample,
+    MiddlewareStatistics,
+    OutcomeStatistics,
+    ProcessInfo,
+    ProcessSample,
+    QueryFingerprint,
+    SiteStatistics,
+    TemplateStatistics,
+    ViewStatistics,
+    WarmupStatistics,
+)
+from django_processinfo.storage import get_storage
 from django_processinfo.utils.average import average
 from django_processinfo.utils.human_time import datetime2float
 from django_processinfo.utils.proc_info import meminfo, process_information, uptime_infomation
+from django_processinfo.utils.sparkline import sparkline_points
 
 
 # Collect some static informations
@@ -42,6 +63,157 @@ else:
     except Exception as err:
         ip_addresses = f"[Error: {err}]"
 
+RATE_LOAD_AVERAGES = ("request_rate", "error_rate", "cpu_load")
+
+# Needed for ProcessInfo.is_leak_suspect() and get_suggested_max_requests():
+GROWTH_FIELDS = ("growth_count", "growth_requests_m2", "growth_rss_m2", "growth_rss_requests_co")
+
+
+def queue_time_avg(queue_time_sum, queue_time_count):
+    if not queue_time_count:
+        return None
+    return queue_time_sum / queue_time_count
+
+
+def format_queue_vs_service_time(queue_time, service_time):
+    """
+    >>> format_queue_vs_service_time(None, 0.1)
+    '-'
+    >>> format_queue_vs_service_time(0.025, 0.075)
+    '25.0 ms / 75.0 ms (25.0% queued)'
+    """
+    if queue_time is None:
+        return "-"
+    total = queue_time + service_time
+    queued = queue_time / total * 100 if total else 0
+    return f"{queue_time * 1000:.1f} ms / {service_time * 1000:.1f} ms ({queued:.1f}% queued)"
+
+
+class IOAdminMixin:
+    """
+    Average I/O per request, see: models.IOModelMixin
+    """
+
+    def io_syscalls(self, obj):
+        if not obj.io_count:
+            return "-"
+        return (
+            f"{obj.io_syscr_avg:.1f} / {obj.io_syscw_avg:.1f}"
+            f" ({filesizeformat(obj.io_rchar_avg)} / {filesizeformat(obj.io_wchar_avg)})"
+        )
+    io_syscalls.short_description = _("Avg read/write syscalls")
+
+    def io_storage(self, obj):
+        if not obj.io_count:
+            return "-"
+        return f"{filesizeformat(obj.io_read_bytes_avg)} / {filesizeformat(obj.io_write_bytes_avg)}"
+    io_storage.short_description = _("Avg storage read/write")
+
+
+class GCAdminMixin:
+    """
+    Garbage collector pauses, see: models.GCModelMixin
+    """
+
+    def gc_time_share(self, obj):
+        return f"{obj.get_gc_time_share():.2f}%"
+    gc_time_share.short_description = _("GC time share")
+
+    def gc_collections(self, obj):
+        return f"{obj.gc_count_0} / {obj.gc_count_1} / {obj.gc_count_2}"
+    gc_collections.short_description = _("GC collections (gen 0/1/2)")
+
+
+class CacheAdminMixin:
+    """
+    Cache backend usage, see: models.CacheModelMixin
+    """
+
+    def cache_hit_ratio(self, obj):
+        if not obj.cache_count:
+            return "-"
+        return (
+            f"{obj.get_cache_hit_ratio():.1f}%"
+            f" ({obj.cache_hits} / {obj.cache_misses} / {obj.cache_sets} / {obj.cache_deletes})"
+        )
+    cache_hit_ratio.short_description = _("Cache hit ratio (hits/misses/sets/deletes)")
+
+    def cache_time_share(self, obj):
+        if not obj.cache_count:
+            return "-"
+        return f"{obj.get_cache_time_share():.2f}% (max: {human_timedelta(obj.cache_time_max)})"
+    cache_time_share.short_description = _("Cache time share")
+
+
+def format_avg(total, count):
+    """
+    >>> format_avg(3.0, 2)
+    '1.5\xa0seconds'
+    >>> format_avg(0, 0)
+    '-'
+    """
+    if not count:
+        return "-"
+    return human_timedelta(total / count)
+
+
+def format_load_averages(averages, format_spec=".2f"):
+    """
+    >>> format_load_averages([1, 0.5, 0.25])
+    '1.00 / 0.50 / 0.25'
+    >>> format_load_averages([0.5, 0.1, 0], format_spec=".0%")
+    '50% / 10% / 0%'
+    """
+    return " / ".join(format(value, format_spec) for value in averages)
+
+
+def get_host_sparklines(count=60):
+    """
+    Sparklines of the last HostSample entries, see: host_collector.py
+    """
+    samples = list(HostSample.objects.order_by("-sample_time")[:count])
+    if not samples:
+        return []
+    samples.reverse()
+    latest = samples[-1]
+
+    sparklines = [
+        {
+            "title": _("CPU usage"),
+            "points": sparkline_points([sample.cpu_usage() for sample in samples], max_value=100),
+            "current": f"{latest.cpu_usage():.1f}%",
+        },
+        {
+            "title": _("Memory usage"),
+            "points": sparkline_points([sample.mem_used for sample in samples]),
+            "current": filesizeformat(latest.mem_used),
+        },
+        {
+            "title": _("load average (1 min)"),
+            "points": sparkline_points([sample.load_1 for sample in samples]),
+            "current": f"{latest.load_1:.2f}",
+        },
+    ]
+    for field_name, title in (
+        ("psi_cpu_some", _("CPU pressure")),
+        ("psi_memory_some", _("Memory pressure")),
+        ("psi_io_some", _("I/O pressure")),
+    ):
+        current = getattr(latest, field_name)
+        if current is None:  # Pressure Stall Information not available
+            continue
+        sparklines.append(
+            {
+                "title": title,
+                "points": sparkline_points(
+                    [getattr(sample, field_name) for sample in samples], max_value=100
+                ),
+                "current": f"{current:.2f}%",
+            }
+        )
+    return sparklines
+
+
 STATIC_INFORMATIONS = {
     "python_version": f"{sys.version}",
     "sys_prefix": sys.prefix,
@@ -52,7 +224,63 @@ STATIC_INFORMATIONS = {
 }
 
 
-class BaseModelAdmin(admin.ModelAdmin):
+SUMMARY_CACHE_KEY = "django_processinfo_admin_summary"
+
+
+def invalidate_summary_cache():
+    cache.delete(SUMMARY_CACHE_KEY)
+
+
+class ApiAdminMixin:
+    """
+    Add the read-only JSON stats API, see: api.py
+    """
+    api_time_field = "lastupdate_time"
+
+    def api_view(self, request):
+        if not self.has_view_permission(request):
+            raise PermissionDenied
+
+        # Don't record the polling itself, otherwise the data changes on every poll:
+        info = getattr(request, "_processinfo", None)
+        if info is not None:
+            info.skip_statistics = True
+
+        return api_response(request, self.model.objects.all(), time_field=self.api_time_field)
+
+    def get_urls(self):
+        urls = super().get_urls()
+        my_urls = [
+            path('api/', self.admin_site.admin_view(self.api_view)),
+        ]
+        return my_urls + urls
+
+
+class ExportAdminMixin:
+    """
+    Admin actions to stream the selected entries as CSV/NDJSON, see: export.py
+    """
+    actions = ["export_csv", "export_ndjson"]
+
+    def export(self, queryset, export_format):
+        content_type, extension = FORMATS[export_format]
+        response = StreamingHttpResponse(
+            iter_export(queryset, export_format), content_type=content_type
+        )
+        filename = f"{self.model._meta.model_name}_{timezone.now():%Y%m%d_%H%M%S}.{extension}"
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+    def export_csv(self, request, queryset):
+        return self.export(queryset, "csv")
+    export_csv.short_description = _("Export selected entries as CSV")
+
+    def export_ndjson(self, request, queryset):
+        return self.export(queryset, "ndjson")
+    export_ndjson.short_description = _("Export selected entries as NDJSON")
+
+
+class BaseModelAdmin(ExportAdminMixin, ApiAdminMixin, admin.ModelAdmin):
     def start_time2(self, obj):
         return human_duration(obj.start_time)
     start_time2.short_description = _("start since")
@@ -62,22 +290,63 @@ class BaseModelAdmin(admin.ModelAdmin):
     def changelist_view(self, request, extra_context=None):
         self.request = request  # work-a-round for https://code.djangoproject.com/ticket/13659
 
-        site_count = 0
-        first_start_time = None
+        summary_context, self.aggregate_data = self.get_summary(request)
 
+        extra_context = {
+            **summary_context,
+            "script_filename": request.META.get("SCRIPT_FILENAME", "???"),
+            "server_info": (
+                f"{request.META.get('SERVER_NAME', '???')}"
+                f":{request.META.get('SERVER_PORT', '???')}"
+            ),
+        }
+        return super().changelist_view(request, extra_context=extra_context)
+
+    def get_summary(self, request):
+        """
+        The summary is the same for all admin classes: Compute it only once per request
+        and cache it for settings.PROCESSINFO.SUMMARY_CACHE_TTL seconds.
+        """
+        summary = getattr(request, "_processinfo_summary", None)
+        if summary is None:
+            ttl = settings.PROCESSINFO.SUMMARY_CACHE_TTL
+            if ttl:
+                summary = cache.get(SUMMARY_CACHE_KEY)
+                if summary is not None:
+                    # The change list needs the aggregate data of every site:
+                    site_ids = set(SiteStatistics.objects.values_list("site_id", flat=True))
+                    if site_ids != {site.pk for site in summary[1]}:
+                        summary = None
+            if summary is None:
+                summary = self.compute_summary()
+                if ttl:
+                    cache.set(SUMMARY_CACHE_KEY, summary, ttl)
+            request._processinfo_summary = summary
+        return summary
+
+    def compute_summary(self):
+        """
+        returns the context for the summary in the change list and the aggregate data per site
+
+        The request, response time, processor time and process lifetime values are read
+        through the storage backend. The other details exist only in the models of the ORM backend.
+        """
         process_count_current = 0
         process_count_max = 0
         process_spawn = 0
+        process_recycled = 0
         process_count_avg = 0.0
 
-        life_time_values = []
-        request_count = 0
-        exception_count = 0
-
         memory_min_avg = 0.0
         memory_avg = 0.0
         memory_max_avg = 0.0
 
+        # PSS if available, otherwise VmRSS (The VmRSS of all processes counts shared pages multiple times)
+        total_memory_min_avg = 0.0
+        total_memory_avg = 0.0
+        total_memory_max_avg = 0.0
+        pss_site_count = 0
+
         vm_peak_min_avg = 0.0
         vm_peak_max_avg = 0.0
         vm_peak_avg = 0.0
@@ -87,22 +356,35 @@ class BaseModelAdmin(admin.ModelAdmin):
         threads_max = 0
         threads_avg = None
 
-        response_time_min_avg = None
-        response_time_max_avg = None
-        response_time_avg = None
-        response_time_sum = 0.0
+        queue_time_sum = 0.0
+        queue_time_count = 0
 
-        user_time_total = 0.0  # total user mode time
-        system_time_total = 0.0  # total system mode time
+        concurrency_max = 0
+        concurrency_avg = None
+        saturation = None
 
-        self.aggregate_data = {}
-        queryset = SiteStatistics.objects.all()
-        for site_stats in queryset:
-            site_count += 1
+        gc_time_total = 0.0  # total garbage collector pause time
+
+        startup_time_sum = 0.0  # process spawn -> application ready
+        startup_time_count = 0
+        startup_time_max = 0.0
+        first_response_time_sum = 0.0
+        first_response_count = 0
+        warmup_count = 0
+        warmup_response_time_sum = 0.0
+        steady_count = 0
+        steady_response_time_sum = 0.0
 
-            if first_start_time is None or site_stats.start_time < first_start_time:
-                first_start_time = site_stats.start_time
+        leak_suspects = 0  # living processes with a steadily growing memory
+        suggested_max_requests = None
+        gc_counts = [0, 0, 0]  # garbage collections per generation
 
+        now = timezone.now()
+        load_averages = {prefix: [0.0, 0.0, 0.0] for prefix in RATE_LOAD_AVERAGES}
+
+        aggregate_data = {}
+        queryset = SiteStatistics.objects.all()
+        for site_no, site_stats in enumerate(queryset):
             living_pids = site_stats.update_informations()
             site_stats.save()
 
@@ -120,14 +402,31 @@ class BaseModelAdmin(admin.ModelAdmin):
             process_count_current += living_process_count
             process_count_max += site_stats.process_count_max
             process_spawn += site_stats.process_spawn
+            process_recycled += site_stats.process_recycled
             process_count_avg += site_stats.process_count_avg
 
             site = site_stats.site
 
-            processes = ProcessInfo.objects.filter(site=site).only("start_time", "lastupdate_time")
+            site_load_averages = {prefix: [0.0, 0.0, 0.0] for prefix in RATE_LOAD_AVERAGES}
+            load_average_fields = [
+                f"{prefix}_{minutes}" for prefix in RATE_LOAD_AVERAGES for minutes in (1, 5, 15)
+            ]
+            processes = ProcessInfo.objects.filter(site=site).only(
+                "start_time", "lastupdate_time", "alive", *load_average_fields, *GROWTH_FIELDS
+            )
             for process in processes:
-                life_time = process.lastupdate_time - process.start_time
-                life_time_values.append(life_time)
+                if process.alive and process.is_leak_suspect():
+                    leak_suspects += 1
+                    max_requests = process.get_suggested_max_requests()
+                    if suggested_max_requests is None or max_requests < suggested_max_requests:
+                        suggested_max_requests = max_requests
+
+                # Sum the (decayed) rates of all processes:
+                for prefix, values in site_load_averages.items():
+                    averages = process.get_load_averages(prefix, now=now)
+                    for index, value in enumerate(averages):
+                        values[index] += value
+                        load_averages[prefix][index] += value
 
             data = ProcessInfo.objects.filter(site=site).aggregate(
                 # VmRSS
@@ -135,6 +434,7 @@ class BaseModelAdmin(admin.ModelAdmin):
                 Avg("memory_avg"),
                 Avg("memory_max"),
 
+
                 # VmPeak
                 Avg("vm_peak_min"),
                 Avg("vm_peak_avg"),
@@ -147,58 +447,125 @@ class BaseModelAdmin(admin.ModelAdmin):
                 Avg("threads_avg"),
                 Max("threads_max"),
 
-                Avg("response_time_min"),
                 Avg("response_time_avg"),
-                Avg("response_time_max"),
                 Sum("response_time_sum"),
 
-                Sum("user_time_total"),  # total user mode time
-                Sum("system_time_total"),  # total system mode time
+                Sum("queue_time_sum"),
+                Sum("queue_time_count"),
+
+                Min("concurrency_min"),
+                Avg("concurrency_avg"),
+                Max("concurrency_max"),
+                Avg("saturation"),
+
+                Sum("gc_count_0"),
+                Sum("gc_count_1"),
+                Sum("gc_count_2"),
+                Sum("gc_time_0"),
+                Sum("gc_time_1"),
+                Sum("gc_time_2"),
+
+                Sum("warmup_count"),
+                Sum("warmup_response_time_sum"),
+                Max("startup_time"),
+
+                # Cold start, not recorded for processes created before the update
+                startup_time_count=Count("pk", filter=Q(startup_time__isnull=False)),
+                startup_time__sum=Sum("startup_time"),
+                first_response_count=Count("pk", filter=Q(first_response_time__isnull=False)),
+                first_response_time__sum=Sum("first_response_time"),
+
+                # PSS, only from processes with smaps_rollup readings
+                pss_process_count=Count("pk", filter=Q(pss_count__gt=0)),
+                pss_min__avg=Avg("pss_min", filter=Q(pss_count__gt=0)),
+                pss_avg__avg=Avg("pss_avg", filter=Q(pss_count__gt=0)),
+                pss_max__avg=Avg("pss_max", filter=Q(pss_count__gt=0)),
             )
             data["living_process_count"] = living_process_count
-            self.aggregate_data[site] = data
+            data["load_averages"] = site_load_averages
+            aggregate_data[site] = data
 
-            request_count += data["request_count__sum"] or 1
-            exception_count += data["exception_count__sum"] or 0
+            # The average memory of one process * the average process count of this site:
+            site_process_count = site_stats.process_count_avg
 
             # VmRSS
-            memory_min_avg += (data["memory_min__avg"] or 0) * process_count_avg
-            memory_avg += (data["memory_avg__avg"] or 0) * process_count_avg
-            memory_max_avg += (data["memory_max__avg"] or 0) * process_count_avg
+            site_memory = [
+                (data[f"memory_{name}__avg"] or 0) * site_process_count for name in ("min", "avg", "max")
+            ]
+            memory_min_avg += site_memory[0]
+            memory_avg += site_memory[1]
+            memory_max_avg += site_memory[2]
+
+            # Use the PSS, if available
+            if data["pss_process_count"]:
+                pss_site_count += 1
+                site_memory = [
+                    (data[f"pss_{name}__avg"] or 0) * site_process_count for name in ("min", "avg", "max")
+                ]
+
+            total_memory_min_avg += site_memory[0]
+            total_memory_avg += site_memory[1]
+            total_memory_max_avg += site_memory[2]
 
             # VmPeak
-            vm_peak_min_avg += (data["vm_peak_min__avg"] or 0) * process_count_avg
-            vm_peak_avg += (data["vm_peak_avg__avg"] or 0) * process_count_avg
-            vm_peak_max_avg += (data["vm_peak_max__avg"] or 0) * process_count_avg
+            vm_peak_min_avg += (data["vm_peak_min__avg"] or 0) * site_process_count
+            vm_peak_avg += (data["vm_peak_avg__avg"] or 0) * site_process_count
+            vm_peak_max_avg += (data["vm_peak_max__avg"] or 0) * site_process_count
 
             threads_min = min([threads_min, data["threads_min__min"] or 9999])
             threads_max = max([threads_max, data["threads_max__max"] or 1])
-            threads_avg = average(
-                threads_avg, data["threads_avg__avg"] or 1, site_count
-            )
-
-            response_time_min_avg = average(
-                response_time_min_avg, data["response_time_min__avg"] or 0, site_count
-            )
-            response_time_avg = average(
-                response_time_avg, data["response_time_avg__avg"] or 0, site_count
-            )
-            response_time_max_avg = average(
-                response_time_max_avg, data["response_time_max__avg"] or 0, site_count
-            )
-            response_time_sum += data["response_time_sum__sum"] or 0
-
-            user_time_total += data["user_time_total__sum"] or 0  # total user mode time
-            system_time_total += data["system_time_total__sum"] or 0  # total system mode time
+            threads_avg = average(threads_avg, data["threads_avg__avg"] or 1, site_no)
+
+            queue_time_sum += data["queue_time_sum__sum"] or 0
+            queue_time_count += data["queue_time_count__sum"] or 0
+
+            concurrency_max = max([concurrency_max, data["concurrency_max__max"] or 1])
+            concurrency_avg = average(concurrency_avg, data["concurrency_avg__avg"] or 1, site_no)
+            saturation = average(saturation, data["saturation__avg"] or 0, site_no)
+
+            for generation in range(3):
+                gc_counts[generation] += data[f"gc_count_{generation}__sum"] or 0
+                gc_time_total += data[f"gc_time_{generation}__sum"] or 0
+
+            startup_time_count += data["startup_time_count"]
+            startup_time_sum += data["startup_time__sum"] or 0
+            startup_time_max = max(startup_time_max, data["startup_time__max"] or 0)
+            first_response_time_sum += data["first_response_time__sum"] or 0
+            first_response_count += data["first_response_count"]
+            site_warmup_count = data["warmup_count__sum"] or 0
+            site_warmup_response_time_sum = data["warmup_response_time_sum__sum"] or 0
+            warmup_count += site_warmup_count
+            warmup_response_time_sum += site_warmup_response_time_sum
+            steady_count += (data["request_count__sum"] or 0) - site_warmup_count
+            steady_response_time_sum += (data["response_time_sum__sum"] or 0) - site_warmup_response_time_sum
+
+        storage = get_storage()
+        site_statistics = storage.get_site_statistics()
+        site_count = len(site_statistics)
+        first_start_time = min((site["start_time"] for site in site_statistics), default=None)
+        request_count = sum(site["request_count"] for site in site_statistics)
+        exception_count = sum(site["exception_count"] for site in site_statistics)
+        response_time_sum = sum(site["response_time_sum"] for site in site_statistics)
+        user_time_total = sum(site["user_time_total"] for site in site_statistics)  # total user mode time
+        system_time_total = sum(site["system_time_total"] for site in site_statistics)  # total system mode time
+
+        # The average over the sites:
+        response_time_min_avg = response_time_avg = response_time_max_avg = None
+        for site_no, site in enumerate(site_statistics):
+            response_time_min_avg = average(response_time_min_avg, site["response_time_min"], site_no)
+            response_time_avg = average(response_time_avg, site["response_time_avg"], site_no)
+            response_time_max_avg = average(response_time_max_avg, site["response_time_max"], site_no)
 
         # Calculate the process life times
-        # timedelta.total_seconds() is new in Python 2.7
+        life_time_values = [
+            datetime2float(process["lastupdate_time"] - process["start_time"])
+            for process in storage.get_process_statistics()
+        ]
         if not life_time_values:  # First request with empty data
             life_time_min = 0
             life_time_max = 0
             life_time_avg = 0
         else:
-            life_time_values = [datetime2float(td) for td in life_time_values]
             life_time_min = min(life_time_values)
             life_time_max = max(life_time_values)
             life_time_avg = sum(life_time_values) / len(life_time_values)
@@ -219,6 +586,13 @@ class BaseModelAdmin(admin.ModelAdmin):
             # e.g. no SWAP used
             swap_perc = 0
 
+        if not pss_site_count:
+            total_memory_title = _("Non-paged memory (VmRSS)")
+        elif pss_site_count == len(aggregate_data):
+            total_memory_title = _("Proportional set size (PSS)")
+        else:
+            total_memory_title = _("Memory (PSS, VmRSS for sites without PSS)")
+
         try:
             loads = (user_time_total + system_time_total) / response_time_sum * 100
         except Exception as err:
@@ -231,6 +605,7 @@ class BaseModelAdmin(admin.ModelAdmin):
 
             "process_count_current": process_count_current,
             "process_spawn": process_spawn,
+            "process_recycled": process_recycled,
             "process_count_max": process_count_max,
             "process_count_avg": process_count_avg,
 
@@ -241,6 +616,12 @@ class BaseModelAdmin(admin.ModelAdmin):
             "memory_max_avg": memory_max_avg,
             "memory_avg": memory_avg,
 
+            "total_memory_title": total_memory_title,
+            "total_memory_uses_pss": bool(pss_site_count),
+            "total_memory_min_avg": total_memory_min_avg,
+            "total_memory_max_avg": total_memory_max_avg,
+            "total_memory_avg": total_memory_avg,
+
             "vm_peak_min_avg": vm_peak_min_avg,
             "vm_peak_max_avg": vm_peak_max_avg,
             "vm_peak_avg": vm_peak_avg,
@@ -255,6 +636,28 @@ class BaseModelAdmin(admin.ModelAdmin):
             "processor_time": human_timedelta(user_time_total + system_time_total),
             "loads": loads,
 
+            "gc_time_total": human_timedelta(gc_time_total),
+            "gc_time_share": gc_time_total / response_time_sum * 100 if response_time_sum else 0,
+            "gc_counts": " / ".join(str(count) for count in gc_counts),
+            "startup_time_avg": format_avg(startup_time_sum, startup_time_count),
+            "startup_time_max": human_timedelta(startup_time_max),
+            "first_response_time_avg": format_avg(first_response_time_sum, first_response_count),
+            "warmup_requests": settings.PROCESSINFO.WARMUP_REQUESTS,
+            "warmup_response_time_avg": format_avg(warmup_response_time_sum, warmup_count),
+            "steady_response_time_avg": format_avg(steady_response_time_sum, steady_count),
+
+            "leak_suspects": leak_suspects,
+            "suggested_max_requests": suggested_max_requests,
+
+            "request_rate": format_load_averages(load_averages["request_rate"]),
+            "error_rate": format_load_averages(load_averages["error_rate"]),
+            "cpu_load": format_load_averages(load_averages["cpu_load"], format_spec=".1%"),
+
+            "concurrency_avg": concurrency_avg,
+            "concurrency_max": concurrency_max,
+            "saturation": saturation,
+            "concurrency_limit": settings.PROCESSINFO.CONCURRENCY_LIMIT,
+
             "processinfo_version_string": __version__,
 
             "life_time_min": human_timedelta(life_time_min),
@@ -270,12 +673,6 @@ class BaseModelAdmin(admin.ModelAdmin):
             "swap_total": swap_total,
 
             "updatetime": human_duration(updatetime),
-
-            "script_filename": self.request.META.get("SCRIPT_FILENAME", "???"),
-            "server_info": (
-                f"{self.request.META.get('SERVER_NAME', '???')}"
-                f":{self.request.META.get('SERVER_PORT', '???')}"
-            )
         }
         extra_context.update(STATIC_INFORMATIONS)
 
@@ -292,15 +689,20 @@ class BaseModelAdmin(admin.ModelAdmin):
                 {
                     "response_time_avg": human_timedelta(response_time_avg),
                     "response_time_sum": human_timedelta(response_time_sum),
+                    "queue_vs_service_time": format_queue_vs_service_time(
+                        queue_time_avg(queue_time_sum, queue_time_count), response_time_avg
+                    ),
                 }
             )
 
+        extra_context["host_sparklines"] = get_host_sparklines()
+
         try:
             extra_context["loadavg"] = os.getloadavg()
         except OSError as err:
             extra_context["loadavg_err"] = f"[Error: {err}]"
 
-        return super().changelist_view(request, extra_context=extra_context)
+        return extra_context, aggregate_data
 
     def remove_dead_entries(self, request):
         """ remove all dead ProcessInfo entries """
@@ -309,6 +711,10 @@ class BaseModelAdmin(admin.ModelAdmin):
         living_pids, dead_pids = ProcessInfo.objects.get_alive_and_dead()
 
         ProcessInfo.objects.filter(pid__in=dead_pids).delete()
+        ProcessSample.objects.filter(pid__in=dead_pids).delete()
+        MiddlewareStatistics.objects.filter(pid__in=dead_pids).delete()
+        ConnectionStatistics.objects.filter(pid__in=dead_pids).delete()
+        invalidate_summary_cache()
 
         self.message_user(
             request,
@@ -323,9 +729,29 @@ class BaseModelAdmin(admin.ModelAdmin):
 
         count = ProcessInfo.objects.count()
         count += SiteStatistics.objects.count()
+        count += ViewStatistics.objects.count()
+        count += ProcessSample.objects.count()
+        count += HostSample.objects.count()
+        count += QueryFingerprint.objects.count()
+        count += TemplateStatistics.objects.count()
+        count += OutcomeStatistics.objects.count()
+        count += WarmupStatistics.objects.count()
+        count += MiddlewareStatistics.objects.count()
+        count += ConnectionStatistics.objects.count()
 
         ProcessInfo.objects.all().delete()
         SiteStatistics.objects.all().delete()
+        ViewStatistics.objects.all().delete()
+        ProcessSample.objects.all().delete()
+        HostSample.objects.all().delete()
+        QueryFingerprint.objects.all().delete()
+        TemplateStatistics.objects.all().delete()
+        OutcomeStatistics.objects.all().delete()
+        WarmupStatistics.objects.all().delete()
+        MiddlewareStatistics.objects.all().delete()
+        ConnectionStatistics.objects.all().delete()
+        get_storage().reset()  # e.g.: a non-ORM backend
+        invalidate_summary_cache()
 
         self.message_user(
             request,
@@ -334,11 +760,28 @@ class BaseModelAdmin(admin.ModelAdmin):
         )
         return HttpResponseRedirect("..")
 
+    def storage_view(self, request):
+        """ Display the recorded statistics, read through the storage backend """
+        if not self.has_view_permission(request):
+            raise PermissionDenied
+
+        storage = get_storage()
+        context = {
+            **self.admin_site.each_context(request),
+            "opts": self.model._meta,
+            "title": _("Recorded statistics"),
+            "storage_backend": f"{type(storage).__module__}.{type(storage).__qualname__}",
+            "process_statistics": storage.get_process_statistics(),
+            "view_statistics": storage.get_view_statistics(),
+        }
+        return TemplateResponse(request, "admin/django_processinfo/storage.html", context)
+
     def get_urls(self):
         urls = super().get_urls()
         my_urls = [
             path('remove_dead_entries/', self.admin_site.admin_view(self.remove_dead_entries)),
             path('reset/', self.admin_site.admin_view(self.reset)),
+            path('storage/', self.admin_site.admin_view(self.storage_view)),
         ]
         return my_urls + urls
 
@@ -346,13 +789,19 @@ class BaseModelAdmin(admin.ModelAdmin):
 class SiteStatisticsAdmin(BaseModelAdmin):
     def sum_memory_avg(self, obj):
         """
-        The memory average (VmRSS) for all processes for this site
+        The memory average for all processes for this site.
+        Use the PSS if available: The sum of VmRSS counts shared pages multiple times.
         """
         aggregate_data = self.aggregate_data[obj.site]
-        memory_avg = aggregate_data["memory_avg__avg"] or 0
+        if aggregate_data["pss_process_count"]:
+            memory_avg = aggregate_data["pss_avg__avg"] or 0
+            kind = "PSS"
+        else:
+            memory_avg = aggregate_data["memory_avg__avg"] or 0
+            kind = "VmRSS"
         memory_sum_avg = memory_avg * obj.process_count_avg
-        return filesizeformat(memory_sum_avg)
-    sum_memory_avg.short_description = _("Avg VmRSS")
+        return f"{filesizeformat(memory_sum_avg)} ({kind})"
+    sum_memory_avg.short_description = _("Avg memory")
 
     def sum_vm_peak(self, obj):
         aggregate_data = self.aggregate_data[obj.site]
@@ -367,6 +816,42 @@ class SiteStatisticsAdmin(BaseModelAdmin):
         return human_timedelta(response_time_avg)
     response_time_avg.short_description = _("Avg response time")
 
+    def queue_vs_service_time(self, obj):
+        aggregate_data = self.aggregate_data[obj.site]
+        return format_queue_vs_service_time(
+            queue_time_avg(
+                aggregate_data["queue_time_sum__sum"], aggregate_data["queue_time_count__sum"]
+            ),
+            aggregate_data["response_time_avg__avg"] or 0,
+        )
+    queue_vs_service_time.short_description = _("Queue time vs. service time")
+
+    def concurrency_info(self, obj):
+        aggregate_data = self.aggregate_data[obj.site]
+        return (
+            f'{aggregate_data["concurrency_min__min"] or 1}'
+            f' / '
+            f'{aggregate_data["concurrency_avg__avg"] or 1:.2f}'
+            f' / '
+            f'{aggregate_data["concurrency_max__max"] or 1}'
+        )
+    concurrency_info.short_description = _("Concurrent requests (min/avg/max)")
+
+    def saturation(self, obj):
+        aggregate_data = self.aggregate_data[obj.site]
+        return f'{aggregate_data["saturation__avg"] or 0:.1f}%'
+    saturation.short_description = _("Saturation")
+
+    def request_rate(self, obj):
+        load_averages = self.aggregate_data[obj.site]["load_averages"]
+        return format_load_averages(load_averages["request_rate"])
+    request_rate.short_description = _("Requests/s (1/5/15 min)")
+
+    def cpu_load(self, obj):
+        load_averages = self.aggregate_data[obj.site]["load_averages"]
+        return format_load_averages(load_averages["cpu_load"], format_spec=".1%")
+    cpu_load.short_description = _("CPU load (1/5/15 min)")
+
     def request_count(self, obj):
         aggregate_data = self.aggregate_data[obj.site]
         return aggregate_data["request_count__sum"] or 1
@@ -403,9 +888,10 @@ class SiteStatisticsAdmin(BaseModelAdmin):
     list_display = [
         "site",
         "sum_memory_avg", "sum_vm_peak",
-        "response_time_avg", "request_count", "exception_count",
-        "process_spawn", "process_count", "threads_info",
-        "start_time2",
+        "response_time_avg", "queue_vs_service_time", "request_count", "exception_count",
+        "request_rate", "cpu_load",
+        "process_spawn", "process_recycled", "process_count", "threads_info", "concurrency_info",
+        "saturation", "start_time2",
     ]
 #    if not settings.DEBUG:
 #        del(list_display[list_display.index("db_query_count_avg")])
@@ -414,7 +900,7 @@ class SiteStatisticsAdmin(BaseModelAdmin):
 admin.site.register(SiteStatistics, SiteStatisticsAdmin)
 
 
-class ProcessInfoAdmin(BaseModelAdmin):
+class ProcessInfoAdmin(CacheAdminMixin, GCAdminMixin, IOAdminMixin, BaseModelAdmin):
     def lastupdate_time2(self, obj):
         return human_duration(obj.lastupdate_time)
     lastupdate_time2.short_description = _("last update")
@@ -436,11 +922,81 @@ class ProcessInfoAdmin(BaseModelAdmin):
     response_time_sum2.short_description = _("Total response time")
     response_time_sum2.admin_order_field = "response_time_sum"
 
+    def request_rate(self, obj):
+        return format_load_averages(obj.get_load_averages("request_rate"))
+    request_rate.short_description = _("Requests/s (1/5/15 min)")
+
+    def error_rate(self, obj):
+        return format_load_averages(obj.get_load_averages("error_rate"))
+    error_rate.short_description = _("Exceptions/s (1/5/15 min)")
+
+    def cpu_load(self, obj):
+        return format_load_averages(obj.get_load_averages("cpu_load"), format_spec=".1%")
+    cpu_load.short_description = _("CPU load (1/5/15 min)")
+
+    def startup_time2(self, obj):
+        if obj.startup_time is None:
+            return "-"
+        return human_timedelta(obj.startup_time)
+    startup_time2.short_description = _("Startup time")
+    startup_time2.admin_order_field = "startup_time"
+
+    def first_response_time2(self, obj):
+        if obj.first_response_time is None:
+            return "-"
+        return human_timedelta(obj.first_response_time)
+    first_response_time2.short_description = _("First response time")
+    first_response_time2.admin_order_field = "first_response_time"
+
+    def response_time_load(self, obj):
+        return " / ".join(human_timedelta(value) for value in obj.get_load_averages("response_time"))
+    response_time_load.short_description = _("Response time (1/5/15 min)")
+
     def memory_avg2(self, obj):
         return filesizeformat(obj.memory_avg)
     memory_avg2.short_description = _("Avg VmRSS")
     memory_avg2.admin_order_field = "memory_avg"
 
+    def pss_avg2(self, obj):
+        if not obj.pss_count:
+            return "-"
+        return filesizeformat(obj.pss_avg)
+    pss_avg2.short_description = _("Avg PSS")
+    pss_avg2.admin_order_field = "pss_avg"
+
+    def uss2(self, obj):
+        if obj.uss is None:
+            return "-"
+        return filesizeformat(obj.uss)
+    uss2.short_description = _("USS")
+    uss2.admin_order_field = "uss"
+
+    def memory_growth(self, obj):
+        if not obj.growth_count:
+            return "-"
+        return (
+            f"{filesizeformat(obj.get_rss_per_request())}/request,"
+            f" {filesizeformat(obj.get_rss_per_hour())}/h"
+        )
+    memory_growth.short_description = _("VmRSS growth")
+
+    def leak_suspect(self, obj):
+        return obj.is_leak_suspect()
+    leak_suspect.boolean = True
+    leak_suspect.short_description = _("Leak suspect")
+
+    def suggested_max_requests(self, obj):
+        if not obj.is_leak_suspect():
+            return "-"
+        return obj.get_suggested_max_requests()
+    suggested_max_requests.short_description = _("Suggested max_requests")
+
+    def fds_info(self, obj):
+        if obj.fds is None:
+            return "-"
+        return f"{obj.fds} / {obj.fds_max} ({obj.get_fds_per_request():+.3f}/request)"
+    fds_info.short_description = _("Open files (current/max)")
+
     def vm_peak_avg2(self, obj):
         return filesizeformat(obj.vm_peak_avg)
     vm_peak_avg2.short_description = _("VmPeak")
@@ -465,6 +1021,15 @@ class ProcessInfoAdmin(BaseModelAdmin):
         )
     threads_info.short_description = _("Threads")
 
+    def concurrency_info(self, obj):
+        return f"{obj.concurrency_min} / {obj.concurrency_avg:.2f} / {obj.concurrency_max}"
+    concurrency_info.short_description = _("Concurrent requests (min/avg/max)")
+
+    def saturation2(self, obj):
+        return f"{obj.saturation:.1f}%"
+    saturation2.short_description = _("Saturation")
+    saturation2.admin_order_field = "saturation"
+
     def user_time_total2(self, obj):
         return human_timedelta(obj.user_time_total)
     user_time_total2.short_description = _("user time total")
@@ -476,16 +1041,331 @@ class ProcessInfoAdmin(BaseModelAdmin):
     system_time_total2.admin_order_field = "system_time_total"
 
     list_display = [
-        "pid", "alive2", "site", "request_count", "exception_count", "db_query_count_avg",
+        "pid", "alive2", "kind", "site", "request_count", "exception_count", "db_query_count_avg",
         "response_time_avg2", "response_time_sum2", "threads_info",
+        "concurrency_info", "saturation2", "startup_time2", "first_response_time2",
 
-        "user_time_total2", "system_time_total2",
+        "request_rate", "error_rate", "cpu_load", "response_time_load",
 
-        "memory_avg2", "vm_peak_avg2",
+        "user_time_total2", "system_time_total2", "io_syscalls", "io_storage",
+        "gc_time_share", "gc_collections", "cache_hit_ratio", "cache_time_share",
+
+        "memory_avg2", "pss_avg2", "uss2", "vm_peak_avg2",
+        "memory_growth", "leak_suspect", "suggested_max_requests", "fds_info", "recycle_reason",
         "start_time2", "lastupdate_time2", "life_time"
     ]
     if not settings.DEBUG:
         del list_display[list_display.index("db_query_count_avg")]
 
+    # Display the current load also in the process detail view:
+    readonly_fields = ("request_rate", "error_rate", "cpu_load", "response_time_load")
+
 
 admin.site.register(ProcessInfo, ProcessInfoAdmin)
+
+
+class ViewStatisticsAdmin(CacheAdminMixin, GCAdminMixin, IOAdminMixin, BaseModelAdmin):
+    def lastupdate_time2(self, obj):
+        return human_duration(obj.lastupdate_time)
+    lastupdate_time2.short_description = _("last update")
+    lastupdate_time2.admin_order_field = "lastupdate_time"
+    lastupdate_time2.allow_tags = True
+
+    def response_time_avg2(self, obj):
+        return human_timedelta(obj.response_time_avg)
+    response_time_avg2.short_description = _("Avg response time")
+    response_time_avg2.admin_order_field = "response_time_avg"
+
+    def response_time_max2(self, obj):
+        return human_timedelta(obj.response_time_max)
+    response_time_max2.short_description = _("Max response time")
+    response_time_max2.admin_order_field = "response_time_max"
+
+    def response_time_sum2(self, obj):
+        return human_timedelta(obj.response_time_sum)
+    response_time_sum2.short_description = _("Total response time")
+    response_time_sum2.admin_order_field = "response_time_sum"
+
+    def queue_vs_service_time(self, obj):
+        return format_queue_vs_service_time(
+            queue_time_avg(obj.queue_time_sum, obj.queue_time_count), obj.response_time_avg
+        )
+    queue_vs_service_time.short_description = _("Queue time vs. service time")
+
+    def template_time_share(self, obj):
+        if not obj.template_count:
+            return "-"
+        return (
+            f"{obj.get_template_time_share():.1f}%"
+            f" (avg: {human_timedelta(obj.template_time_sum / obj.template_count)})"
+        )
+    template_time_share.short_description = _("Template render time share")
+
+    list_display = [
+        "view_name", "kind", "site", "request_count", "exception_count",
+        "response_time_avg2", "response_time_max2", "response_time_sum2",
+        "template_time_share", "queue_vs_service_time", "io_syscalls", "io_storage", "gc_time_share", "gc_collections",
+        "cache_hit_ratio", "cache_time_share", "start_time2", "lastupdate_time2",
+    ]
+    list_filter = ["site", "kind"]
+    search_fields = ["view_name"]
+
+
+admin.site.register(ViewStatistics, ViewStatisticsAdmin)
+
+
+class ProcessSampleAdmin(ExportAdminMixin, ApiAdminMixin, admin.ModelAdmin):
+    api_time_field = "sample_time"
+    change_list_template = "admin/change_list.html"  # without the summary
+
+    def memory2(self, obj):
+        return filesizeformat(obj.memory)
+    memory2.short_description = _("VmRSS")
+    memory2.admin_order_field = "memory"
+
+    def vm_peak2(self, obj):
+        return filesizeformat(obj.vm_peak)
+    vm_peak2.short_description = _("VmPeak")
+    vm_peak2.admin_order_field = "vm_peak"
+
+    list_display = [
+        "pid", "sample_time", "memory2", "vm_peak2", "threads",
+        "user_time", "system_time", "read_bytes", "write_bytes",
+    ]
+    list_filter = ["pid"]
+    date_hierarchy = "sample_time"
+
+
+admin.site.register(ProcessSample, ProcessSampleAdmin)
+
+
+class HostSampleAdmin(ExportAdminMixin, ApiAdminMixin, admin.ModelAdmin):
+    api_time_field = "sample_time"
+    change_list_template = "admin/change_list.html"  # without the summary
+
+    def cpu_usage(self, obj):
+        return f"{obj.cpu_usage():.1f}%"
+    cpu_usage.short_description = _("CPU usage")
+
+    def mem_used2(self, obj):
+        return filesizeformat(obj.mem_used)
+    mem_used2.short_description = _("Memory usage")
+    mem_used2.admin_order_field = "mem_used"
+
+    def swap_used2(self, obj):
+        return filesizeformat(obj.swap_used)
+    swap_used2.short_description = _("Swap")
+    swap_used2.admin_order_field = "swap_used"
+
+    list_display = [
+        "sample_time", "cpu_usage", "mem_used2", "swap_used2",
+        "load_1", "load_5", "load_15",
+        "psi_cpu_some", "psi_memory_some", "psi_io_some",
+    ]
+    date_hierarchy = "sample_time"
+
+
+admin.site.register(HostSample, HostSampleAdmin)
+
+
+class QueryFingerprintAdmin(ExportAdminMixin, ApiAdminMixin, admin.ModelAdmin):
+    change_list_template = "admin/change_list.html"  # without the summary
+
+    def sql_short(self, obj):
+        if len(obj.sql) > 150:
+            return f"{obj.sql[:150]}..."
+        return obj.sql
+    sql_short.short_description = _("SQL")
+
+    def executions_per_request(self, obj):
+        if not obj.request_count:
+            return "-"
+        return f"{obj.execution_count / obj.request_count:.1f} / {obj.execution_max}"
+    executions_per_request.short_description = _("Executions per request (avg/max)")
+
+    def n_plus_one(self, obj):
+        return obj.n_plus_one_count > 0
+    n_plus_one.boolean = True
+    n_plus_one.short_description = _("Likely N+1")
+    n_plus_one.admin_order_field = "n_plus_one_count"
+
+    def time_sum2(self, obj):
+        return human_timedelta(obj.time_sum)
+    time_sum2.short_description = _("Total time")
+    time_sum2.admin_order_field = "time_sum"
+
+    def time_avg(self, obj):
+        if not obj.execution_count:
+            return "-"
+        return f"{obj.time_sum / obj.execution_count * 1000:.2f} ms / {obj.time_max * 1000:.2f} ms"
+    time_avg.short_description = _("Time per execution (avg/max)")
+
+    list_display = [
+        "view_name", "sql_short", "time_sum2", "time_avg",
+        "request_count", "execution_count", "executions_per_request", "n_plus_one",
+    ]
+    list_filter = ["site", "view_name"]
+    search_fields = ["view_name", "sql"]
+    ordering = ["-time_sum"]
+
+
+admin.site.register(QueryFingerprint, QueryFingerprintAdmin)
+
+
+class TemplateStatisticsAdmin(ExportAdminMixin, ApiAdminMixin, admin.ModelAdmin):
+    change_list_template = "admin/change_list.html"  # without the summary
+
+    def renders_per_request(self, obj):
+        if not obj.request_count:
+            return "-"
+        return f"{obj.render_count / obj.request_count:.1f}"
+    renders_per_request.short_description = _("Renders per request")
+
+    def time_sum2(self, obj):
+        return human_timedelta(obj.time_sum)
+    time_sum2.short_description = _("Total render time")
+    time_sum2.admin_order_field = "time_sum"
+
+    def time_avg(self, obj):
+        if not obj.request_count:
+            return "-"
+        return f"{obj.time_sum / obj.request_count * 1000:.2f} ms / {obj.time_max * 1000:.2f} ms"
+    time_avg.short_description = _("Render time per request (avg/max)")
+
+    list_display = [
+        "view_name", "template_name", "time_sum2", "time_avg",
+        "request_count", "render_count", "renders_per_request",
+    ]
+    list_filter = ["site", "view_name"]
+    search_fields = ["view_name", "template_name"]
+    ordering = ["-time_sum"]
+
+
+admin.site.register(TemplateStatistics, TemplateStatisticsAdmin)
+
+
+class MiddlewareStatisticsAdmin(ExportAdminMixin, ApiAdminMixin, admin.ModelAdmin):
+    change_list_template = "admin/change_list.html"  # without the summary
+
+    def exclusive_time_sum2(self, obj):
+        return human_timedelta(obj.exclusive_time_sum)
+    exclusive_time_sum2.short_description = _("Total exclusive time")
+    exclusive_time_sum2.admin_order_field = "exclusive_time_sum"
+
+    def exclusive_time(self, obj):
+        if not obj.request_count:
+            return "-"
+        return f"{obj.exclusive_time_sum / obj.request_count * 1000:.2f} ms / {obj.exclusive_time_max * 1000:.2f} ms"
+    exclusive_time.short_description = _("Exclusive time per request (avg/max)")
+
+    def inclusive_time(self, obj):
+        if not obj.request_count:
+            return "-"
+        return f"{obj.inclusive_time_sum / obj.request_count * 1000:.2f} ms / {obj.inclusive_time_max * 1000:.2f} ms"
+    inclusive_time.short_description = _("Inclusive time per request (avg/max)")
+
+    list_display = [
+        "middleware", "pid", "exclusive_time_sum2", "exclusive_time", "inclusive_time",
+        "request_count", "lastupdate_time",
+    ]
+    list_filter = ["site", "pid", "middleware"]
+    search_fields = ["middleware"]
+    ordering = ["-exclusive_time_sum"]
+
+
+admin.site.register(MiddlewareStatistics, MiddlewareStatisticsAdmin)
+
+
+class ConnectionStatisticsAdmin(ExportAdminMixin, ApiAdminMixin, admin.ModelAdmin):
+    change_list_template = "admin/change_list.html"  # without the summary
+
+    def connect_time(self, obj):
+        if not obj.connect_count:
+            return "-"
+        return f"{obj.get_connect_time_avg() * 1000:.2f} ms / {obj.connect_time_max * 1000:.2f} ms"
+    connect_time.short_description = _("Connect time (avg/max)")
+
+    def requests_per_connection(self, obj):
+        requests_per_connection = obj.get_requests_per_connection()
+        if requests_per_connection is None:
+            return "-"
+        return f"{requests_per_connection:.1f}"
+    requests_per_connection.short_description = _("Requests per connection")
+
+    def conn_max_age(self, obj):
+        try:
+            conn_max_age = settings.DATABASES[obj.alias].get("CONN_MAX_AGE", 0)
+        except KeyError:
+            return "-"
+        if conn_max_age is None:
+            return _("unlimited")
+        return f"{conn_max_age} sec."
+    conn_max_age.short_description = _("CONN_MAX_AGE")
+
+    def close_check_time(self, obj):
+        if not obj.close_check_count:
+            return "-"
+        return f"{obj.close_check_time_sum / obj.close_check_count * 1000:.3f} ms"
+    close_check_time.short_description = _("close_old_connections() time (avg)")
+
+    list_display = [
+        "alias", "vendor", "pid", "connect_count", "connect_time", "request_count", "requests_per_connection",
+        "conn_max_age", "close_count", "close_check_time", "lastupdate_time",
+    ]
+    list_filter = ["site", "alias", "vendor"]
+    search_fields = ["alias", "vendor"]
+    ordering = ["-connect_time_sum"]
+
+
+admin.site.register(ConnectionStatistics, ConnectionStatisticsAdmin)
+
+
+class OutcomeStatisticsAdmin(ExportAdminMixin, ApiAdminMixin, admin.ModelAdmin):
+    change_list_template = "admin/change_list.html"  # without the summary
+
+    def response_time_avg2(self, obj):
+        return human_timedelta(obj.response_time_avg)
+    response_time_avg2.short_description = _("Avg response time")
+    response_time_avg2.admin_order_field = "response_time_avg"
+
+    def response_time_max2(self, obj):
+        return human_timedelta(obj.response_time_max)
+    response_time_max2.short_description = _("Max response time")
+    response_time_max2.admin_order_field = "response_time_max"
+
+    def response_time_sum2(self, obj):
+        return human_timedelta(obj.response_time_sum)
+    response_time_sum2.short_description = _("Total response time")
+    response_time_sum2.admin_order_field = "response_time_sum"
+
+    list_display = [
+        "view_name", "outcome_type", "outcome", "request_count",
+        "response_time_avg2", "response_time_max2", "response_time_sum2", "lastupdate_time",
+    ]
+    list_filter = ["site", "outcome_type", "outcome"]
+    search_fields = ["view_name", "outcome"]
+
+
+admin.site.register(OutcomeStatistics, OutcomeStatisticsAdmin)
+
+
+class WarmupStatisticsAdmin(ExportAdminMixin, ApiAdminMixin, admin.ModelAdmin):
+    change_list_template = "admin/change_list.html"  # without the summary
+
+    def response_time_avg2(self, obj):
+        return human_timedelta(obj.response_time_avg)
+    response_time_avg2.short_description = _("Avg response time")
+    response_time_avg2.admin_order_field = "response_time_avg"
+
+    def response_time_max2(self, obj):
+        return human_timedelta(obj.response_time_max)
+    response_time_max2.short_description = _("Max response time")
+    response_time_max2.admin_order_field = "response_time_max"
+
+    list_display = [
+        "request_no", "site", "process_count", "response_time_avg2", "response_time_max2", "lastupdate_time",
+    ]
+    list_filter = ["site"]
+
+
+admin.site.register(WarmupStatistics, WarmupStatisticsAdmin)
@@ -0,0 +1,157 @@
+"""
+    JSON stats API
+    ~~~~~~~~~~~~~~
+
+    Read-only access to the collected data, e.g. for auto refreshing dashboards.
+    Available in the admin for every model, e.g.:
+
+        /admin/django_processinfo/processinfo/api/
+        /admin/django_processinfo/viewstatistics/api/?since=2022-08-16T12:00:00%2B00:00
+        /admin/django_processinfo/processsample/api/?since=1660651200
+
+    The response is in a compact columnar format:
+
+        {
+            "columns": ["id", "pid", ...],
+            "rows": [[1, 1234, ...], ...],
+            "last_update": "2022-08-16T12:34:56.789012+00:00",
+        }
+
+    Use "last_update" as "?since=" in the next poll, to get only the changed rows.
+    The ETag header can be used to avoid the transfer of unchanged data.
+
+    :copyleft: 2011-2022 by the django-processinfo team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import datetime
+import hashlib
+
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Count, Max
+from django.http import HttpResponseNotModified, JsonResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.utils.http import parse_etags, quote_etag
+
+
+def parse_since(value):
+    """
+    Parse the "since" timestamp: ISO 8601 or seconds since epoch.
+
+    >>> parse_since("1660651200").isoformat()
+    '2022-08-16T12:00:00+00:00'
+    >>> parse_since("2022-08-16T12:00:00+00:00") == parse_since("1660651200")
+    True
+    >>> parse_since("2022-08-16T12:00:00").isoformat()
+    '2022-08-16T12:00:00+00:00'
+    >>> parse_since("foo")
+    Traceback (most recent call last):
+        ...
+    django.core.exceptions.ValidationError: ["Invalid 'since' timestamp: 'foo'"]
+    """
+    try:
+        return datetime.datetime.fromtimestamp(float(value), tz=datetime.timezone.utc)
+    except (ValueError, OverflowError):
+        pass
+
+    try:
+        since = parse_datetime(value)
+    except ValueError:
+        since = None
+    if since is None:
+        raise ValidationError(f"Invalid 'since' timestamp: {value!r}")
+
+    if timezone.is_naive(since):
+        since = timezone.make_aware(since, datetime.timezone.utc)
+    return since
+
+
+def get_field_names(model):
+    return [field.attname for field in model._meta.concrete_fields]
+
+
+def get_etag(*values):
+    """
+    >>> get_etag(1, None)
+    '"0fe32dd2c1b2c89c"'
+    """
+    data = "|".join(str(value) for value in values)
+    return quote_etag(hashlib.md5(data.encode("utf-8")).hexdigest()[:16])
+
+
+def etag_matches(etag, if_none_match):
+    """
+    Compare whole tags of the "If-None-Match" header with the
+    weak comparison (RFC 7232, section 3.2), like Django's conditional GET handling.
+
+    >>> etag_matches('"abc"', '"xyz", W/"abc"')
+    True
+    >>> etag_matches('"abc"', '*')
+    True
+    >>> etag_matches('"abc"', '"ab"')
+    False
+    >>> etag_matches('"abc"', '"abcd"')
+    False
+    >>> etag_matches('"abc"', '')
+    False
+    """
+    etags = parse_etags(if_none_match)
+    if etags == ["*"]:
+        return True
+
+    def strip_weak(tag):
+        return tag[2:] if tag.startswith("W/") else tag
+
+    return strip_weak(etag) in (strip_weak(tag) for tag in etags)
+
+
+def api_response(request, queryset, time_field):
+    """
+    Build the columnar JSON response for the given queryset.
+    Only the rows with a "time_field" newer than "?since=" are included.
+    Filter by site with e.g.: "?site=1"
+    """
+    site_id = request.GET.get("site")
+    if site_id:
+        if "site_id" not in get_field_names(queryset.model):
+            return JsonResponse({"error": "No site information available"}, status=400)
+        try:
+            queryset = queryset.filter(site_id=int(site_id))
+        except ValueError:
+            return JsonResponse({"error": f"Invalid 'site': {site_id!r}"}, status=400)
+
+    since = request.GET.get("since")
+    if since:
+        try:
+            since = parse_since(since)
+        except ValidationError as err:
+            return JsonResponse({"error": err.messages[0]}, status=400)
+        queryset = queryset.filter(**{f"{time_field}__gt": since})
+
+    # One cheap query to check if something changed:
+    state = queryset.aggregate(count=Count("pk"), last_update=Max(time_field))
+    etag = get_etag(request.get_full_path(), state["count"], state["last_update"])
+    if etag_matches(etag, request.META.get("HTTP_IF_NONE_MATCH", "")):
+        response = HttpResponseNotModified()
+        response["ETag"] = etag
+        return response
+
+    last_update = state["last_update"] or since or None
+    if last_update is not None:
+        # Note: DjangoJSONEncoder cuts the microseconds, but "since" needs them
+        last_update = last_update.isoformat()
+
+    columns = get_field_names(queryset.model)
+    rows = [list(row) for row in queryset.order_by("pk").values_list(*columns)]
+    response = JsonResponse(
+        {
+            "columns": columns,
+            "rows": rows,
+            "last_update": last_update,
+        },
+        encoder=DjangoJSONEncoder,
+    )
+    response["ETag"] = etag
+    return response
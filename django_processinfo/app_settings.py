@@ -17,7 +17,9 @@
     :license: GNU GPL v3 or above, see LICENSE for more details.
 """
 
+import os
 import sys
+import tempfile
 
 
 # Used by a few dynamic settings:
@@ -26,6 +28,158 @@ RUN_WITH_DEV_SERVER = "runserver" in sys.argv
 # Delete oldest ProcessInfo entries if max count exists:
 MAX_PROCESSINFO_COUNT = 100
 
+# Sample the /proc information of every process in a background thread
+# every PROC_SAMPLER_INTERVAL seconds (None == deactivated)
+# If active, the middleware doesn't read /proc/self/status and /proc/self/fd in every request.
+PROC_SAMPLER_INTERVAL = None
+# Store the samples in the database, if this number of samples are collected:
+PROC_SAMPLER_FLUSH_COUNT = 12
+# Max. number of samples in memory (e.g. if the database is not available)
+PROC_SAMPLER_BUFFER_SIZE = 720
+# Delete oldest ProcessSample entries if max count exists:
+MAX_PROCESS_SAMPLE_COUNT = 100000
+
+# Collect a time series of the host system load (CPU, memory, load average, pressure)
+# every HOST_SAMPLER_INTERVAL seconds (None == deactivated) in one elected process.
+# Alternative: Use the management command "processinfo_collect_host"
+HOST_SAMPLER_INTERVAL = None
+HOST_SAMPLER_FLUSH_COUNT = 6
+# Max. number of host samples in memory (e.g. if the database is not available)
+HOST_SAMPLER_BUFFER_SIZE = 720
+# Only the process that holds the lock on this file collects the host samples:
+HOST_SAMPLER_LOCK_FILE = os.path.join(tempfile.gettempdir(), "django-processinfo-host-sampler.lock")
+# Delete oldest HostSample entries if max count exists:
+MAX_HOST_SAMPLE_COUNT = 50000
+
+# Read the shared memory aware PSS/USS of a process from /proc/$$/smaps_rollup at most every
+# SMAPS_INTERVAL seconds (None == deactivated). It's expensive, so it's not done in every request.
+# The PSS is a better memory value for forked workers (e.g.: gunicorn --preload) than VmRSS,
+# because copy-on-write pages shared between the workers are not counted multiple times.
+SMAPS_INTERVAL = 60
+
+# Memory leak detection: The VmRSS, open file descriptors and threads of every worker
+# are fitted (least squares) against the number of requests and the uptime.
+# Ignore the first requests of a worker (e.g.: filling caches, lazy imports):
+GROWTH_WARMUP_REQUESTS = 100
+# Mark a worker as leaking, if it has handled at least LEAK_MIN_REQUESTS requests
+# (after the warmup), grows at least LEAK_THRESHOLD bytes per request and
+# the memory grows steadily (coefficient of determination >= LEAK_MIN_R_SQUARED):
+LEAK_MIN_REQUESTS = 200
+LEAK_THRESHOLD = 1024
+LEAK_MIN_R_SQUARED = 0.5
+# Used to suggest a gunicorn "max_requests" value: The maximum memory growth of a worker:
+LEAK_MEMORY_BUDGET = 100 * 1024 * 1024
+
+# Record the processing time of the first WARMUP_REQUESTS requests of every process
+# separated (e.g.: lazy imports, empty caches) to see the costs of a worker respawn.
+# (0 == deactivated)
+WARMUP_REQUESTS = 10
+
+# Graceful worker recycling, see: recycle.py
+# Recycle a worker if the VmRSS is above this limit (in bytes, None == deactivated):
+RECYCLE_RSS_LIMIT = None
+# Recycle a worker after this number of requests (None == deactivated):
+RECYCLE_MAX_REQUESTS = None
+# Recycle a worker if the memory grows more than this bytes per request (None == deactivated)
+# (Checked after LEAK_MIN_REQUESTS requests, see memory leak detection above)
+RECYCLE_RSS_SLOPE_LIMIT = None
+# Callable (or dotted path) that will be called with pid and reason after the response is sent:
+RECYCLE_ACTION = "django_processinfo.recycle.terminate"
+
+# Record the I/O of every request (differences of /proc/thread-self/io: bytes and syscalls
+# for read/write and the bytes read/written from/to the storage layer)
+# Set to False to deactivate it, then /proc/thread-self/io will not be read.
+IO_ACCOUNTING = True
+
+# Measure the garbage collector pauses (via gc.callbacks) while the requests are processed.
+GC_ACCOUNTING = True
+
+# Count the calls, hits/misses and the time of the Django cache backends (settings.CACHES)
+# per request. The methods of the configured cache backend classes are wrapped.
+CACHE_INSTRUMENTATION = False
+
+# Collect the SQL queries (normalized to fingerprints, without literals) per view,
+# with the number of executions and the time. Costs a little time per query.
+SQL_FINGERPRINTS = False
+# Store only the costliest queries per request:
+MAX_FINGERPRINTS_PER_REQUEST = 10
+# Flag a query as likely N+1 problem, if it's executed more than this times in one request:
+N_PLUS_ONE_THRESHOLD = 10
+# Delete oldest QueryFingerprint entries if max count exists:
+MAX_QUERY_FINGERPRINT_COUNT = 1000
+
+# Measure the render time of the Django templates per view, to see e.g. what should
+# be fragment cached. Template.render() will be wrapped.
+TEMPLATE_TIMING = False
+# Store only the costliest templates per request:
+MAX_TEMPLATES_PER_REQUEST = 10
+# Delete oldest TemplateStatistics entries if max count exists:
+MAX_TEMPLATE_STATISTICS_COUNT = 1000
+
+# Measure the inclusive time (with the inner middlewares and the view) and the exclusive
+# time of every middleware class in settings.MIDDLEWARE, per process.
+# e.g. to see the costs of sessions, auth, CSRF etc. The __call__() methods will be wrapped.
+MIDDLEWARE_TIMING = False
+# Delete oldest MiddlewareStatistics entries if max count exists:
+MAX_MIDDLEWARE_STATISTICS_COUNT = 1000
+
+# Record the database connection lifecycle per process and database alias: new connections,
+# the connect latency, requests per connection and the time in close_old_connections()
+# e.g. to check if persistent connections (CONN_MAX_AGE) or a connection pooler would help.
+DB_CONNECTION_STATS = False
+
+# Append one fixed-width binary record per request/task (time, pid, view, status code,
+# response/queue time, processor times and VmRSS) to rotating files in this directory
+# (None == deactivated), to analyze every single request offline, e.g. after an incident:
+#   ./manage.py processinfo_analyze --group-by view --percentiles 50,90,99
+# Every process writes its own files, see: django_processinfo/event_log.py
+EVENT_LOG_DIR = None
+# Start a new file, if the current file of a process is bigger than this (in bytes):
+EVENT_LOG_MAX_SIZE = 64 * 1024 * 1024
+# Delete the oldest files, if there are more files in EVENT_LOG_DIR (of all processes):
+EVENT_LOG_MAX_FILES = 50
+
+# Cache the summary of the admin change lists for SUMMARY_CACHE_TTL seconds in
+# the "default" cache (None == deactivated), so that e.g. many open admin pages
+# don't add load to the server. "Reset all data" and "Remove dead PIDs" invalidate it.
+SUMMARY_CACHE_TTL = 10
+
+# Where the statistics are written to and read from, see: django_processinfo/storage/
+# The other backends store only the process/view times and memory (no I/O, GC, SQL etc.):
+# The summary of the admin change lists reads the request and time values through the backend,
+# but the change lists, the other details and the worker recycling exist only with the ORM backend.
+#   "django_processinfo.storage.orm.OrmStorage"            - the models (default)
+#   "django_processinfo.storage.memory.MemoryStorage"      - memory of the current process
+#   "django_processinfo.storage.file.AppendOnlyFileStorage" - a local file, e.g.: {"path": "..."}
+#   "django_processinfo.storage.kv.KeyValueStorage"        - Redis like key-value store
+STORAGE_BACKEND = "django_processinfo.storage.orm.OrmStorage"
+# Keyword arguments for the backend:
+STORAGE_OPTIONS = {}
+
+# Database alias for all django-processinfo tables (None == "default" database)
+# e.g. use a own SQLite database file, so the statistic writes don't compete
+# with the application queries. It's needed to add the router, too:
+#   DATABASE_ROUTERS = ['django_processinfo.routers.ProcessInfoRouter']
+# Don't forget to create the tables, e.g.: ./manage.py migrate --database=processinfo
+# Recommended for SQLite with multiple worker processes: The statistic writes take the
+# write lock at once, so the workers wait for each other (no "database is locked" errors).
+DATABASE = None
+
+# Activate SQLite "Write-Ahead Logging" for the DATABASE connection?
+# (Only used if DATABASE is set and it's a SQLite database)
+SQLITE_WAL = True
+
+# Request headers (as request.META keys) with the timestamp when the proxy received
+# the request, to record the time a request waits in the queue before Django handles it.
+# e.g. for nginx: proxy_set_header X-Request-Start "t=${msec}";
+# Set QUEUE_TIME_HEADERS = () to deactivate it.
+QUEUE_TIME_HEADERS = ("HTTP_X_REQUEST_START", "HTTP_X_QUEUE_START")
+
+# Number of requests a process can handle at the same time,
+# e.g. the number of gunicorn --threads (1 == sync worker)
+# Used to calculate how often a process was saturated. None == unlimited (e.g. ASGI)
+CONCURRENCY_LIMIT = 1
+
 # Should the django-processinfo "time cost" info inserted in a html page?
 ADD_INFO = True
 
@@ -1,10 +1,14 @@
 from django.apps import AppConfig
 from django.conf import settings
-from django.core.checks import Error, register
+from django.core.checks import Error, Warning, register
+from django.db.backends.signals import connection_created
+from django.utils.module_loading import import_string
 
 
 MIDDLEWARE = "django_processinfo.middlewares.ProcessInfoMiddleware"
 
+RECYCLE_SETTINGS = ("RECYCLE_RSS_LIMIT", "RECYCLE_MAX_REQUESTS", "RECYCLE_RSS_SLOPE_LIMIT")
+
 
 class DjangoProcessinfoConfig(AppConfig):
     """
@@ -12,6 +16,25 @@ class DjangoProcessinfoConfig(AppConfig):
     """
     name = 'django_processinfo'
     verbose_name = "Django Processinfo"
+    default_auto_field = 'django.db.models.AutoField'
+
+    def ready(self):
+        from django_processinfo.routers import activate_sqlite_wal
+
+        connection_created.connect(activate_sqlite_wal, dispatch_uid='django_processinfo_sqlite_wal')
+
+        processinfo_settings = getattr(settings, "PROCESSINFO", None)
+        if processinfo_settings is not None and processinfo_settings.MIDDLEWARE_TIMING:
+            # Before the WSGI handler is created: It binds BaseHandler._get_response() once
+            from django_processinfo.utils import middleware_timing
+
+            middleware_timing.install()
+
+        if processinfo_settings is not None and processinfo_settings.DB_CONNECTION_STATS:
+            # Before the first connection is created
+            from django_processinfo.utils import db_connections
+
+            db_connections.install()
 
 
 @register()
@@ -37,5 +60,87 @@ def setup_check(app_configs, **kwargs):
                 id='django_processinfo.apps.setup_check',
             )
         )
+    else:
+        errors += database_check()
+        errors += storage_check()
+
+    return errors
+
+
+def database_check():
+    from django_processinfo.routers import ROUTER
+
+    errors = []
+
+    alias = settings.PROCESSINFO.DATABASE
+    if not alias:
+        return errors
+
+    if alias not in settings.DATABASES:
+        errors.append(
+            Error(
+                f"Database {alias!r} from settings.PROCESSINFO.DATABASE doesn't exist!",
+                hint=f"Add {alias!r} to settings.DATABASES",
+                obj=settings,
+                id='django_processinfo.apps.database_check',
+            )
+        )
+    elif settings.DATABASES[alias].get('ATOMIC_REQUESTS'):
+        errors.append(
+            Warning(
+                f"ATOMIC_REQUESTS is activated for the django-processinfo database {alias!r}",
+                hint="Deactivate ATOMIC_REQUESTS, so the statistic writes run in own short transactions.",
+                obj=settings,
+                id='django_processinfo.apps.database_check',
+            )
+        )
+
+    if ROUTER not in getattr(settings, 'DATABASE_ROUTERS', ()):
+        errors.append(
+            Error(
+                "Missing django-processinfo database router!",
+                hint=f"Add {ROUTER!r} to settings.DATABASE_ROUTERS",
+                obj=settings,
+                id='django_processinfo.apps.database_check',
+            )
+        )
+
+    return errors
+
+
+def storage_check():
+    """
+    Only the ORM storage backend supports the worker recycling.
+    """
+    from django_processinfo.storage.orm import OrmStorage
+
+    errors = []
+
+    backend = settings.PROCESSINFO.STORAGE_BACKEND
+    try:
+        storage_class = import_string(backend) if isinstance(backend, str) else backend
+    except ImportError as err:
+        errors.append(
+            Error(
+                f"Can't import settings.PROCESSINFO.STORAGE_BACKEND: {err}",
+                obj=settings,
+                id='django_processinfo.apps.storage_check',
+            )
+        )
+        return errors
+
+    if issubclass(storage_class, OrmStorage):
+        return errors
+
+    recycle_settings = [name for name in RECYCLE_SETTINGS if getattr(settings.PROCESSINFO, name) is not None]
+    if recycle_settings:
+        errors.append(
+            Error(
+                f"Worker recycling is not supported by {storage_class.__name__}",
+                hint=f"Use the ORM storage backend or deactivate: {', '.join(recycle_settings)}",
+                obj=settings,
+                id='django_processinfo.apps.storage_check',
+            )
+        )
 
     return errors
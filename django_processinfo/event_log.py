@@ -0,0 +1,444 @@
+"""
+    django-processinfo - event log
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Append one fixed-width binary record per request/task to rotating local
+    files, see: settings.PROCESSINFO.EVENT_LOG_DIR
+    The models store only aggregates; the event log keeps every single request,
+    so it can be re-sliced offline, e.g.: ./manage.py processinfo_analyze
+
+    Every process writes its own files (no lock between the workers needed):
+
+        <EVENT_LOG_DIR>/events-<YYYYmmdd-HHMMSS (UTC)>-<pid>-<number>.bin
+        <EVENT_LOG_DIR>/views.txt    - view id -> view name (CRC32 of the name)
+
+    A file starts with a header (magic, version and record size) followed by the
+    records. An incomplete record at the end (e.g.: killed while writing) is ignored.
+
+    :copyleft: 2011-2022 by the django-processinfo team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import array
+import collections
+import datetime
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from pathlib import Path
+
+from django.conf import settings
+
+from django_processinfo.models import KIND_CHOICES
+
+
+try:
+    import numpy
+except ImportError:  # numpy is optional
+    numpy = None
+
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"PIEVENTS"
+VERSION = 1
+HEADER = struct.Struct("<8sHH4x")
+
+# name, struct format, array typecode (without numpy)
+COLUMNS = (
+    ("time", "d", "d"),  # seconds since epoch, when the request was finished
+    ("pid", "I", "L"),
+    ("view_id", "I", "L"),  # see: views.txt
+    ("status", "H", "H"),  # HTTP status code (0 == no request, e.g.: a task)
+    ("kind", "B", "B"),  # index in KINDS
+    ("flags", "B", "B"),  # FLAG_EXCEPTION
+    ("response_time", "f", "d"),
+    ("queue_time", "f", "d"),  # -1 == unknown
+    ("user_time", "f", "d"),
+    ("system_time", "f", "d"),
+    ("rss", "Q", "Q"),  # VmRSS in bytes
+)
+COLUMN_NAMES = tuple(name for name, fmt, typecode in COLUMNS)
+RECORD = struct.Struct("<" + "".join(fmt for name, fmt, typecode in COLUMNS))
+
+FLAG_EXCEPTION = 1
+
+KINDS = tuple(kind for kind, title in KIND_CHOICES)
+
+FILE_PATTERN = "events-*.bin"
+VIEW_NAMES_FILE = "views.txt"
+
+
+def get_view_id(view_name):
+    """
+    >>> get_view_id(None), get_view_id("admin:index")
+    (0, 2019557906)
+    """
+    if not view_name:
+        return 0
+    return zlib.crc32(view_name.encode("utf-8"))
+
+
+def pack_record(info, exception, now):
+    """
+    returns the binary record of a RequestInfo, see: middlewares.StatisticsRecorder
+    """
+    return RECORD.pack(
+        now,
+        info.pid,
+        get_view_id(info.view_name),
+        info.status_code or 0,
+        KINDS.index(info.kind),
+        FLAG_EXCEPTION if exception else 0,
+        info.response_time,
+        -1 if info.queue_time is None else info.queue_time,
+        info.user_time,
+        info.system_time,
+        info.memory,
+    )
+
+
+class EventLog:
+    """
+    Writes the records of the current process into rotating files.
+    """
+
+    def __init__(self, directory, max_size, max_files):
+        self.directory = Path(directory)
+        self.max_size = max_size
+        self.max_files = max_files
+
+        self.lock = threading.Lock()
+        self.pid = None
+        self.fd = None
+        self.size = 0
+        self.file_number = 0
+        self.view_names = set()
+
+    def write(self, info, exception, now=None):
+        if now is None:
+            now = time.time()
+        data = pack_record(info, exception, now=now)
+        with self.lock:
+            try:
+                self.add_view_name(info.view_name)
+                if self.pid != os.getpid() or self.size + len(data) > self.max_size:
+                    self.rotate()
+                os.write(self.fd, data)
+                self.size += len(data)
+            except OSError:
+                logger.exception("Can't write to the event log in %s", self.directory)
+
+    def add_view_name(self, view_name):
+        if self.pid != os.getpid():
+            self.view_names = set()  # forked: The file is shared, but not our set
+        if not view_name or view_name in self.view_names:
+            return
+        line = f"{get_view_id(view_name):08x}\t{view_name}\n"
+        fd = os.open(self.directory / VIEW_NAMES_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line.encode("utf-8"))
+        finally:
+            os.close(fd)
+        self.view_names.add(view_name)
+
+    def rotate(self):
+        if self.fd is not None:
+            os.close(self.fd)  # After a fork: It's only our copy of the file descriptor
+            self.fd = None
+
+        pid = os.getpid()
+        if self.pid != pid:
+            self.pid = pid
+            self.file_number = 0
+        self.file_number += 1
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        file_name = f"events-{time.strftime('%Y%m%d-%H%M%S', time.gmtime())}-{pid}-{self.file_number}.bin"
+        self.fd = os.open(self.directory / file_name, os.O_WRONLY | os.O_APPEND | os.O_CREAT | os.O_EXCL, 0o644)
+        header = HEADER.pack(MAGIC, VERSION, RECORD.size)
+        os.write(self.fd, header)
+        self.size = len(header)
+
+        self.remove_old_files()
+
+    def remove_old_files(self):
+        paths = get_event_files(self.directory)
+        for path in paths[:-self.max_files]:
+            try:
+                path.unlink()
+            except FileNotFoundError:  # removed by a other process
+                pass
+
+
+_event_logs = {}
+
+
+def get_event_log():
+    """
+    returns the EventLog of the current settings
+    """
+    key = (
+        settings.PROCESSINFO.EVENT_LOG_DIR,
+        settings.PROCESSINFO.EVENT_LOG_MAX_SIZE,
+        settings.PROCESSINFO.EVENT_LOG_MAX_FILES,
+    )
+    try:
+        return _event_logs[key]
+    except KeyError:
+        event_log = _event_logs[key] = EventLog(*key)
+        return event_log
+
+
+def get_event_files(directory):
+    """
+    returns all event files, the oldest first (The file names start with the creation time)
+    """
+    return sorted(Path(directory).glob(FILE_PATTERN), key=lambda path: path.name)
+
+
+def read_view_names(directory):
+    """
+    returns a dict with view id -> view name
+    """
+    view_names = {}
+    try:
+        f = open(Path(directory, VIEW_NAMES_FILE), encoding="utf-8")
+    except FileNotFoundError:
+        return view_names
+    with f:
+        for line in f:
+            view_id, _, view_name = line.rstrip("\n").partition("\t")
+            try:
+                view_names[int(view_id, 16)] = view_name
+            except ValueError:  # e.g.: a incomplete last line after a crash
+                continue
+    return view_names
+
+
+def get_record_count(mm, path):
+    if len(mm) < HEADER.size:
+        return 0  # e.g.: the header is not written yet
+    magic, version, record_size = HEADER.unpack_from(mm)
+    if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+        raise ValueError(f"{path} is not a event log file of version {VERSION}")
+    return (len(mm) - HEADER.size) // RECORD.size
+
+
+def iter_mapped_files(paths):
+    """
+    yields the memory mapped file and the number of records of all non-empty files
+    """
+    for path in paths:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                continue
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                count = get_record_count(mm, path)
+                if count:
+                    yield mm, count
+
+
+def read_events(paths, start=None, end=None, use_numpy=None):
+    """
+    returns the columns of all records as dict with numpy arrays or, without numpy, array.array.
+    start/end are seconds since epoch.
+    """
+    if use_numpy is None:
+        use_numpy = numpy is not None
+    if use_numpy:
+        return read_events_numpy(paths, start=start, end=end)
+
+    columns = {name: array.array(typecode) for name, fmt, typecode in COLUMNS}
+    for mm, count in iter_mapped_files(paths):
+        with memoryview(mm) as buffer:
+            records = RECORD.iter_unpack(buffer[HEADER.size:HEADER.size + count * RECORD.size])
+            if start is not None or end is not None:
+                records = [
+                    record for record in records
+                    if (start is None or record[0] >= start) and (end is None or record[0] < end)
+                ]
+            for name, values in zip(COLUMN_NAMES, zip(*records)):
+                columns[name].extend(values)
+    return columns
+
+
+def read_events_numpy(paths, start=None, end=None):
+    dtype = numpy.dtype([(name, "<" + fmt) for name, fmt, typecode in COLUMNS])
+    chunks = []
+    for mm, count in iter_mapped_files(paths):
+        # Copy the records, so that the file can be closed:
+        chunks.append(numpy.frombuffer(mm, dtype=dtype, count=count, offset=HEADER.size).copy())
+    events = numpy.concatenate(chunks) if chunks else numpy.empty(0, dtype=dtype)
+
+    mask = numpy.ones(len(events), dtype=bool)
+    if start is not None:
+        mask &= events["time"] >= start
+    if end is not None:
+        mask &= events["time"] < end
+    events = events[mask]
+    return {name: events[name] for name in COLUMN_NAMES}
+
+
+def get_time_range(columns):
+    """
+    returns the time of the first and the last event (None, None if there are no events)
+    """
+    times = columns["time"]
+    if not len(times):
+        return None, None
+    if numpy is not None and isinstance(times, numpy.ndarray):
+        return float(times.min()), float(times.max())
+    return min(times), max(times)
+
+
+def percentile(sorted_values, percent):
+    """
+    Linear interpolation between the closest ranks (like numpy.percentile)
+
+    >>> percentile([1, 2, 3, 4], 50), percentile([1, 2, 3, 4], 90), percentile([5], 99)
+    (2.5, 3.7, 5)
+    """
+    rank = percent / 100 * (len(sorted_values) - 1)
+    lower = int(rank)
+    if lower + 1 >= len(sorted_values):
+        return sorted_values[lower]
+    fraction = rank - lower
+    return sorted_values[lower] + (sorted_values[lower + 1] - sorted_values[lower]) * fraction
+
+
+# The grouping and the values that can be analyzed:
+GROUP_BY = ("view", "pid", "status", "kind", "minute", "hour", "all")
+FIELDS = ("response_time", "queue_time", "user_time", "system_time", "rss")
+
+
+def get_group_keys(columns, group_by):
+    if group_by == "view":
+        return columns["view_id"]
+    elif group_by in ("pid", "status", "kind"):
+        return columns[group_by]
+    elif group_by in ("minute", "hour"):
+        seconds = 60 if group_by == "minute" else 3600
+        if numpy is not None and isinstance(columns["time"], numpy.ndarray):
+            return (columns["time"] // seconds * seconds).astype("int64")
+        return array.array("q", (int(value // seconds * seconds) for value in columns["time"]))
+    elif group_by == "all":
+        return array.array("B", bytes(len(columns["time"])))
+    raise ValueError(f"Unknown group by: {group_by!r}")
+
+
+def analyze(columns, field="response_time", group_by="view", percentiles=(50, 90, 99)):
+    """
+    returns a list of dicts with the statistics of the field per group, the most expensive group first
+    (for "minute" and "hour": sorted by time)
+    """
+    keys = get_group_keys(columns, group_by)
+    values = columns[field]
+    exceptions = columns["flags"]
+
+    if numpy is not None and isinstance(values, numpy.ndarray):
+        groups = group_numpy(keys, values, exceptions, percentiles, skip_unknown=field == "queue_time")
+    else:
+        groups = group_array(keys, values, exceptions, percentiles, skip_unknown=field == "queue_time")
+
+    if group_by in ("minute", "hour"):
+        groups.sort(key=lambda group: group["key"])
+    else:
+        groups.sort(key=lambda group: (-group["sum"], group["key"]))
+    return groups
+
+
+def new_group(key, count, exceptions, value_sum, value_min, value_max, percentile_values, percentiles):
+    return {
+        "key": key,
+        "count": count,
+        "exceptions": exceptions,
+        "sum": value_sum,
+        "min": value_min,
+        "avg": value_sum / count,
+        "max": value_max,
+        "percentiles": dict(zip(percentiles, percentile_values)),
+    }
+
+
+def group_array(keys, values, flags, percentiles, skip_unknown):
+    grouped = collections.defaultdict(list)
+    exceptions = collections.Counter()
+    for key, value, flag in zip(keys, values, flags):
+        if skip_unknown and value < 0:
+            continue
+        grouped[key].append(value)
+        if flag & FLAG_EXCEPTION:
+            exceptions[key] += 1
+
+    groups = []
+    for key, group_values in grouped.items():
+        group_values.sort()
+        groups.append(new_group(
+            key=key,
+            count=len(group_values),
+            exceptions=exceptions[key],
+            value_sum=sum(group_values),
+            value_min=group_values[0],
+            value_max=group_values[-1],
+            percentile_values=[percentile(group_values, percent) for percent in percentiles],
+            percentiles=percentiles,
+        ))
+    return groups
+
+
+def group_numpy(keys, values, flags, percentiles, skip_unknown):
+    keys = numpy.asarray(keys)
+    if skip_unknown:
+        known = values >= 0
+        keys, values, flags = keys[known], values[known], flags[known]
+    if not len(values):
+        return []
+
+    values = values.astype("float64")
+    unique_keys, inverse = numpy.unique(keys, return_inverse=True)
+    order = numpy.lexsort((values, inverse))  # by group and value
+    sorted_values = values[order]
+    counts = numpy.bincount(inverse)
+    exceptions = numpy.bincount(inverse, weights=(flags & FLAG_EXCEPTION) != 0)
+    sums = numpy.bincount(inverse, weights=values)
+
+    groups = []
+    ends = numpy.cumsum(counts)
+    for index, key in enumerate(unique_keys):
+        group_values = sorted_values[ends[index] - counts[index]:ends[index]]
+        groups.append(new_group(
+            key=key.item(),
+            count=int(counts[index]),
+            exceptions=int(exceptions[index]),
+            value_sum=float(sums[index]),
+            value_min=group_values[0].item(),
+            value_max=group_values[-1].item(),
+            percentile_values=numpy.percentile(group_values, percentiles).tolist(),
+            percentiles=percentiles,
+        ))
+    return groups
+
+
+def format_key(key, group_by, view_names):
+    """
+    >>> format_key(0, "view", {}), format_key(1, "kind", {}), format_key(0, "status", {})
+    ('<unresolved>', 'task', '-')
+    >>> format_key(1660651200, "minute", {})
+    '2022-08-16T12:00:00+00:00'
+    """
+    if group_by == "view":
+        if key == 0:
+            return "<unresolved>"
+        return view_names.get(key, f"{key:08x}")
+    elif group_by == "kind":
+        return KINDS[key]
+    elif group_by == "status":
+        return str(key) if key else "-"
+    elif group_by in ("minute", "hour"):
+        return datetime.datetime.fromtimestamp(key, tz=datetime.timezone.utc).isoformat()
+    return str(key)
@@ -0,0 +1,87 @@
+"""
+    export
+    ~~~~~~
+
+    Stream all rows of the statistic tables as CSV or NDJSON (one JSON object per line)
+    The rows are fetched in chunks, so the memory usage is constant, independent of the table size.
+
+    Used by the management command "processinfo_export" and the admin actions.
+
+    :copyleft: 2011-2022 by the django-processinfo team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from django_processinfo.api import get_field_names
+from django_processinfo.models import (
+    HostSample,
+    ProcessInfo,
+    ProcessSample,
+    SiteStatistics,
+    ViewStatistics,
+)
+
+
+CHUNK_SIZE = 2000
+
+FORMATS = {
+    # name: (content type, file extension)
+    "csv": ("text/csv", "csv"),
+    "ndjson": ("application/x-ndjson", "ndjson"),
+}
+
+EXPORT_MODELS = {
+    # name: (model, time field for the time range filter)
+    "sitestatistics": (SiteStatistics, "lastupdate_time"),
+    "processinfo": (ProcessInfo, "lastupdate_time"),
+    "viewstatistics": (ViewStatistics, "lastupdate_time"),
+    "processsample": (ProcessSample, "sample_time"),
+    "hostsample": (HostSample, "sample_time"),
+}
+
+
+class Echo:
+    """
+    A file-like object for the csv.writer that only returns the written line.
+    See: https://docs.djangoproject.com/en/4.1/howto/outputting-csv/#streaming-large-csv-files
+    """
+
+    def write(self, value):
+        return value
+
+
+def filter_time_range(queryset, time_field, start=None, end=None):
+    if start is not None:
+        queryset = queryset.filter(**{f"{time_field}__gte": start})
+    if end is not None:
+        queryset = queryset.filter(**{f"{time_field}__lt": end})
+    return queryset
+
+
+def iter_csv(columns, rows):
+    writer = csv.writer(Echo())
+    yield writer.writerow(columns)
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def iter_ndjson(columns, rows):
+    for row in rows:
+        yield json.dumps(dict(zip(columns, row)), cls=DjangoJSONEncoder) + "\n"
+
+
+def iter_export(queryset, export_format, chunk_size=CHUNK_SIZE):
+    """
+    Yields the lines of the export as strings.
+    """
+    columns = get_field_names(queryset.model)
+    rows = queryset.order_by("pk").values_list(*columns).iterator(chunk_size=chunk_size)
+    if export_format == "csv":
+        return iter_csv(columns, rows)
+    elif export_format == "ndjson":
+        return iter_ndjson(columns, rows)
+    raise ValueError(f"Unknown export format: {export_format!r}")
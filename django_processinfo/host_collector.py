@@ -0,0 +1,86 @@
+"""
+    host collector
+    ~~~~~~~~~~~~~~
+
+    Collect a time series of the host system load:
+        * CPU times from /proc/stat
+        * memory usage from /proc/meminfo
+        * load average
+        * Pressure Stall Information from /proc/pressure/{cpu,memory,io}
+
+    Run it e.g. as management command:
+        ./manage.py processinfo_collect_host --interval 10
+
+    or in one elected process, see: settings.PROCESSINFO.HOST_SAMPLER_INTERVAL
+
+    :copyleft: 2011-2022 by the django-processinfo team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import os
+
+from django.utils import timezone
+
+from django_processinfo.models import HostSample
+from django_processinfo.utils.proc_info import cpu_times, meminfo, pressure_information
+
+
+PRESSURE_FIELDS = (
+    # model field name, resource, key
+    ("psi_cpu_some", "cpu", "some_avg10"),
+    ("psi_memory_some", "memory", "some_avg10"),
+    ("psi_memory_full", "memory", "full_avg10"),
+    ("psi_io_some", "io", "some_avg10"),
+    ("psi_io_full", "io", "full_avg10"),
+)
+
+
+def get_pressure_values():
+    values = {}
+    pressures = {}
+    for field_name, resource, key in PRESSURE_FIELDS:
+        if resource not in pressures:
+            try:
+                pressures[resource] = dict(pressure_information(resource))
+            except OSError:  # e.g.: Kernel without CONFIG_PSI
+                pressures[resource] = {}
+        values[field_name] = pressures[resource].get(key)
+    return values
+
+
+class HostCollector:
+    def __init__(self):
+        # The CPU times are stored as differences to the previous sample:
+        self.last_cpu_times = dict(cpu_times())
+
+    def get_cpu_values(self):
+        current = dict(cpu_times())
+        delta = {key: max(current[key] - self.last_cpu_times[key], 0) for key in current}
+        self.last_cpu_times = current
+        return {
+            "cpu_user": delta["user"] + delta["nice"],
+            "cpu_system": delta["system"] + delta["irq"] + delta["softirq"],
+            "cpu_iowait": delta["iowait"],
+            "cpu_steal": delta["steal"],
+            "cpu_idle": delta["idle"],
+        }
+
+    def collect(self):
+        """
+        returns a new, unsaved HostSample instance
+        """
+        meminfo_dict = dict(meminfo())
+        mem_free = meminfo_dict["MemFree"] + meminfo_dict["Buffers"] + meminfo_dict["Cached"]
+
+        load_1, load_5, load_15 = os.getloadavg()
+
+        return HostSample(
+            sample_time=timezone.now(),
+            mem_used=max(meminfo_dict["MemTotal"] - mem_free, 0),
+            swap_used=meminfo_dict["SwapTotal"] - meminfo_dict["SwapFree"],
+            load_1=load_1,
+            load_5=load_5,
+            load_15=load_15,
+            **self.get_cpu_values(),
+            **get_pressure_values(),
+        )
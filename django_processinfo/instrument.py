@@ -0,0 +1,93 @@
+"""
+    Instrumentation API for non-HTTP work
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Measure e.g. task queue jobs, management commands or cron jobs with the same
+    core as the ProcessInfoMiddleware (times, processor time, /proc information,
+    I/O, garbage collector, database queries, cache, templates).
+    The values are stored in the same models: The name is used as view name
+    in ViewStatistics with a own "kind". e.g.:
+
+        from django_processinfo.instrument import measure
+
+        with measure("newsletter.send", kind="task"):
+            ...
+
+        @measure("myapp.cleanup", kind="command")
+        def handle(self, *args, **options):
+            ...
+
+    Exceptions are counted and re-raised.
+
+    :copyleft: 2011-2022 by the django-processinfo team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import time
+from contextlib import ContextDecorator
+
+from django.conf import settings
+
+from django_processinfo.middlewares import (
+    RequestInfo,
+    StatisticsRecorder,
+    concurrency_gauge,
+    get_exception_name,
+)
+from django_processinfo.models import KIND_CHOICES, KIND_TASK
+
+
+recorder = StatisticsRecorder()
+
+KINDS = tuple(kind for kind, title in KIND_CHOICES)
+
+
+class Measure(ContextDecorator):
+    def __init__(self, name, kind=KIND_TASK):
+        if kind not in KINDS:
+            raise ValueError(f"Unknown kind {kind!r}, choices are: {', '.join(KINDS)}")
+        self.name = name
+        self.kind = kind
+        self.info = None
+
+    def _recreate_cm(self):
+        # Use a new instance for every call of a decorated function (e.g.: recursion, threads)
+        return type(self)(self.name, self.kind)
+
+    def __enter__(self):
+        recorder.setup()
+
+        self.info = info = RequestInfo()
+        info.kind = self.kind
+        info.view_name = self.name[:255]
+        info.start_time = time.monotonic()
+        info.concurrency = concurrency_gauge.enter(
+            now=info.start_time, limit=settings.PROCESSINFO.CONCURRENCY_LIMIT
+        )
+        recorder.start_measurement(info)
+        return info
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        info = self.info
+        info.own_start_time = time.monotonic()
+        info.remove_collectors()
+
+        concurrency_gauge.leave(
+            now=info.own_start_time, limit=settings.PROCESSINFO.CONCURRENCY_LIMIT
+        )
+
+        if exc_value is not None:
+            info.exception_name = get_exception_name(exc_value)
+
+        if not info.skip_statistics:
+            recorder.insert_statistics(info, exception=exc_value is not None)
+
+        return False  # Don't suppress the exception
+
+
+def measure(name, kind=KIND_TASK):
+    """
+    Context manager and decorator to measure the work with the given name.
+    kind is one of "task" or "command" (or "request")
+    """
+    return Measure(name, kind=kind)
@@ -0,0 +1,127 @@
+import datetime
+import json
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from django_processinfo import event_log
+from django_processinfo.management.commands.processinfo_export import parse_time
+
+
+def parse_percentiles(value):
+    try:
+        percentiles = tuple(float(item) for item in value.split(","))
+    except ValueError:
+        raise CommandError(f"Invalid percentiles: {value!r}")
+    if not all(0 <= percent <= 100 for percent in percentiles):
+        raise CommandError(f"Percentiles must be between 0 and 100: {value!r}")
+    return percentiles
+
+
+class Command(BaseCommand):
+    help = "Analyze the event log (settings.PROCESSINFO.EVENT_LOG_DIR): percentiles per view, process, time etc."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dir", dest="directory",
+            help="Directory of the event log files (default: settings.PROCESSINFO.EVENT_LOG_DIR)",
+        )
+        parser.add_argument(
+            "--group-by", choices=event_log.GROUP_BY, default="view", help="Grouping (default: view)"
+        )
+        parser.add_argument(
+            "--field", choices=event_log.FIELDS, default="response_time",
+            help="The analyzed value (default: response_time)",
+        )
+        parser.add_argument(
+            "--percentiles", type=parse_percentiles, default=(50, 90, 99),
+            help="Comma separated percentiles (default: 50,90,99)",
+        )
+        parser.add_argument(
+            "--start", help="Only events since this time (ISO 8601 or seconds since epoch)"
+        )
+        parser.add_argument(
+            "--end", help="Only events before this time (ISO 8601 or seconds since epoch)"
+        )
+        parser.add_argument("--limit", type=int, default=50, help="Max. number of groups (default: 50)")
+        parser.add_argument("--json", action="store_true", help="Output the results as JSON")
+        parser.add_argument(
+            "--no-numpy", action="store_true", help="Don't use numpy, even if it's installed"
+        )
+
+    def handle(self, *args, **options):
+        directory = options["directory"] or settings.PROCESSINFO.EVENT_LOG_DIR
+        if not directory:
+            raise CommandError("No event log directory: Set settings.PROCESSINFO.EVENT_LOG_DIR or use --dir")
+
+        start = parse_time(options["start"]).timestamp() if options["start"] else None
+        end = parse_time(options["end"]).timestamp() if options["end"] else None
+        group_by, field, percentiles = options["group_by"], options["field"], options["percentiles"]
+
+        start_time = time.monotonic()
+        paths = event_log.get_event_files(directory)
+        try:
+            columns = event_log.read_events(
+                paths, start=start, end=end, use_numpy=False if options["no_numpy"] else None
+            )
+        except ValueError as err:
+            raise CommandError(err)
+        groups = event_log.analyze(columns, field=field, group_by=group_by, percentiles=percentiles)
+        duration = time.monotonic() - start_time
+
+        view_names = event_log.read_view_names(directory)
+        for group in groups:
+            group["key"] = event_log.format_key(group["key"], group_by, view_names)
+        groups = groups[:options["limit"]]
+
+        first, last = event_log.get_time_range(columns)
+        result = {
+            "files": len(paths),
+            "events": len(columns["time"]),
+            "first": first,
+            "last": last,
+            "duration": duration,
+            "group_by": group_by,
+            "field": field,
+            "groups": groups,
+        }
+
+        if options["json"]:
+            self.stdout.write(json.dumps(result, indent=4, default=float))
+            return
+
+        self.stdout.write(
+            f"{result['events']} events in {result['files']} files analyzed in {duration:.2f}s"
+        )
+        if not groups:
+            return
+        first, last = (
+            datetime.datetime.fromtimestamp(timestamp, tz=datetime.timezone.utc).isoformat(timespec="seconds")
+            for timestamp in (result["first"], result["last"])
+        )
+        self.stdout.write(f"from {first} to {last}")
+
+        scale, unit = (1 / 1024 / 1024, "MiB") if field == "rss" else (1000, "ms")
+        titles = (
+            group_by, "count", "exceptions", f"min {unit}", f"avg {unit}",
+            *(f"p{percent:g} {unit}" for percent in percentiles), f"max {unit}",
+        )
+        rows = [
+            (
+                group["key"], str(group["count"]), str(group["exceptions"]),
+                *(
+                    f"{value * scale:.2f}"
+                    for value in (group["min"], group["avg"], *group["percentiles"].values(), group["max"])
+                ),
+            )
+            for group in groups
+        ]
+        widths = [max(len(row[index]) for row in (titles, *rows)) for index in range(len(titles))]
+        for row in (titles, *rows):
+            self.stdout.write(
+                "  ".join(
+                    value.ljust(width) if index == 0 else value.rjust(width)
+                    for index, (value, width) in enumerate(zip(row, widths))
+                ).rstrip()
+            )
@@ -0,0 +1,45 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from django_processinfo.host_collector import HostCollector
+from django_processinfo.models import HostSample
+from django_processinfo.sampler import delete_oldest
+
+
+class Command(BaseCommand):
+    help = "Collect a time series of the host system load (CPU, memory, load average, pressure)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--interval", type=float, default=10, help="Seconds between two samples (default: 10)"
+        )
+        parser.add_argument(
+            "--count", type=int, default=0, help="Number of samples to collect (default: endless)"
+        )
+
+    def handle(self, *args, **options):
+        interval = options["interval"]
+        count = options["count"]
+
+        collector = HostCollector()
+        collected = attempts = 0
+        while not count or attempts < count:
+            attempts += 1
+            time.sleep(interval)
+            try:
+                sample = collector.collect()
+            except (OSError, ValueError) as err:
+                self.stderr.write(f"Can't collect host sample: {err}")
+                continue
+            sample.save()
+            delete_oldest(HostSample, max_count=settings.PROCESSINFO.MAX_HOST_SAMPLE_COUNT)
+            collected += 1
+            if options["verbosity"] > 1:
+                self.stdout.write(
+                    f"{sample.sample_time}: CPU {sample.cpu_usage():.1f}%"
+                    f" - load {sample.load_1:.2f}"
+                )
+
+        self.stdout.write(self.style.SUCCESS(f"{collected} host samples collected."))
@@ -0,0 +1,85 @@
+import functools
+import gzip
+import sys
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from django_processinfo.api import parse_since
+from django_processinfo.export import (
+    CHUNK_SIZE,
+    EXPORT_MODELS,
+    FORMATS,
+    filter_time_range,
+    iter_export,
+)
+
+
+def parse_time(value):
+    try:
+        return parse_since(value)
+    except ValidationError as err:
+        raise CommandError(err.messages[0])
+
+
+class Command(BaseCommand):
+    help = "Export the collected data as CSV or NDJSON, e.g.: for offline capacity planning"
+
+    def add_arguments(self, parser):
+        parser.add_argument("model", choices=sorted(EXPORT_MODELS), help="The data to export")
+        parser.add_argument(
+            "--format", dest="export_format", choices=sorted(FORMATS), default="csv",
+            help="Output format (default: csv)",
+        )
+        parser.add_argument(
+            "--output", default="-",
+            help="Output file name (default: stdout). Compressed if it ends with '.gz'",
+        )
+        parser.add_argument("--gzip", action="store_true", help="Compress the output with gzip")
+        parser.add_argument(
+            "--start", help="Export only entries since this time (ISO 8601 or seconds since epoch)"
+        )
+        parser.add_argument(
+            "--end", help="Export only entries before this time (ISO 8601 or seconds since epoch)"
+        )
+        parser.add_argument(
+            "--chunk-size", type=int, default=CHUNK_SIZE,
+            help=f"Number of rows fetched from the database at once (default: {CHUNK_SIZE})",
+        )
+
+    def handle(self, *args, **options):
+        model, time_field = EXPORT_MODELS[options["model"]]
+        start = parse_time(options["start"]) if options["start"] else None
+        end = parse_time(options["end"]) if options["end"] else None
+        queryset = filter_time_range(model.objects.all(), time_field, start=start, end=end)
+
+        lines = iter_export(queryset, options["export_format"], chunk_size=options["chunk_size"])
+
+        output = options["output"]
+        use_gzip = options["gzip"] or output.endswith(".gz")
+        if output == "-":
+            if use_gzip:
+                # Note: Closing the gzip file doesn't close stdout
+                out = gzip.open(sys.stdout.buffer, "wt", encoding="utf-8", newline="")
+            else:
+                out = None
+        elif use_gzip:
+            out = gzip.open(output, "wt", encoding="utf-8", newline="")
+        else:
+            out = open(output, "w", encoding="utf-8", newline="")
+
+        if out is None:
+            count = self.write_lines(lines, write=functools.partial(self.stdout.write, ending=""))
+        else:
+            with out:
+                count = self.write_lines(lines, write=out.write)
+
+        if output != "-":
+            self.stdout.write(self.style.SUCCESS(f"{count} lines written to {output!r}"))
+
+    def write_lines(self, lines, write):
+        count = 0
+        for line in lines:
+            write(line)
+            count += 1
+        return count
@@ -9,22 +9,60 @@
 
 import os
 import sys
+import threading
 import time
 
 from django.conf import settings
-from django.contrib.sites.models import Site
-from django.db import connection
+from django.db import connection, connections
 from django.urls import reverse
 from django.utils.deprecation import MiddlewareMixin
 
-from django_processinfo.models import ProcessInfo, SiteStatistics
-from django_processinfo.utils.average import average
-from django_processinfo.utils.proc_info import process_information
+from django_processinfo.event_log import get_event_log
+from django_processinfo.models import KIND_REQUEST
+from django_processinfo.recycle import schedule_recycle
+from django_processinfo.sampler import host_sampler, proc_sampler
+from django_processinfo.storage import get_storage
+from django_processinfo.utils import (
+    cache_instrumentation,
+    db_connections,
+    middleware_timing,
+    template_timing,
+)
+from django_processinfo.utils.average import update_min_max_avg
+from django_processinfo.utils.cold_start import StartupTimer
+from django_processinfo.utils.concurrency import ConcurrencyGauge
+from django_processinfo.utils.gc_monitor import GENERATIONS, GCMonitor
+from django_processinfo.utils.load_average import WorkerLoad
+from django_processinfo.utils.middleware_timing import MiddlewareCollector
+from django_processinfo.utils.proc_info import (
+    open_fd_count,
+    process_information,
+    process_io,
+)
+from django_processinfo.utils.queue_time import get_queue_time
+from django_processinfo.utils.smaps import SmapsThrottle
+from django_processinfo.utils.sql_fingerprint import QueryCollector
+from django_processinfo.utils.template_timing import TemplateCollector
 
 
 # Save the start time of the current running python instance
 overall_start_time = time.monotonic()
 
+# 1, 5 and 15 minute moving averages of this process:
+worker_load = WorkerLoad(now=overall_start_time)
+
+# Requests in progress in this process:
+concurrency_gauge = ConcurrencyGauge(now=overall_start_time)
+
+# Garbage collector pauses of this process:
+gc_monitor = GCMonitor()
+
+# Time from the process spawn until the first middleware instance was created:
+startup_timer = StartupTimer()
+
+# Read the PSS/USS only every settings.PROCESSINFO.SMAPS_INTERVAL seconds:
+smaps_throttle = SmapsThrottle()
+
 
 def get_processor_times():
     """
@@ -35,9 +73,319 @@ def get_processor_times():
     return (user + child_user, system + child_system)
 
 
-class ProcessInfoMiddleware(MiddlewareMixin):
+IO_COUNTERS = ("rchar", "wchar", "syscr", "syscw", "read_bytes", "write_bytes")
+
+
+def get_io_counters():
+    """
+    return the thread ID and the I/O counters of the current thread (None if not available)
+    >>> thread_id, counters = get_io_counters()
+    >>> len(counters)
+    6
+    """
+    try:
+        io = dict(process_io("thread-self"))
+    except OSError:  # e.g.: Linux older than 3.17 or not allowed in a container
+        return None
+    return threading.get_ident(), tuple(io.get(key, 0) for key in IO_COUNTERS)
+
+
+def get_io_deltas(start_io):
+    """
+    return a dict with the I/O of the current request (None if not available)
+    """
+    if start_io is None:
+        return None
+
+    end_io = get_io_counters()
+    if end_io is None or end_io[0] != start_io[0]:
+        # The counters are per thread: Response created in a other thread, e.g.: ASGI
+        return None
+
+    return {
+        key: max(end - start, 0)
+        for key, start, end in zip(IO_COUNTERS, start_io[1], end_io[1])
+    }
+
+
+def update_io_statistics(obj, io_deltas):
+    """
+    Update the IOModelMixin fields of a ProcessInfo or ViewStatistics instance
+    """
+    for key, value in io_deltas.items():
+        update_min_max_avg(obj, f"io_{key}", value, obj.io_count)
+    obj.io_count += 1
+
+
+def update_gc_statistics(obj, gc_deltas):
+    """
+    Update the GCModelMixin fields of a ProcessInfo or ViewStatistics instance
+    """
+    gc_time = 0
+    for generation in GENERATIONS:
+        count_field = f"gc_count_{generation}"
+        time_field = f"gc_time_{generation}"
+        setattr(obj, count_field, getattr(obj, count_field) + gc_deltas[count_field])
+        setattr(obj, time_field, getattr(obj, time_field) + gc_deltas[time_field])
+        gc_time += gc_deltas[time_field]
+    obj.gc_time_max = max(obj.gc_time_max, gc_time)
+
+
+def update_cache_statistics(obj, cache_deltas):
+    """
+    Update the CacheModelMixin fields of a ProcessInfo or ViewStatistics instance
+    """
+    obj.cache_count += 1
+    obj.cache_hits += cache_deltas["hits"]
+    obj.cache_misses += cache_deltas["misses"]
+    obj.cache_sets += cache_deltas["sets"]
+    obj.cache_deletes += cache_deltas["deletes"]
+    obj.cache_time_sum += cache_deltas["time"]
+    obj.cache_time_max = max(obj.cache_time_max, cache_deltas["time"])
+
+
+def get_view_name(request):
+    """
+    returns the URL name or the view function path (None for unresolved requests)
+    """
+    resolver_match = getattr(request, "resolver_match", None)
+    if resolver_match is None:
+        return None
+    return resolver_match.view_name[:255]
+
+
+def get_status_class(status_code):
+    """
+    >>> get_status_class(200), get_status_class(304), get_status_class(302), get_status_class(503)
+    ('2xx', '304', '3xx', '5xx')
+    """
+    if status_code == 304:
+        # Separated, because they are usually much faster than other 3xx responses
+        return "304"
+    return f"{status_code // 100}xx"
+
+
+def get_exception_name(exception):
+    """
+    >>> get_exception_name(ValueError())
+    'ValueError'
+    >>> from django.http import Http404
+    >>> get_exception_name(Http404())
+    'django.http.response.Http404'
+    """
+    exception_class = type(exception)
+    if exception_class.__module__ == "builtins":
+        return exception_class.__qualname__
+    return f"{exception_class.__module__}.{exception_class.__qualname__}"[:255]
+
+
+class RequestInfo:
+    """
+    Collected information about the current request (or other work, see: instrument.py)
+    """
+    # The kind of work, see: ViewStatistics.kind
+    kind = KIND_REQUEST
+
+    # Can be set by a view to exclude the current request from statistics:
+    skip_statistics = False
+
+    # Time waited in the request queue (only for requests):
+    queue_time = None
+
+    # Set in process_exception() / process_response():
+    exception_name = None
+    status_code = None
+
+    # Set if the worker should exit after the response, see: recycle.py
+    recycle_reason = None
+
+    # Collect the SQL queries, see: settings.PROCESSINFO.SQL_FINGERPRINTS
+    query_collector = None
+    query_connections = ()
+
+    def install_query_collector(self):
+        self.query_collector = QueryCollector()
+        own_alias = settings.PROCESSINFO.DATABASE
+        self.query_connections = [
+            conn for conn in connections.all() if own_alias is None or conn.alias != own_alias
+        ]
+        for conn in self.query_connections:
+            conn.execute_wrappers.append(self.query_collector)
+
+    def remove_query_collector(self):
+        """
+        Stop collecting, before the statistics will be saved.
+        """
+        for conn in self.query_connections:
+            if self.query_collector in conn.execute_wrappers:
+                conn.execute_wrappers.remove(self.query_collector)
+        self.query_connections = ()
+
+    # Measure the template render time, see: settings.PROCESSINFO.TEMPLATE_TIMING
+    template_collector = None
+
+    def install_template_collector(self):
+        self.template_collector = TemplateCollector()
+        self.template_collector.activate()
+
+    # Measure the time of the middlewares, see: settings.PROCESSINFO.MIDDLEWARE_TIMING
+    middleware_collector = None
+
+    def install_middleware_collector(self):
+        self.middleware_collector = MiddlewareCollector()
+        self.middleware_collector.activate()
+
+    def remove_collectors(self):
+        """
+        Stop collecting, before the statistics will be saved.
+        """
+        self.remove_query_collector()
+        if self.template_collector is not None:
+            self.template_collector.deactivate()
+        if self.middleware_collector is not None:
+            self.middleware_collector.deactivate()
+
+
+class StatisticsRecorder:
+    """
+    The measurement core: Used by the ProcessInfoMiddleware for requests
+    and by django_processinfo.instrument for other work (tasks, commands).
+    """
+
+    def setup(self):
+        startup_timer.ready()
+
+        if settings.PROCESSINFO.GC_ACCOUNTING:
+            gc_monitor.install()
+
+        if settings.PROCESSINFO.CACHE_INSTRUMENTATION:
+            cache_instrumentation.install()
+
+        if settings.PROCESSINFO.TEMPLATE_TIMING:
+            template_timing.install()
+
+        if settings.PROCESSINFO.MIDDLEWARE_TIMING:
+            middleware_timing.install()
+
+        if settings.PROCESSINFO.DB_CONNECTION_STATS:
+            db_connections.install()
+
+    def start_measurement(self, info):
+        """
+        Save the start values. info.start_time must be set.
+        """
+        # We would like to accumulate only the times from processes
+        # which are included in statistics. So we not use the absolute
+        # processor times.
+        info.start_user_time, info.start_system_time = get_processor_times()
+
+        if settings.PROCESSINFO.IO_ACCOUNTING:
+            # Same for the I/O counters, e.g.: to see if a request is disk-bound
+            info.start_io = get_io_counters()
+
+        if settings.PROCESSINFO.GC_ACCOUNTING:
+            info.start_gc = gc_monitor.snapshot()
+        else:
+            info.start_gc = None
+
+        if settings.PROCESSINFO.CACHE_INSTRUMENTATION:
+            info.start_cache = cache_instrumentation.snapshot()
+        else:
+            info.start_cache = None
+
+        if settings.PROCESSINFO.SQL_FINGERPRINTS:
+            info.install_query_collector()
+
+        if settings.PROCESSINFO.TEMPLATE_TIMING:
+            info.install_template_collector()
+
+        if settings.DEBUG:
+            # get number of db queries before we do anything
+            info.old_queries = len(connection.queries)
+
+    def insert_statistics(self, info, exception=False):
+        """ collect statistic information """
+        if settings.DEBUG:
+            info.query_count = len(connection.queries) - info.old_queries
+        else:
+            info.query_count = 0
+
+        sample = proc_sampler.latest
+        if sample is None:
+            p = dict(process_information())
+            info.pid = p["Pid"]
+            info.threads = p["Threads"]
+            info.vmpeak = p["VmPeak"]
+            info.memory = p["VmRSS"]
+            try:
+                info.fds = open_fd_count()
+            except OSError:
+                info.fds = None
+        else:
+            # Use the information from the background sampler thread:
+            info.pid = sample.pid
+            info.threads = sample.threads
+            info.vmpeak = sample.vm_peak
+            info.memory = sample.memory
+            info.fds = sample.fds
+
+        if settings.PROCESSINFO.SMAPS_INTERVAL:
+            info.memory_details = smaps_throttle.get(
+                now=info.own_start_time, interval=settings.PROCESSINFO.SMAPS_INTERVAL
+            )
+        else:
+            info.memory_details = None
+
+        # Calculate user/system processor times only for this request:
+        user_time, system_time = get_processor_times()
+        info.user_time = user_time - info.start_user_time
+        info.system_time = system_time - info.start_system_time
+
+        if settings.PROCESSINFO.IO_ACCOUNTING:
+            info.io_deltas = get_io_deltas(info.start_io)
+        else:
+            info.io_deltas = None
+
+        if info.start_gc is not None:
+            info.gc_deltas = gc_monitor.get_deltas(info.start_gc)
+        else:
+            info.gc_deltas = None
+
+        if info.start_cache is not None:
+            info.cache_deltas = cache_instrumentation.get_deltas(info.start_cache)
+        else:
+            info.cache_deltas = None
+
+        if settings.PROCESSINFO.DB_CONNECTION_STATS:
+            # Before the own statistics are saved, that may open a connection
+            db_connections.monitor.request_finished(connections.all())
+            info.connection_stats = db_connections.monitor.get_values()
+        else:
+            info.connection_stats = None
+
+        info.response_time = info.own_start_time - info.start_time
+        info.overall_time = info.own_start_time - overall_start_time
+
+        worker_load.add_request(
+            now=info.own_start_time,
+            response_time=info.response_time,
+            processor_time=info.user_time + info.system_time,
+            exception=exception,
+        )
+        info.load_values = worker_load.get_values(now=info.own_start_time)
+        info.saturation = concurrency_gauge.get_saturation(
+            now=info.own_start_time, limit=settings.PROCESSINFO.CONCURRENCY_LIMIT
+        )
+
+        get_storage().save(info, exception)
+
+        if settings.PROCESSINFO.EVENT_LOG_DIR:
+            get_event_log().write(info, exception)
+
+
+class ProcessInfoMiddleware(StatisticsRecorder, MiddlewareMixin):
     def __init__(self, get_response=None):
-        self.get_response = get_response
+        super().__init__(get_response)
 
         self.url_filter = []
         for url_name, recusive in settings.PROCESSINFO.URL_FILTER:
@@ -56,143 +404,60 @@ class ProcessInfoMiddleware(MiddlewareMixin):
             self.url_filter.append((url, recusive))
         self.url_filter = tuple(self.url_filter)
 
-    def _insert_statistics(self, exception=False):
-        """ collect statistic information """
+        self.setup()
 
-        if settings.DEBUG:
-            self.query_count = len(connection.queries) - self.old_queries
-        else:
-            self.query_count = 0
-
-        p = dict(process_information())
-        self.pid = p["Pid"]
-        self.threads = p["Threads"]
-        self.vmpeak = p["VmPeak"]
-        self.memory = p["VmRSS"]
-
-        # Calculate user/system processor times only for this request:
-        user_time, system_time = get_processor_times()
-        self.user_time = user_time - self.start_user_time
-        self.system_time = system_time - self.start_system_time
-
-        self.response_time = self.own_start_time - self.start_time
-        self.overall_time = self.own_start_time - overall_start_time
-
-        process_info, process_created = ProcessInfo.objects.get_or_create(
-            pid=self.pid,
-            defaults={
-                "db_query_count_min": self.query_count,
-                "db_query_count_max": self.query_count,
-                "db_query_count_avg": self.query_count,
-                "response_time_min": self.response_time,
-                "response_time_max": self.response_time,
-                "response_time_avg": self.response_time,
-                "response_time_sum": self.response_time,
-                "threads_avg": self.threads,
-                "threads_min": self.threads,
-                "threads_max": self.threads,
-                "user_time_min": self.user_time,
-                "user_time_max": self.user_time,
-                "user_time_total": self.user_time,
-                "system_time_total": self.system_time,
-                "system_time_min": self.system_time,
-                "system_time_max": self.system_time,
-                "vm_peak_min": self.vmpeak,
-                "vm_peak_max": self.vmpeak,
-                "vm_peak_avg": self.vmpeak,
-                "memory_min": self.memory,
-                "memory_max": self.memory,
-                "memory_avg": self.memory,
-            }
-        )
-        if exception:
-            process_info.exception_count += 1
-
-        if not process_created:
-            process_info.request_count += 1
-            request_count = process_info.request_count
-
-            if settings.DEBUG:
-                process_info.db_query_count_min = min((process_info.db_query_count_min, self.query_count))
-                process_info.db_query_count_max = max((process_info.db_query_count_max, self.query_count))
-                process_info.db_query_count_avg = average(
-                    process_info.db_query_count_avg, self.query_count, request_count
-                )
-
-            process_info.response_time_min = min((process_info.response_time_min, self.response_time))
-            process_info.response_time_max = max((process_info.response_time_max, self.response_time))
-            process_info.response_time_avg = average(
-                process_info.response_time_avg, self.response_time, request_count
-            )
-            process_info.response_time_sum += self.response_time
+    def _insert_statistics(self, request, exception=False):
+        info = request._processinfo
+        info.view_name = get_view_name(request)
+        self.insert_statistics(info, exception)
 
-            process_info.threads_min = min((process_info.threads_min, self.threads))
-            process_info.threads_max = max((process_info.threads_max, self.threads))
-            process_info.threads_avg = average(
-                process_info.threads_avg, self.threads, request_count
-            )
-
-            process_info.user_time_min = min((process_info.user_time_min, self.user_time))
-            process_info.user_time_max = max((process_info.user_time_min, self.user_time))
-            process_info.user_time_total += self.user_time
-
-            process_info.system_time_min = min((process_info.system_time_min, self.system_time))
-            process_info.system_time_max = max((process_info.system_time_min, self.system_time))
-            process_info.system_time_total += self.system_time
-
-            process_info.vm_peak_min = min((process_info.vm_peak_min, self.vmpeak))
-            process_info.vm_peak_max = max((process_info.vm_peak_max, self.vmpeak))
-            process_info.vm_peak_avg = average(
-                process_info.vm_peak_avg, self.vmpeak, request_count
-            )
+    def process_request(self, request):
+        """ save start time and database connections count. """
+        # Store all information of the current request on the request object,
+        # because the middleware instance is shared between threads/async tasks:
+        request._processinfo = info = RequestInfo()
+        info.start_time = time.monotonic()
 
-            process_info.memory_min = min((process_info.memory_min, self.memory))
-            process_info.memory_max = max((process_info.memory_max, self.memory))
-            process_info.memory_avg = average(
-                process_info.memory_avg, self.memory, request_count
-            )
-            process_info.save()
+        proc_sampler.ensure_running()
+        host_sampler.ensure_running()
 
-        current_site = Site.objects.get_current()
-        site_stats, created = SiteStatistics.objects.get_or_create(
-            site=current_site
+        info.concurrency = concurrency_gauge.enter(
+            now=info.start_time, limit=settings.PROCESSINFO.CONCURRENCY_LIMIT
         )
-        if created or process_created:
-            if not created and process_created:
-                site_stats.process_spawn += 1
-            site_stats.update_informations()
-            site_stats.save()
-
-            # Auto cleanup ProcessInfo table to protect against overloading.
-            queryset = ProcessInfo.objects.order_by('-lastupdate_time')
-            max_count = settings.PROCESSINFO.MAX_PROCESSINFO_COUNT
-            ids = tuple(queryset[max_count:].values_list('pk', flat=True))
-            if ids:
-                queryset.filter(pk__in=ids).delete()
 
-    def process_request(self, request):
-        """ save start time and database connections count. """
-        self.start_time = time.monotonic()
+        # Time waited in the nginx/gunicorn etc. request queue:
+        info.queue_time = get_queue_time(
+            request.META, settings.PROCESSINFO.QUEUE_TIME_HEADERS, now=time.time()
+        )
 
-        # We would like to accumulate only the times from processes
-        # which are included in statistics. So we not use the absolute
-        # processor times.
-        self.start_user_time, self.start_system_time = get_processor_times()
+        self.start_measurement(info)
 
-        if settings.DEBUG:
-            # get number of db queries before we do anything
-            self.old_queries = len(connection.queries)
-
-        response = self.get_response(request)
-        return response
+        if settings.PROCESSINFO.MIDDLEWARE_TIMING:
+            # Only for requests: The other middlewares are called after this one
+            info.install_middleware_collector()
 
     def process_exception(self, request, exception):
-        self.own_start_time = time.monotonic()
-        self._insert_statistics(exception=True)
+        # The statistics are inserted in process_response(), because Django
+        # converts the exception into a response (e.g.: 404/500) that will
+        # be passed to process_response(), too. So a request is counted only once.
+        info = request._processinfo
+        info.exception_name = get_exception_name(exception)
 
     def process_response(self, request, response):
+        info = getattr(request, "_processinfo", None)
+        if info is None:
+            # process_request() was not called, e.g.: a middleware above returns a response
+            return response
 
-        self.own_start_time = time.monotonic()
+        info.own_start_time = time.monotonic()
+        info.remove_collectors()
+
+        concurrency_gauge.leave(
+            now=info.own_start_time, limit=settings.PROCESSINFO.CONCURRENCY_LIMIT
+        )
+
+        if info.skip_statistics:
+            return response
 
         is_200 = response.status_code == 200  # e.g. exclude 304 (HttpResponseNotModified)
 
@@ -215,15 +480,19 @@ class ProcessInfoMiddleware(MiddlewareMixin):
                 # print "Skip (exact) %r" % request.path
                 return response
 
-        self._insert_statistics()
+        info.status_code = response.status_code
+        self._insert_statistics(request, exception=info.exception_name is not None)
+
+        if info.recycle_reason is not None:
+            schedule_recycle(response, pid=info.pid, reason=info.recycle_reason)
 
         if is_200 and settings.PROCESSINFO.ADD_INFO and mime_type == "text/html":
             # insert django-processinfo "time cost" info in a html response
-            own = time.monotonic() - self.own_start_time
-            perc = own / self.response_time * 100
+            own = time.monotonic() - info.own_start_time
+            perc = own / info.response_time * 100
             process_info = settings.PROCESSINFO.INFO_FORMATTER.format(
                 own=own * 1000,
-                total=self.response_time * 1000,
+                total=info.response_time * 1000,
                 perc=perc,
             )
             response.content = response.content.replace(
@@ -0,0 +1,25 @@
+# Generated by Django 3.2.25 on 2026-10-19 14:48
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sites', '0002_alter_domain_unique'),
+        ('django_processinfo', '0004_auto_20201209_1313'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='processinfo',
+            name='site',
+            field=models.ForeignKey(db_constraint=False, default=1, help_text='settings.SITE_ID', on_delete=django.db.models.deletion.CASCADE, to='sites.site'),
+        ),
+        migrations.AlterField(
+            model_name='sitestatistics',
+            name='site',
+            field=models.OneToOneField(db_constraint=False, default=1, help_text='settings.SITE_ID', on_delete=django.db.models.deletion.CASCADE, primary_key=True, serialize=False, to='sites.site'),
+        ),
+    ]
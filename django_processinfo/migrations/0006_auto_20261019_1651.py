@@ -0,0 +1,73 @@
+# Generated by Django 3.2.25 on 2026-10-19 14:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_processinfo', '0005_auto_20261019_1648'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='processinfo',
+            name='cpu_load_1',
+            field=models.FloatField(default=0, help_text='Processor time per second (1 min. average)'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='cpu_load_15',
+            field=models.FloatField(default=0, help_text='Processor time per second (15 min. average)'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='cpu_load_5',
+            field=models.FloatField(default=0, help_text='Processor time per second (5 min. average)'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='error_rate_1',
+            field=models.FloatField(default=0, help_text='Exceptions per second (1 min. average)'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='error_rate_15',
+            field=models.FloatField(default=0, help_text='Exceptions per second (15 min. average)'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='error_rate_5',
+            field=models.FloatField(default=0, help_text='Exceptions per second (5 min. average)'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='request_rate_1',
+            field=models.FloatField(default=0, help_text='Requests per second (1 min. average)'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='request_rate_15',
+            field=models.FloatField(default=0, help_text='Requests per second (15 min. average)'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='request_rate_5',
+            field=models.FloatField(default=0, help_text='Requests per second (5 min. average)'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='response_time_1',
+            field=models.FloatField(default=0, help_text='Response time (1 min. average)'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='response_time_15',
+            field=models.FloatField(default=0, help_text='Response time (15 min. average)'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='response_time_5',
+            field=models.FloatField(default=0, help_text='Response time (5 min. average)'),
+        ),
+    ]
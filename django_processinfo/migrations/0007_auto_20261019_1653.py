@@ -0,0 +1,67 @@
+# Generated by Django 3.2.25 on 2026-10-19 14:53
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sites', '0002_alter_domain_unique'),
+        ('django_processinfo', '0006_auto_20261019_1651'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='processinfo',
+            name='queue_time_avg',
+            field=models.FloatField(default=0, help_text='Average time waited in the request queue.'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='queue_time_count',
+            field=models.PositiveIntegerField(default=0, help_text='Number of requests with queue time information.'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='queue_time_max',
+            field=models.FloatField(default=0, help_text='Maximum time waited in the request queue.'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='queue_time_min',
+            field=models.FloatField(default=0, help_text='Minimum time waited in the request queue.'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='queue_time_sum',
+            field=models.FloatField(default=0, help_text='Total time waited in the request queue.'),
+        ),
+        migrations.CreateModel(
+            name='ViewStatistics',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('start_time', models.DateTimeField(auto_now_add=True, help_text='Create time')),
+                ('lastupdate_time', models.DateTimeField(auto_now=True, help_text='Time of the last change.')),
+                ('queue_time_count', models.PositiveIntegerField(default=0, help_text='Number of requests with queue time information.')),
+                ('queue_time_min', models.FloatField(default=0, help_text='Minimum time waited in the request queue.')),
+                ('queue_time_max', models.FloatField(default=0, help_text='Maximum time waited in the request queue.')),
+                ('queue_time_avg', models.FloatField(default=0, help_text='Average time waited in the request queue.')),
+                ('queue_time_sum', models.FloatField(default=0, help_text='Total time waited in the request queue.')),
+                ('view_name', models.CharField(help_text='request.resolver_match.view_name', max_length=255)),
+                ('request_count', models.PositiveIntegerField(default=0, help_text='How many request answered since self.start_time', verbose_name='Requests')),
+                ('exception_count', models.PositiveIntegerField(default=0, help_text='How many requests led to a exception.', verbose_name='Exceptions')),
+                ('response_time_min', models.FloatField(default=0, help_text='Minimum processing time.')),
+                ('response_time_max', models.FloatField(default=0, help_text='Maximum processing time.')),
+                ('response_time_avg', models.FloatField(default=0, help_text='Average processing time.')),
+                ('response_time_sum', models.FloatField(default=0, help_text='Total processing time.')),
+                ('site', models.ForeignKey(db_constraint=False, default=1, help_text='settings.SITE_ID', on_delete=django.db.models.deletion.CASCADE, to='sites.site')),
+            ],
+            options={
+                'verbose_name': 'View statistics',
+                'verbose_name_plural': 'View statistics',
+                'ordering': ('-lastupdate_time',),
+                'unique_together': {('site', 'view_name')},
+            },
+        ),
+    ]
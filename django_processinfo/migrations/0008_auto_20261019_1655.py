@@ -0,0 +1,33 @@
+# Generated by Django 3.2.25 on 2026-10-19 14:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_processinfo', '0007_auto_20261019_1653'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='processinfo',
+            name='concurrency_avg',
+            field=models.FloatField(default=1, help_text='Average number of requests in progress (sampled at request start)'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='concurrency_max',
+            field=models.PositiveSmallIntegerField(default=1, help_text='Maximum number of requests in progress (sampled at request start)'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='concurrency_min',
+            field=models.PositiveSmallIntegerField(default=1, help_text='Minimum number of requests in progress (sampled at request start)'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='saturation',
+            field=models.FloatField(default=0, help_text='Percentage of time with all threads busy (see: settings.PROCESSINFO.CONCURRENCY_LIMIT)'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 3.2.25 on 2026-10-19 14:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_processinfo', '0008_auto_20261019_1655'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProcessSample',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('pid', models.PositiveIntegerField(db_index=True, help_text='process ID.')),
+                ('sample_time', models.DateTimeField(db_index=True, help_text='Time of the sample')),
+                ('memory', models.PositiveBigIntegerField(help_text='Non-paged memory (VmRSS - Resident set size) in Bytes')),
+                ('vm_peak', models.PositiveBigIntegerField(help_text='Peak virtual memory size (VmPeak) in Bytes')),
+                ('threads', models.PositiveSmallIntegerField(help_text='Number of threads')),
+                ('user_time', models.FloatField(help_text='user mode time since process start')),
+                ('system_time', models.FloatField(help_text='system mode time since process start')),
+                ('read_bytes', models.PositiveBigIntegerField(blank=True, help_text='Bytes read from storage since process start (None == not available)', null=True)),
+                ('write_bytes', models.PositiveBigIntegerField(blank=True, help_text='Bytes written to storage since process start (None == not available)', null=True)),
+            ],
+            options={
+                'verbose_name': 'Process samples',
+                'verbose_name_plural': 'Process samples',
+                'ordering': ('-sample_time',),
+            },
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 3.2.25 on 2026-10-19 15:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_processinfo', '0009_processsample'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HostSample',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sample_time', models.DateTimeField(db_index=True, help_text='Time of the sample')),
+                ('cpu_user', models.PositiveIntegerField(help_text='CPU time in user mode (incl. nice) since the previous sample (jiffies)')),
+                ('cpu_system', models.PositiveIntegerField(help_text='CPU time in system mode (incl. irq) since the previous sample (jiffies)')),
+                ('cpu_iowait', models.PositiveIntegerField(help_text='CPU time waiting for I/O since the previous sample (jiffies)')),
+                ('cpu_steal', models.PositiveIntegerField(help_text='CPU time stolen by the hypervisor since the previous sample (jiffies)')),
+                ('cpu_idle', models.PositiveIntegerField(help_text='CPU idle time since the previous sample (jiffies)')),
+                ('mem_used', models.PositiveBigIntegerField(help_text='Used memory (without buffers/cache) in Bytes')),
+                ('swap_used', models.PositiveBigIntegerField(help_text='Used swap in Bytes')),
+                ('load_1', models.FloatField(help_text='load average (1 min)')),
+                ('load_5', models.FloatField(help_text='load average (5 min)')),
+                ('load_15', models.FloatField(help_text='load average (15 min)')),
+                ('psi_cpu_some', models.FloatField(blank=True, help_text='Percentage of time some tasks stalled on CPU (10 sec. average)', null=True)),
+                ('psi_memory_some', models.FloatField(blank=True, help_text='Percentage of time some tasks stalled on memory (10 sec. average)', null=True)),
+                ('psi_memory_full', models.FloatField(blank=True, help_text='Percentage of time all tasks stalled on memory (10 sec. average)', null=True)),
+                ('psi_io_some', models.FloatField(blank=True, help_text='Percentage of time some tasks stalled on I/O (10 sec. average)', null=True)),
+                ('psi_io_full', models.FloatField(blank=True, help_text='Percentage of time all tasks stalled on I/O (10 sec. average)', null=True)),
+            ],
+            options={
+                'verbose_name': 'Host samples',
+                'verbose_name_plural': 'Host samples',
+                'ordering': ('-sample_time',),
+            },
+        ),
+    ]
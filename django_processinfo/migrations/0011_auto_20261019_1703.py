@@ -0,0 +1,48 @@
+# Generated by Django 3.2.25 on 2026-10-19 15:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_processinfo', '0010_hostsample'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='processinfo',
+            name='private_dirty',
+            field=models.PositiveBigIntegerField(blank=True, help_text='Last private dirty memory in Bytes', null=True),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='pss_avg',
+            field=models.PositiveBigIntegerField(default=0, help_text='Average Proportional set size (PSS) in Bytes'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='pss_count',
+            field=models.PositiveIntegerField(default=0, help_text='Number of PSS readings (0 == not available)'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='pss_max',
+            field=models.PositiveBigIntegerField(default=0, help_text='Maximum Proportional set size (PSS) in Bytes'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='pss_min',
+            field=models.PositiveBigIntegerField(default=0, help_text='Minimum Proportional set size (PSS) in Bytes'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='shared_clean',
+            field=models.PositiveBigIntegerField(blank=True, help_text='Last shared clean memory (e.g. copy-on-write pages of the parent) in Bytes', null=True),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='uss',
+            field=models.PositiveBigIntegerField(blank=True, help_text='Last Unique set size (USS - private clean + private dirty) in Bytes', null=True),
+        ),
+    ]
@@ -0,0 +1,263 @@
+# Generated by Django 3.2.25 on 2026-10-19 15:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_processinfo', '0011_auto_20261019_1703'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='processinfo',
+            name='io_count',
+            field=models.PositiveIntegerField(default=0, help_text='Number of requests with I/O information.'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='io_rchar_avg',
+            field=models.FloatField(default=0, help_text='Average bytes read via syscalls (rchar, incl. sockets) per request'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='io_rchar_max',
+            field=models.PositiveBigIntegerField(default=0, help_text='Maximum bytes read via syscalls (rchar, incl. sockets) per request'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='io_rchar_min',
+            field=models.PositiveBigIntegerField(default=0, help_text='Minimum bytes read via syscalls (rchar, incl. sockets) per request'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='io_rchar_sum',
+            field=models.PositiveBigIntegerField(default=0, help_text='Total bytes read via syscalls (rchar, incl. sockets)'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='io_read_bytes_avg',
+            field=models.FloatField(default=0, help_text='Average bytes read from storage (read_bytes) per request'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='io_read_bytes_max',
+            field=models.PositiveBigIntegerField(default=0, help_text='Maximum bytes read from storage (read_bytes) per request'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='io_read_bytes_min',
+            field=models.PositiveBigIntegerField(default=0, help_text='Minimum bytes read from storage (read_bytes) per request'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='io_read_bytes_sum',
+            field=models.PositiveBigIntegerField(default=0, help_text='Total bytes read from storage (read_bytes)'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='io_syscr_avg',
+            field=models.FloatField(default=0, help_text='Average read syscalls (syscr) per request'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='io_syscr_max',
+            field=models.PositiveBigIntegerField(default=0, help_text='Maximum read syscalls (syscr) per request'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='io_syscr_min',
+            field=models.PositiveBigIntegerField(default=0, help_text='Minimum read syscalls (syscr) per request'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='io_syscr_sum',
+            field=models.PositiveBigIntegerField(default=0, help_text='Total read syscalls (syscr)'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='io_syscw_avg',
+            field=models.FloatField(default=0, help_text='Average write syscalls (syscw) per request'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='io_syscw_max',
+            field=models.PositiveBigIntegerField(default=0, help_text='Maximum write syscalls (syscw) per request'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='io_syscw_min',
+            field=models.PositiveBigIntegerField(default=0, help_text='Minimum write syscalls (syscw) per request'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='io_syscw_sum',
+            field=models.PositiveBigIntegerField(default=0, help_text='Total write syscalls (syscw)'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='io_wchar_avg',
+            field=models.FloatField(default=0, help_text='Average bytes written via syscalls (wchar, incl. sockets) per request'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='io_wchar_max',
+            field=models.PositiveBigIntegerField(default=0, help_text='Maximum bytes written via syscalls (wchar, incl. sockets) per request'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='io_wchar_min',
+            field=models.PositiveBigIntegerField(default=0, help_text='Minimum bytes written via syscalls (wchar, incl. sockets) per request'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='io_wchar_sum',
+            field=models.PositiveBigIntegerField(default=0, help_text='Total bytes written via syscalls (wchar, incl. sockets)'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='io_write_bytes_avg',
+            field=models.FloatField(default=0, help_text='Average bytes written to storage (write_bytes) per request'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='io_write_bytes_max',
+            field=models.PositiveBigIntegerField(default=0, help_text='Maximum bytes written to storage (write_bytes) per request'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='io_write_bytes_min',
+            field=models.PositiveBigIntegerField(default=0, help_text='Minimum bytes written to storage (write_bytes) per request'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='io_write_bytes_sum',
+            field=models.PositiveBigIntegerField(default=0, help_text='Total bytes written to storage (write_bytes)'),
+        ),
+        migrations.AddField(
+            model_name='viewstatistics',
+            name='io_count',
+            field=models.PositiveIntegerField(default=0, help_text='Number of requests with I/O information.'),
+        ),
+        migrations.AddField(
+            model_name='viewstatistics',
+            name='io_rchar_avg',
+            field=models.FloatField(default=0, help_text='Average bytes read via syscalls (rchar, incl. sockets) per request'),
+        ),
+        migrations.AddField(
+            model_name='viewstatistics',
+            name='io_rchar_max',
+            field=models.PositiveBigIntegerField(default=0, help_text='Maximum bytes read via syscalls (rchar, incl. sockets) per request'),
+        ),
+        migrations.AddField(
+            model_name='viewstatistics',
+            name='io_rchar_min',
+            field=models.PositiveBigIntegerField(default=0, help_text='Minimum bytes read via syscalls (rchar, incl. sockets) per request'),
+        ),
+        migrations.AddField(
+            model_name='viewstatistics',
+            name='io_rchar_sum',
+            field=models.PositiveBigIntegerField(default=0, help_text='Total bytes read via syscalls (rchar, incl. sockets)'),
+        ),
+        migrations.AddField(
+            model_name='viewstatistics',
+            name='io_read_bytes_avg',
+            field=models.FloatField(default=0, help_text='Average bytes read from storage (read_bytes) per request'),
+        ),
+        migrations.AddField(
+            model_name='viewstatistics',
+            name='io_read_bytes_max',
+            field=models.PositiveBigIntegerField(default=0, help_text='Maximum bytes read from storage (read_bytes) per request'),
+        ),
+        migrations.AddField(
+            model_name='viewstatistics',
+            name='io_read_bytes_min',
+            field=models.PositiveBigIntegerField(default=0, help_text='Minimum bytes read from storage (read_bytes) per request'),
+        ),
+        migrations.AddField(
+            model_name='viewstatistics',
+            name='io_read_bytes_sum',
+            field=models.PositiveBigIntegerField(default=0, help_text='Total bytes read from storage (read_bytes)'),
+        ),
+        migrations.AddField(
+            model_name='viewstatistics',
+            name='io_syscr_avg',
+            field=models.FloatField(default=0, help_text='Average read syscalls (syscr) per request'),
+        ),
+        migrations.AddField(
+            model_name='viewstatistics',
+            name='io_syscr_max',
+            field=models.PositiveBigIntegerField(default=0, help_text='Maximum read syscalls (syscr) per request'),
+        ),
+        migrations.AddField(
+            model_name='viewstatistics',
+            name='io_syscr_min',
+            field=models.PositiveBigIntegerField(default=0, help_text='Minimum read syscalls (syscr) per request'),
+        ),
+        migrations.AddField(
+            model_name='viewstatistics',
+            name='io_syscr_sum',
+            field=models.PositiveBigIntegerField(default=0, help_text='Total read syscalls (syscr)'),
+        ),
+        migrations.AddField(
+            model_name='viewstatistics',
+            name='io_syscw_avg',
+            field=models.FloatField(default=0, help_text='Average write syscalls (syscw) per request'),
+        ),
+        migrations.AddField(
+            model_name='viewstatistics',
+            name='io_syscw_max',
+            field=models.PositiveBigIntegerField(default=0, help_text='Maximum write syscalls (syscw) per request'),
+        ),
+        migrations.AddField(
+            model_name='viewstatistics',
+            name='io_syscw_min',
+            field=models.PositiveBigIntegerField(default=0, help_text='Minimum write syscalls (syscw) per request'),
+        ),
+        migrations.AddField(
+            model_name='viewstatistics',
+            name='io_syscw_sum',
+            field=models.PositiveBigIntegerField(default=0, help_text='Total write syscalls (syscw)'),
+        ),
+        migrations.AddField(
+            model_name='viewstatistics',
+            name='io_wchar_avg',
+            field=models.FloatField(default=0, help_text='Average bytes written via syscalls (wchar, incl. sockets) per request'),
+        ),
+        migrations.AddField(
+            model_name='viewstatistics',
+            name='io_wchar_max',
+            field=models.PositiveBigIntegerField(default=0, help_text='Maximum bytes written via syscalls (wchar, incl. sockets) per request'),
+        ),
+        migrations.AddField(
+            model_name='viewstatistics',
+            name='io_wchar_min',
+            field=models.PositiveBigIntegerField(default=0, help_text='Minimum bytes written via syscalls (wchar, incl. sockets) per request'),
+        ),
+        migrations.AddField(
+            model_name='viewstatistics',
+            name='io_wchar_sum',
+            field=models.PositiveBigIntegerField(default=0, help_text='Total bytes written via syscalls (wchar, incl. sockets)'),
+        ),
+        migrations.AddField(
+            model_name='viewstatistics',
+            name='io_write_bytes_avg',
+            field=models.FloatField(default=0, help_text='Average bytes written to storage (write_bytes) per request'),
+        ),
+        migrations.AddField(
+            model_name='viewstatistics',
+            name='io_write_bytes_max',
+            field=models.PositiveBigIntegerField(default=0, help_text='Maximum bytes written to storage (write_bytes) per request'),
+        ),
+        migrations.AddField(
+            model_name='viewstatistics',
+            name='io_write_bytes_min',
+            field=models.PositiveBigIntegerField(default=0, help_text='Minimum bytes written to storage (write_bytes) per request'),
+        ),
+        migrations.AddField(
+            model_name='viewstatistics',
+            name='io_write_bytes_sum',
+            field=models.PositiveBigIntegerField(default=0, help_text='Total bytes written to storage (write_bytes)'),
+        ),
+    ]
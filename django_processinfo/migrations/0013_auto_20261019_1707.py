@@ -0,0 +1,83 @@
+# Generated by Django 3.2.25 on 2026-10-19 15:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_processinfo', '0012_auto_20261019_1705'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='processinfo',
+            name='gc_count_0',
+            field=models.PositiveIntegerField(default=0, help_text='Number of generation 0 garbage collections while processing requests.'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='gc_count_1',
+            field=models.PositiveIntegerField(default=0, help_text='Number of generation 1 garbage collections while processing requests.'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='gc_count_2',
+            field=models.PositiveIntegerField(default=0, help_text='Number of generation 2 garbage collections while processing requests.'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='gc_time_0',
+            field=models.FloatField(default=0, help_text='Total pause time of generation 0 garbage collections.'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='gc_time_1',
+            field=models.FloatField(default=0, help_text='Total pause time of generation 1 garbage collections.'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='gc_time_2',
+            field=models.FloatField(default=0, help_text='Total pause time of generation 2 garbage collections.'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='gc_time_max',
+            field=models.FloatField(default=0, help_text='Maximum garbage collection pause time of one request.'),
+        ),
+        migrations.AddField(
+            model_name='viewstatistics',
+            name='gc_count_0',
+            field=models.PositiveIntegerField(default=0, help_text='Number of generation 0 garbage collections while processing requests.'),
+        ),
+        migrations.AddField(
+            model_name='viewstatistics',
+            name='gc_count_1',
+            field=models.PositiveIntegerField(default=0, help_text='Number of generation 1 garbage collections while processing requests.'),
+        ),
+        migrations.AddField(
+            model_name='viewstatistics',
+            name='gc_count_2',
+            field=models.PositiveIntegerField(default=0, help_text='Number of generation 2 garbage collections while processing requests.'),
+        ),
+        migrations.AddField(
+            model_name='viewstatistics',
+            name='gc_time_0',
+            field=models.FloatField(default=0, help_text='Total pause time of generation 0 garbage collections.'),
+        ),
+        migrations.AddField(
+            model_name='viewstatistics',
+            name='gc_time_1',
+            field=models.FloatField(default=0, help_text='Total pause time of generation 1 garbage collections.'),
+        ),
+        migrations.AddField(
+            model_name='viewstatistics',
+            name='gc_time_2',
+            field=models.FloatField(default=0, help_text='Total pause time of generation 2 garbage collections.'),
+        ),
+        migrations.AddField(
+            model_name='viewstatistics',
+            name='gc_time_max',
+            field=models.FloatField(default=0, help_text='Maximum garbage collection pause time of one request.'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 3.2.25 on 2026-10-19 15:13
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sites', '0002_alter_domain_unique'),
+        ('django_processinfo', '0013_auto_20261019_1707'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QueryFingerprint',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('start_time', models.DateTimeField(auto_now_add=True, help_text='Create time')),
+                ('lastupdate_time', models.DateTimeField(auto_now=True, help_text='Time of the last change.')),
+                ('view_name', models.CharField(help_text='request.resolver_match.view_name', max_length=255)),
+                ('fingerprint', models.CharField(help_text='MD5 hash of the normalized SQL', max_length=32)),
+                ('sql', models.TextField(help_text="The normalized SQL query: Literals and parameters are replaced by '?'")),
+                ('request_count', models.PositiveIntegerField(default=0, help_text='Number of requests that executed this query', verbose_name='Requests')),
+                ('execution_count', models.PositiveIntegerField(default=0, help_text='Total number of executions', verbose_name='Executions')),
+                ('execution_max', models.PositiveIntegerField(default=0, help_text='Maximum number of executions in one request')),
+                ('n_plus_one_count', models.PositiveIntegerField(default=0, help_text='Number of requests that executed this query more than settings.PROCESSINFO.N_PLUS_ONE_THRESHOLD times (likely a N+1 problem)', verbose_name='N+1 requests')),
+                ('time_max', models.FloatField(default=0, help_text='Maximum time of one execution')),
+                ('time_sum', models.FloatField(default=0, help_text='Total time of all executions')),
+                ('site', models.ForeignKey(db_constraint=False, default=1, help_text='settings.SITE_ID', on_delete=django.db.models.deletion.CASCADE, to='sites.site')),
+            ],
+            options={
+                'verbose_name': 'Query fingerprints',
+                'verbose_name_plural': 'Query fingerprints',
+                'ordering': ('-time_sum',),
+                'unique_together': {('site', 'view_name', 'fingerprint')},
+            },
+        ),
+    ]
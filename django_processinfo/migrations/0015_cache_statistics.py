@@ -0,0 +1,83 @@
+# Generated by Django 3.2.25 on 2026-10-19 15:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_processinfo', '0014_queryfingerprint'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='processinfo',
+            name='cache_count',
+            field=models.PositiveIntegerField(default=0, help_text='Number of requests with cache accounting.'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='cache_deletes',
+            field=models.PositiveBigIntegerField(default=0, help_text='Total number of cache deletes (delete/delete_many/clear).'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='cache_hits',
+            field=models.PositiveBigIntegerField(default=0, help_text='Total number of cache hits (get/get_many/has_key per key).'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='cache_misses',
+            field=models.PositiveBigIntegerField(default=0, help_text='Total number of cache misses (get/get_many/has_key per key).'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='cache_sets',
+            field=models.PositiveBigIntegerField(default=0, help_text='Total number of cache writes (set/add/set_many/touch/incr/decr).'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='cache_time_max',
+            field=models.FloatField(default=0, help_text='Maximum time spent in the cache backends in one request.'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='cache_time_sum',
+            field=models.FloatField(default=0, help_text='Total time spent in the cache backends.'),
+        ),
+        migrations.AddField(
+            model_name='viewstatistics',
+            name='cache_count',
+            field=models.PositiveIntegerField(default=0, help_text='Number of requests with cache accounting.'),
+        ),
+        migrations.AddField(
+            model_name='viewstatistics',
+            name='cache_deletes',
+            field=models.PositiveBigIntegerField(default=0, help_text='Total number of cache deletes (delete/delete_many/clear).'),
+        ),
+        migrations.AddField(
+            model_name='viewstatistics',
+            name='cache_hits',
+            field=models.PositiveBigIntegerField(default=0, help_text='Total number of cache hits (get/get_many/has_key per key).'),
+        ),
+        migrations.AddField(
+            model_name='viewstatistics',
+            name='cache_misses',
+            field=models.PositiveBigIntegerField(default=0, help_text='Total number of cache misses (get/get_many/has_key per key).'),
+        ),
+        migrations.AddField(
+            model_name='viewstatistics',
+            name='cache_sets',
+            field=models.PositiveBigIntegerField(default=0, help_text='Total number of cache writes (set/add/set_many/touch/incr/decr).'),
+        ),
+        migrations.AddField(
+            model_name='viewstatistics',
+            name='cache_time_max',
+            field=models.FloatField(default=0, help_text='Maximum time spent in the cache backends in one request.'),
+        ),
+        migrations.AddField(
+            model_name='viewstatistics',
+            name='cache_time_sum',
+            field=models.FloatField(default=0, help_text='Total time spent in the cache backends.'),
+        ),
+    ]
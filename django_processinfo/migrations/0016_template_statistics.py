@@ -0,0 +1,51 @@
+# Generated by Django 3.2.25 on 2026-10-19 15:18
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sites', '0002_alter_domain_unique'),
+        ('django_processinfo', '0015_cache_statistics'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='viewstatistics',
+            name='template_count',
+            field=models.PositiveIntegerField(default=0, help_text='Number of requests with template timing, see: settings.PROCESSINFO.TEMPLATE_TIMING'),
+        ),
+        migrations.AddField(
+            model_name='viewstatistics',
+            name='template_time_max',
+            field=models.FloatField(default=0, help_text='Maximum template render time of one request.'),
+        ),
+        migrations.AddField(
+            model_name='viewstatistics',
+            name='template_time_sum',
+            field=models.FloatField(default=0, help_text='Total template render time.'),
+        ),
+        migrations.CreateModel(
+            name='TemplateStatistics',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('start_time', models.DateTimeField(auto_now_add=True, help_text='Create time')),
+                ('lastupdate_time', models.DateTimeField(auto_now=True, help_text='Time of the last change.')),
+                ('view_name', models.CharField(help_text='request.resolver_match.view_name', max_length=255)),
+                ('template_name', models.CharField(help_text="Name of the template (e.g.: 'admin/change_list.html')", max_length=255)),
+                ('request_count', models.PositiveIntegerField(default=0, help_text='Number of requests that rendered this template', verbose_name='Requests')),
+                ('render_count', models.PositiveIntegerField(default=0, help_text='Total number of renderings (e.g. {% include %} in a loop)', verbose_name='Renders')),
+                ('time_max', models.FloatField(default=0, help_text='Maximum render time in one request')),
+                ('time_sum', models.FloatField(default=0, help_text='Total render time (without the time of included templates)')),
+                ('site', models.ForeignKey(db_constraint=False, default=1, help_text='settings.SITE_ID', on_delete=django.db.models.deletion.CASCADE, to='sites.site')),
+            ],
+            options={
+                'verbose_name': 'Template statistics',
+                'verbose_name_plural': 'Template statistics',
+                'ordering': ('-time_sum',),
+                'unique_together': {('site', 'view_name', 'template_name')},
+            },
+        ),
+    ]
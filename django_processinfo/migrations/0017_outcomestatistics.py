@@ -0,0 +1,38 @@
+# Generated by Django 3.2.25 on 2026-10-19 15:20
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sites', '0002_alter_domain_unique'),
+        ('django_processinfo', '0016_template_statistics'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutcomeStatistics',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('start_time', models.DateTimeField(auto_now_add=True, help_text='Create time')),
+                ('lastupdate_time', models.DateTimeField(auto_now=True, help_text='Time of the last change.')),
+                ('view_name', models.CharField(help_text='request.resolver_match.view_name', max_length=255)),
+                ('outcome_type', models.CharField(choices=[('status', 'Status class'), ('exception', 'Exception class')], max_length=16)),
+                ('outcome', models.CharField(help_text="Status class (e.g.: '2xx' or '304') or the exception class name", max_length=255)),
+                ('request_count', models.PositiveIntegerField(default=0, verbose_name='Requests')),
+                ('response_time_min', models.FloatField(default=0, help_text='Minimum processing time.')),
+                ('response_time_max', models.FloatField(default=0, help_text='Maximum processing time.')),
+                ('response_time_avg', models.FloatField(default=0, help_text='Average processing time.')),
+                ('response_time_sum', models.FloatField(default=0, help_text='Total processing time.')),
+                ('site', models.ForeignKey(db_constraint=False, default=1, help_text='settings.SITE_ID', on_delete=django.db.models.deletion.CASCADE, to='sites.site')),
+            ],
+            options={
+                'verbose_name': 'Outcome statistics',
+                'verbose_name_plural': 'Outcome statistics',
+                'ordering': ('view_name', 'outcome_type', 'outcome'),
+                'unique_together': {('site', 'view_name', 'outcome_type', 'outcome')},
+            },
+        ),
+    ]
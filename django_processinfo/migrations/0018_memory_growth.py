@@ -0,0 +1,108 @@
+# Generated by Django 3.2.25 on 2026-10-19 15:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_processinfo', '0017_outcomestatistics'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='processinfo',
+            name='fds',
+            field=models.PositiveIntegerField(blank=True, help_text='Number of open file descriptors (from /proc/$$/fd) in the last request', null=True),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='fds_max',
+            field=models.PositiveIntegerField(default=0, help_text='Maximum number of open file descriptors'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='growth_count',
+            field=models.PositiveIntegerField(default=0, help_text='Number of data points (requests after settings.PROCESSINFO.GROWTH_WARMUP_REQUESTS)'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='growth_fds_m2',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='growth_fds_mean',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='growth_fds_requests_co',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='growth_fds_uptime_co',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='growth_requests_m2',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='growth_requests_mean',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='growth_rss_m2',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='growth_rss_mean',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='growth_rss_requests_co',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='growth_rss_uptime_co',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='growth_threads_m2',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='growth_threads_mean',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='growth_threads_requests_co',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='growth_threads_uptime_co',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='growth_uptime_m2',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='growth_uptime_mean',
+            field=models.FloatField(default=0),
+        ),
+    ]
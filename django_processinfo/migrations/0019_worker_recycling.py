@@ -0,0 +1,23 @@
+# Generated by Django 3.2.25 on 2026-10-19 15:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_processinfo', '0018_memory_growth'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='processinfo',
+            name='recycle_reason',
+            field=models.CharField(blank=True, help_text='Why the process was recycled by django-processinfo, see: recycle.py', max_length=255),
+        ),
+        migrations.AddField(
+            model_name='sitestatistics',
+            name='process_recycled',
+            field=models.PositiveIntegerField(default=0, help_text='Number of processes recycled by django-processinfo, see: recycle.py'),
+        ),
+    ]
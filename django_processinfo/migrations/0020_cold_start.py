@@ -0,0 +1,55 @@
+# Generated by Django 3.2.25 on 2026-10-19 15:28
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sites', '0002_alter_domain_unique'),
+        ('django_processinfo', '0019_worker_recycling'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='processinfo',
+            name='first_response_time',
+            field=models.FloatField(blank=True, help_text='Processing time of the first request.', null=True),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='startup_time',
+            field=models.FloatField(blank=True, help_text='Seconds from the process spawn until the application was ready (0 if forked after the application was loaded, e.g.: gunicorn --preload)', null=True),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='warmup_count',
+            field=models.PositiveSmallIntegerField(default=0, help_text='Number of warm-up requests, see: settings.PROCESSINFO.WARMUP_REQUESTS'),
+        ),
+        migrations.AddField(
+            model_name='processinfo',
+            name='warmup_response_time_sum',
+            field=models.FloatField(default=0, help_text='Total processing time of the warm-up requests.'),
+        ),
+        migrations.CreateModel(
+            name='WarmupStatistics',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('start_time', models.DateTimeField(auto_now_add=True, help_text='Create time')),
+                ('lastupdate_time', models.DateTimeField(auto_now=True, help_text='Time of the last change.')),
+                ('request_no', models.PositiveSmallIntegerField(help_text='Number of the request in the process: 1 == first request')),
+                ('process_count', models.PositiveIntegerField(default=0, verbose_name='Processes')),
+                ('response_time_min', models.FloatField(default=0, help_text='Minimum processing time.')),
+                ('response_time_max', models.FloatField(default=0, help_text='Maximum processing time.')),
+                ('response_time_avg', models.FloatField(default=0, help_text='Average processing time.')),
+                ('site', models.ForeignKey(db_constraint=False, default=1, help_text='settings.SITE_ID', on_delete=django.db.models.deletion.CASCADE, to='sites.site')),
+            ],
+            options={
+                'verbose_name': 'Warm-up statistics',
+                'verbose_name_plural': 'Warm-up statistics',
+                'ordering': ('site', 'request_no'),
+                'unique_together': {('site', 'request_no')},
+            },
+        ),
+    ]
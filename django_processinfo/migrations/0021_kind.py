@@ -0,0 +1,33 @@
+# Generated by Django 3.2.25 on 2026-10-19 15:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sites', '0002_alter_domain_unique'),
+        ('django_processinfo', '0020_cold_start'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='processinfo',
+            name='kind',
+            field=models.CharField(choices=[('request', 'Request'), ('task', 'Task'), ('command', 'Command')], default='request', help_text='The kind of the first work measured in this process', max_length=16),
+        ),
+        migrations.AddField(
+            model_name='viewstatistics',
+            name='kind',
+            field=models.CharField(choices=[('request', 'Request'), ('task', 'Task'), ('command', 'Command')], default='request', max_length=16),
+        ),
+        migrations.AlterField(
+            model_name='viewstatistics',
+            name='view_name',
+            field=models.CharField(help_text='request.resolver_match.view_name or the task/command name', max_length=255),
+        ),
+        migrations.AlterUniqueTogether(
+            name='viewstatistics',
+            unique_together={('site', 'kind', 'view_name')},
+        ),
+    ]
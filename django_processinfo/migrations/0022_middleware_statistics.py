@@ -0,0 +1,37 @@
+# Generated by Django 3.2.25 on 2026-10-19 15:40
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sites', '0002_alter_domain_unique'),
+        ('django_processinfo', '0021_kind'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MiddlewareStatistics',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('start_time', models.DateTimeField(auto_now_add=True, help_text='Create time')),
+                ('lastupdate_time', models.DateTimeField(auto_now=True, help_text='Time of the last change.')),
+                ('pid', models.PositiveIntegerField(help_text='Process ID')),
+                ('middleware', models.CharField(help_text="Path of the middleware class or '<view>' for the view handling", max_length=255)),
+                ('request_count', models.PositiveIntegerField(default=0, verbose_name='Requests')),
+                ('inclusive_time_sum', models.FloatField(default=0, help_text='Total time with the inner middlewares and the view')),
+                ('inclusive_time_max', models.FloatField(default=0, help_text='Maximum time with the inner middlewares and the view in one request')),
+                ('exclusive_time_sum', models.FloatField(default=0, help_text='Total time of only this middleware')),
+                ('exclusive_time_max', models.FloatField(default=0, help_text='Maximum time of only this middleware in one request')),
+                ('site', models.ForeignKey(db_constraint=False, default=1, help_text='settings.SITE_ID', on_delete=django.db.models.deletion.CASCADE, to='sites.site')),
+            ],
+            options={
+                'verbose_name': 'Middleware statistics',
+                'verbose_name_plural': 'Middleware statistics',
+                'ordering': ('-exclusive_time_sum',),
+                'unique_together': {('site', 'pid', 'middleware')},
+            },
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 3.2.25 on 2026-10-19 15:43
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sites', '0002_alter_domain_unique'),
+        ('django_processinfo', '0022_middleware_statistics'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ConnectionStatistics',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('start_time', models.DateTimeField(auto_now_add=True, help_text='Create time')),
+                ('lastupdate_time', models.DateTimeField(auto_now=True, help_text='Time of the last change.')),
+                ('pid', models.PositiveIntegerField(help_text='Process ID')),
+                ('alias', models.CharField(help_text='Database alias from settings.DATABASES', max_length=100)),
+                ('vendor', models.CharField(help_text="Database vendor, e.g.: 'postgresql'", max_length=100)),
+                ('connect_count', models.PositiveIntegerField(default=0, help_text='Number of new database connections', verbose_name='Connects')),
+                ('connect_time_sum', models.FloatField(default=0, help_text='Total time to connect')),
+                ('connect_time_max', models.FloatField(default=0, help_text='Maximum time to connect')),
+                ('request_count', models.PositiveIntegerField(default=0, help_text='Number of requests that were served with a open connection', verbose_name='Requests')),
+                ('close_check_count', models.PositiveIntegerField(default=0, help_text='Number of close_old_connections() checks')),
+                ('close_check_time_sum', models.FloatField(default=0, help_text='Total time of the close_old_connections() checks')),
+                ('close_count', models.PositiveIntegerField(default=0, help_text='Number of connections closed by close_old_connections() (CONN_MAX_AGE or unusable)')),
+                ('site', models.ForeignKey(db_constraint=False, default=1, help_text='settings.SITE_ID', on_delete=django.db.models.deletion.CASCADE, to='sites.site')),
+            ],
+            options={
+                'verbose_name': 'Connection statistics',
+                'verbose_name_plural': 'Connection statistics',
+                'ordering': ('-connect_time_sum',),
+                'unique_together': {('site', 'pid', 'alias')},
+            },
+        ),
+    ]
@@ -11,9 +11,23 @@ import os
 from django.conf import settings
 from django.contrib.sites.models import Site
 from django.db import models
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from django_processinfo.utils.average import average
+from django_processinfo.utils.growth import get_r_squared, get_slope
+from django_processinfo.utils.load_average import LOAD_WINDOWS, decay
+
+
+# The kind of the measured work:
+KIND_REQUEST = "request"  # via ProcessInfoMiddleware
+KIND_TASK = "task"  # e.g.: task queue jobs, see: instrument.py
+KIND_COMMAND = "command"  # e.g.: management commands, cron jobs, see: instrument.py
+KIND_CHOICES = (
+    (KIND_REQUEST, _("Request")),
+    (KIND_TASK, _("Task")),
+    (KIND_COMMAND, _("Command")),
+)
 
 
 class BaseModel(models.Model):
@@ -24,6 +38,331 @@ class BaseModel(models.Model):
         abstract = True
 
 
+class QueueTimeModelMixin(models.Model):
+    """
+    Time between the proxy received the request and Django starts processing it.
+    Only available if the proxy sends e.g. a "X-Request-Start" header,
+    see: settings.PROCESSINFO.QUEUE_TIME_HEADERS
+    """
+    queue_time_count = models.PositiveIntegerField(
+        default=0,
+        help_text=_("Number of requests with queue time information.")
+    )
+    queue_time_min = models.FloatField(
+        default=0,
+        help_text=_("Minimum time waited in the request queue.")
+    )
+    queue_time_max = models.FloatField(
+        default=0,
+        help_text=_("Maximum time waited in the request queue.")
+    )
+    queue_time_avg = models.FloatField(
+        default=0,
+        help_text=_("Average time waited in the request queue.")
+    )
+    queue_time_sum = models.FloatField(
+        default=0,
+        help_text=_("Total time waited in the request queue.")
+    )
+
+    class Meta:
+        abstract = True
+
+
+class IOModelMixin(models.Model):
+    """
+    I/O of a request: Differences of the /proc/thread-self/io counters,
+    see: settings.PROCESSINFO.IO_ACCOUNTING
+    """
+    io_count = models.PositiveIntegerField(
+        default=0,
+        help_text=_("Number of requests with I/O information.")
+    )
+    io_rchar_min = models.PositiveBigIntegerField(
+        default=0,
+        help_text=_("Minimum bytes read via syscalls (rchar, incl. sockets) per request")
+    )
+    io_rchar_max = models.PositiveBigIntegerField(
+        default=0,
+        help_text=_("Maximum bytes read via syscalls (rchar, incl. sockets) per request")
+    )
+    io_rchar_avg = models.FloatField(
+        default=0,
+        help_text=_("Average bytes read via syscalls (rchar, incl. sockets) per request")
+    )
+    io_rchar_sum = models.PositiveBigIntegerField(
+        default=0,
+        help_text=_("Total bytes read via syscalls (rchar, incl. sockets)")
+    )
+    io_wchar_min = models.PositiveBigIntegerField(
+        default=0,
+        help_text=_("Minimum bytes written via syscalls (wchar, incl. sockets) per request")
+    )
+    io_wchar_max = models.PositiveBigIntegerField(
+        default=0,
+        help_text=_("Maximum bytes written via syscalls (wchar, incl. sockets) per request")
+    )
+    io_wchar_avg = models.FloatField(
+        default=0,
+        help_text=_("Average bytes written via syscalls (wchar, incl. sockets) per request")
+    )
+    io_wchar_sum = models.PositiveBigIntegerField(
+        default=0,
+        help_text=_("Total bytes written via syscalls (wchar, incl. sockets)")
+    )
+    io_syscr_min = models.PositiveBigIntegerField(
+        default=0,
+        help_text=_("Minimum read syscalls (syscr) per request")
+    )
+    io_syscr_max = models.PositiveBigIntegerField(
+        default=0,
+        help_text=_("Maximum read syscalls (syscr) per request")
+    )
+    io_syscr_avg = models.FloatField(
+        default=0,
+        help_text=_("Average read syscalls (syscr) per request")
+    )
+    io_syscr_sum = models.PositiveBigIntegerField(
+        default=0,
+        help_text=_("Total read syscalls (syscr)")
+    )
+    io_syscw_min = models.PositiveBigIntegerField(
+        default=0,
+        help_text=_("Minimum write syscalls (syscw) per request")
+    )
+    io_syscw_max = models.PositiveBigIntegerField(
+        default=0,
+        help_text=_("Maximum write syscalls (syscw) per request")
+    )
+    io_syscw_avg = models.FloatField(
+        default=0,
+        help_text=_("Average write syscalls (syscw) per request")
+    )
+    io_syscw_sum = models.PositiveBigIntegerField(
+        default=0,
+        help_text=_("Total write syscalls (syscw)")
+    )
+    io_read_bytes_min = models.PositiveBigIntegerField(
+        default=0,
+        help_text=_("Minimum bytes read from storage (read_bytes) per request")
+    )
+    io_read_bytes_max = models.PositiveBigIntegerField(
+        default=0,
+        help_text=_("Maximum bytes read from storage (read_bytes) per request")
+    )
+    io_read_bytes_avg = models.FloatField(
+        default=0,
+        help_text=_("Average bytes read from storage (read_bytes) per request")
+    )
+    io_read_bytes_sum = models.PositiveBigIntegerField(
+        default=0,
+        help_text=_("Total bytes read from storage (read_bytes)")
+    )
+    io_write_bytes_min = models.PositiveBigIntegerField(
+        default=0,
+        help_text=_("Minimum bytes written to storage (write_bytes) per request")
+    )
+    io_write_bytes_max = models.PositiveBigIntegerField(
+        default=0,
+        help_text=_("Maximum bytes written to storage (write_bytes) per request")
+    )
+    io_write_bytes_avg = models.FloatField(
+        default=0,
+        help_text=_("Average bytes written to storage (write_bytes) per request")
+    )
+    io_write_bytes_sum = models.PositiveBigIntegerField(
+        default=0,
+        help_text=_("Total bytes written to storage (write_bytes)")
+    )
+
+    class Meta:
+        abstract = True
+
+
+class GCModelMixin(models.Model):
+    """
+    Garbage collector pauses while the requests are processed,
+    see: settings.PROCESSINFO.GC_ACCOUNTING
+    """
+    gc_count_0 = models.PositiveIntegerField(
+        default=0,
+        help_text=_("Number of generation 0 garbage collections while processing requests.")
+    )
+    gc_count_1 = models.PositiveIntegerField(
+        default=0,
+        help_text=_("Number of generation 1 garbage collections while processing requests.")
+    )
+    gc_count_2 = models.PositiveIntegerField(
+        default=0,
+        help_text=_("Number of generation 2 garbage collections while processing requests.")
+    )
+    gc_time_0 = models.FloatField(
+        default=0,
+        help_text=_("Total pause time of generation 0 garbage collections.")
+    )
+    gc_time_1 = models.FloatField(
+        default=0,
+        help_text=_("Total pause time of generation 1 garbage collections.")
+    )
+    gc_time_2 = models.FloatField(
+        default=0,
+        help_text=_("Total pause time of generation 2 garbage collections.")
+    )
+    gc_time_max = models.FloatField(
+        default=0,
+        help_text=_("Maximum garbage collection pause time of one request.")
+    )
+
+    def get_gc_time(self):
+        return self.gc_time_0 + self.gc_time_1 + self.gc_time_2
+
+    def get_gc_time_share(self):
+        """
+        Percentage of the response time spent in the garbage collector.
+        """
+        if not self.response_time_sum:
+            return 0
+        return self.get_gc_time() / self.response_time_sum * 100
+
+    class Meta:
+        abstract = True
+
+
+class CacheModelMixin(models.Model):
+    """
+    Usage of the Django cache backends while the requests are processed,
+    see: settings.PROCESSINFO.CACHE_INSTRUMENTATION
+    """
+    cache_count = models.PositiveIntegerField(
+        default=0,
+        help_text=_("Number of requests with cache accounting.")
+    )
+    cache_hits = models.PositiveBigIntegerField(
+        default=0,
+        help_text=_("Total number of cache hits (get/get_many/has_key per key).")
+    )
+    cache_misses = models.PositiveBigIntegerField(
+        default=0,
+        help_text=_("Total number of cache misses (get/get_many/has_key per key).")
+    )
+    cache_sets = models.PositiveBigIntegerField(
+        default=0,
+        help_text=_("Total number of cache writes (set/add/set_many/touch/incr/decr).")
+    )
+    cache_deletes = models.PositiveBigIntegerField(
+        default=0,
+        help_text=_("Total number of cache deletes (delete/delete_many/clear).")
+    )
+    cache_time_sum = models.FloatField(
+        default=0,
+        help_text=_("Total time spent in the cache backends.")
+    )
+    cache_time_max = models.FloatField(
+        default=0,
+        help_text=_("Maximum time spent in the cache backends in one request.")
+    )
+
+    def get_cache_hit_ratio(self):
+        """
+        Percentage of the cache lookups that are hits.
+        """
+        lookups = self.cache_hits + self.cache_misses
+        if not lookups:
+            return 0
+        return self.cache_hits / lookups * 100
+
+    def get_cache_time_share(self):
+        """
+        Percentage of the response time spent in the cache backends.
+        """
+        if not self.response_time_sum:
+            return 0
+        return self.cache_time_sum / self.response_time_sum * 100
+
+    class Meta:
+        abstract = True
+
+
+class GrowthModelMixin(models.Model):
+    """
+    Online least squares fit of the worker memory (VmRSS), open file descriptors
+    and threads against the handled requests and the uptime, to find memory leaks,
+    see: utils/growth.py
+    """
+    growth_count = models.PositiveIntegerField(
+        default=0,
+        help_text=_("Number of data points (requests after settings.PROCESSINFO.GROWTH_WARMUP_REQUESTS)")
+    )
+    growth_requests_mean = models.FloatField(default=0)
+    growth_requests_m2 = models.FloatField(default=0)
+    growth_uptime_mean = models.FloatField(default=0)
+    growth_uptime_m2 = models.FloatField(default=0)
+    growth_rss_mean = models.FloatField(default=0)
+    growth_rss_m2 = models.FloatField(default=0)
+    growth_rss_requests_co = models.FloatField(default=0)
+    growth_rss_uptime_co = models.FloatField(default=0)
+    growth_fds_mean = models.FloatField(default=0)
+    growth_fds_m2 = models.FloatField(default=0)
+    growth_fds_requests_co = models.FloatField(default=0)
+    growth_fds_uptime_co = models.FloatField(default=0)
+    growth_threads_mean = models.FloatField(default=0)
+    growth_threads_m2 = models.FloatField(default=0)
+    growth_threads_requests_co = models.FloatField(default=0)
+    growth_threads_uptime_co = models.FloatField(default=0)
+
+    fds = models.PositiveIntegerField(
+        null=True, blank=True,
+        help_text=_("Number of open file descriptors (from /proc/$$/fd) in the last request")
+    )
+    fds_max = models.PositiveIntegerField(
+        default=0,
+        help_text=_("Maximum number of open file descriptors")
+    )
+
+    def get_rss_per_request(self):
+        """
+        Memory growth in bytes per request
+        """
+        return get_slope(self, "growth", y_name="rss", x_name="requests")
+
+    def get_rss_per_hour(self):
+        """
+        Memory growth in bytes per hour of uptime
+        """
+        return get_slope(self, "growth", y_name="rss", x_name="uptime") * 3600
+
+    def get_fds_per_request(self):
+        return get_slope(self, "growth", y_name="fds", x_name="requests")
+
+    def get_threads_per_request(self):
+        return get_slope(self, "growth", y_name="threads", x_name="requests")
+
+    def is_leak_suspect(self):
+        """
+        Grows the memory steadily with every request?
+        """
+        if self.growth_count < settings.PROCESSINFO.LEAK_MIN_REQUESTS:
+            return False
+        if self.get_rss_per_request() < settings.PROCESSINFO.LEAK_THRESHOLD:
+            return False
+        r_squared = get_r_squared(self, "growth", y_name="rss", x_name="requests")
+        return r_squared >= settings.PROCESSINFO.LEAK_MIN_R_SQUARED
+
+    def get_suggested_max_requests(self):
+        """
+        gunicorn --max-requests value, so that a worker grows at most
+        settings.PROCESSINFO.LEAK_MEMORY_BUDGET bytes before it's restarted.
+        None if the memory doesn't grow.
+        """
+        rss_per_request = self.get_rss_per_request()
+        if rss_per_request <= 0:
+            return None
+        return max(int(settings.PROCESSINFO.LEAK_MEMORY_BUDGET / rss_per_request), 1)
+
+    class Meta:
+        abstract = True
+
+
 class SiteStatistics(BaseModel):
     """
     Overall statistics separated per settings.SITE_ID
@@ -31,6 +370,7 @@ class SiteStatistics(BaseModel):
     site = models.OneToOneField(
         Site, primary_key=True, db_index=True, default=settings.SITE_ID,
         on_delete=models.CASCADE,
+        db_constraint=False,  # Site may be stored in a other database, see: routers.py
         help_text=_("settings.SITE_ID")
     )
 
@@ -38,6 +378,10 @@ class SiteStatistics(BaseModel):
         default=1,
         help_text=_("Total number of processes spawend (approximated)")
     )
+    process_recycled = models.PositiveIntegerField(
+        default=0,
+        help_text=_("Number of processes recycled by django-processinfo, see: recycle.py")
+    )
     process_count_avg = models.FloatField(
         default=1.0,
         help_text=_("Average number of living processes. (approximated)")
@@ -113,7 +457,7 @@ class ProcessInfoManager(models.Manager):
         return living_pids
 
 
-class ProcessInfo(BaseModel):
+class ProcessInfo(GrowthModelMixin, CacheModelMixin, GCModelMixin, IOModelMixin, QueueTimeModelMixin, BaseModel):
     """
     Information about a running process.
     """
@@ -131,9 +475,38 @@ class ProcessInfo(BaseModel):
             " (We don't check the state in every request!)"
         )
     )
+    kind = models.CharField(
+        max_length=16, choices=KIND_CHOICES, default=KIND_REQUEST,
+        help_text=_("The kind of the first work measured in this process")
+    )
+    recycle_reason = models.CharField(
+        max_length=255, blank=True,
+        help_text=_("Why the process was recycled by django-processinfo, see: recycle.py")
+    )
+
+    startup_time = models.FloatField(
+        null=True, blank=True,
+        help_text=_(
+            "Seconds from the process spawn until the application was ready"
+            " (0 if forked after the application was loaded, e.g.: gunicorn --preload)"
+        )
+    )
+    first_response_time = models.FloatField(
+        null=True, blank=True,
+        help_text=_("Processing time of the first request.")
+    )
+    warmup_count = models.PositiveSmallIntegerField(
+        default=0,
+        help_text=_("Number of warm-up requests, see: settings.PROCESSINFO.WARMUP_REQUESTS")
+    )
+    warmup_response_time_sum = models.FloatField(
+        default=0,
+        help_text=_("Total processing time of the warm-up requests.")
+    )
     site = models.ForeignKey(
         Site, default=settings.SITE_ID,
         on_delete=models.CASCADE,
+        db_constraint=False,  # Site may be stored in a other database, see: routers.py
         help_text=_("settings.SITE_ID")
     )
 
@@ -201,6 +574,81 @@ class ProcessInfo(BaseModel):
         help_text=_("Maximum system mode time")
     )
 
+    # Requests in progress at the same time in this process:
+
+    concurrency_min = models.PositiveSmallIntegerField(
+        default=1,
+        help_text=_("Minimum number of requests in progress (sampled at request start)")
+    )
+    concurrency_max = models.PositiveSmallIntegerField(
+        default=1,
+        help_text=_("Maximum number of requests in progress (sampled at request start)")
+    )
+    concurrency_avg = models.FloatField(
+        default=1,
+        help_text=_("Average number of requests in progress (sampled at request start)")
+    )
+    saturation = models.FloatField(
+        default=0,
+        help_text=_(
+            "Percentage of time with all threads busy (see: settings.PROCESSINFO.CONCURRENCY_LIMIT)"
+        )
+    )
+
+    # Current load: 1, 5 and 15 minute exponentially-damped moving averages
+    # (Updated with every saved request, see: utils/load_average.py)
+    request_rate_1 = models.FloatField(
+        default=0,
+        help_text=_("Requests per second (1 min. average)")
+    )
+    request_rate_5 = models.FloatField(
+        default=0,
+        help_text=_("Requests per second (5 min. average)")
+    )
+    request_rate_15 = models.FloatField(
+        default=0,
+        help_text=_("Requests per second (15 min. average)")
+    )
+
+    error_rate_1 = models.FloatField(
+        default=0,
+        help_text=_("Exceptions per second (1 min. average)")
+    )
+    error_rate_5 = models.FloatField(
+        default=0,
+        help_text=_("Exceptions per second (5 min. average)")
+    )
+    error_rate_15 = models.FloatField(
+        default=0,
+        help_text=_("Exceptions per second (15 min. average)")
+    )
+
+    cpu_load_1 = models.FloatField(
+        default=0,
+        help_text=_("Processor time per second (1 min. average)")
+    )
+    cpu_load_5 = models.FloatField(
+        default=0,
+        help_text=_("Processor time per second (5 min. average)")
+    )
+    cpu_load_15 = models.FloatField(
+        default=0,
+        help_text=_("Processor time per second (15 min. average)")
+    )
+
+    response_time_1 = models.FloatField(
+        default=0,
+        help_text=_("Response time (1 min. average)")
+    )
+    response_time_5 = models.FloatField(
+        default=0,
+        help_text=_("Response time (5 min. average)")
+    )
+    response_time_15 = models.FloatField(
+        default=0,
+        help_text=_("Response time (15 min. average)")
+    )
+
     # RAM consumption:
 
     vm_peak_min = models.PositiveIntegerField(
@@ -223,6 +671,588 @@ class ProcessInfo(BaseModel):
         help_text=_("Average Non-paged memory (VmRSS - Resident set size) in Bytes")
     )
 
+    # Shared memory aware values from /proc/$$/smaps_rollup,
+    # see: settings.PROCESSINFO.SMAPS_INTERVAL
+
+    pss_count = models.PositiveIntegerField(
+        default=0,
+        help_text=_("Number of PSS readings (0 == not available)")
+    )
+    pss_min = models.PositiveBigIntegerField(
+        default=0,
+        help_text=_("Minimum Proportional set size (PSS) in Bytes")
+    )
+    pss_max = models.PositiveBigIntegerField(
+        default=0,
+        help_text=_("Maximum Proportional set size (PSS) in Bytes")
+    )
+    pss_avg = models.PositiveBigIntegerField(
+        default=0,
+        help_text=_("Average Proportional set size (PSS) in Bytes")
+    )
+    uss = models.PositiveBigIntegerField(
+        null=True, blank=True,
+        help_text=_("Last Unique set size (USS - private clean + private dirty) in Bytes")
+    )
+    shared_clean = models.PositiveBigIntegerField(
+        null=True, blank=True,
+        help_text=_("Last shared clean memory (e.g. copy-on-write pages of the parent) in Bytes")
+    )
+    private_dirty = models.PositiveBigIntegerField(
+        null=True, blank=True,
+        help_text=_("Last private dirty memory in Bytes")
+    )
+
+    def get_steady_response_time_avg(self):
+        """
+        Average processing time without the warm-up requests
+        """
+        steady_count = self.request_count - self.warmup_count
+        if steady_count <= 0:
+            return None
+        return (self.response_time_sum - self.warmup_response_time_sum) / steady_count
+
+    def get_load_averages(self, prefix, now=None):
+        """
+        returns the 1, 5 and 15 minute averages, e.g.: prefix=="request_rate"
+        The rates will be decayed for the time since the last update.
+        """
+        averages = [getattr(self, f"{prefix}_{minutes}") for minutes in (1, 5, 15)]
+        if prefix == "response_time":
+            return averages
+
+        if now is None:
+            now = timezone.now()
+        elapsed = max((now - self.lastupdate_time).total_seconds(), 0)
+        return [decay(average, elapsed, window) for average, window in zip(averages, LOAD_WINDOWS)]
+
     class Meta:
         verbose_name_plural = verbose_name = "Process statistics"
         ordering = ("-lastupdate_time",)
+
+
+class ViewStatistics(CacheModelMixin, GCModelMixin, IOModelMixin, QueueTimeModelMixin, BaseModel):
+    """
+    Statistics separated per view (URL name or view function path)
+    """
+    site = models.ForeignKey(
+        Site, default=settings.SITE_ID,
+        on_delete=models.CASCADE,
+        db_constraint=False,  # Site may be stored in a other database, see: routers.py
+        help_text=_("settings.SITE_ID")
+    )
+    kind = models.CharField(
+        max_length=16, choices=KIND_CHOICES, default=KIND_REQUEST,
+    )
+    view_name = models.CharField(
+        max_length=255,
+        help_text=_("request.resolver_match.view_name or the task/command name")
+    )
+
+    request_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_("Requests"),
+        help_text=_("How many request answered since self.start_time")
+    )
+    exception_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_("Exceptions"),
+        help_text=_("How many requests led to a exception.")
+    )
+
+    response_time_min = models.FloatField(
+        default=0,
+        help_text=_("Minimum processing time.")
+    )
+    response_time_max = models.FloatField(
+        default=0,
+        help_text=_("Maximum processing time.")
+    )
+    response_time_avg = models.FloatField(
+        default=0,
+        help_text=_("Average processing time.")
+    )
+    response_time_sum = models.FloatField(
+        default=0,
+        help_text=_("Total processing time.")
+    )
+
+    template_count = models.PositiveIntegerField(
+        default=0,
+        help_text=_("Number of requests with template timing, see: settings.PROCESSINFO.TEMPLATE_TIMING")
+    )
+    template_time_sum = models.FloatField(
+        default=0,
+        help_text=_("Total template render time.")
+    )
+    template_time_max = models.FloatField(
+        default=0,
+        help_text=_("Maximum template render time of one request.")
+    )
+
+    def get_template_time_share(self):
+        """
+        Percentage of the response time spent in rendering templates.
+        """
+        if not self.response_time_sum:
+            return 0
+        return self.template_time_sum / self.response_time_sum * 100
+
+    def __str__(self):
+        return self.view_name
+
+    class Meta:
+        verbose_name_plural = verbose_name = "View statistics"
+        ordering = ("-lastupdate_time",)
+        unique_together = (("site", "kind", "view_name"),)
+
+
+class QueryFingerprint(BaseModel):
+    """
+    SQL queries (without literals/parameters) per view, see: settings.PROCESSINFO.SQL_FINGERPRINTS
+    """
+    site = models.ForeignKey(
+        Site, default=settings.SITE_ID,
+        on_delete=models.CASCADE,
+        db_constraint=False,  # Site may be stored in a other database, see: routers.py
+        help_text=_("settings.SITE_ID")
+    )
+    view_name = models.CharField(
+        max_length=255,
+        help_text=_("request.resolver_match.view_name")
+    )
+    fingerprint = models.CharField(
+        max_length=32,
+        help_text=_("MD5 hash of the normalized SQL")
+    )
+    sql = models.TextField(
+        help_text=_("The normalized SQL query: Literals and parameters are replaced by '?'")
+    )
+
+    request_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_("Requests"),
+        help_text=_("Number of requests that executed this query")
+    )
+    execution_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_("Executions"),
+        help_text=_("Total number of executions")
+    )
+    execution_max = models.PositiveIntegerField(
+        default=0,
+        help_text=_("Maximum number of executions in one request")
+    )
+    n_plus_one_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_("N+1 requests"),
+        help_text=_(
+            "Number of requests that executed this query more than"
+            " settings.PROCESSINFO.N_PLUS_ONE_THRESHOLD times (likely a N+1 problem)"
+        )
+    )
+    time_max = models.FloatField(
+        default=0,
+        help_text=_("Maximum time of one execution")
+    )
+    time_sum = models.FloatField(
+        default=0,
+        help_text=_("Total time of all executions")
+    )
+
+    def __str__(self):
+        return f"{self.view_name}: {self.sql[:50]}"
+
+    class Meta:
+        verbose_name_plural = verbose_name = "Query fingerprints"
+        ordering = ("-time_sum",)
+        unique_together = (("site", "view_name", "fingerprint"),)
+
+
+class WarmupStatistics(BaseModel):
+    """
+    Processing time of the first requests of the processes, aggregated per site.
+    see: settings.PROCESSINFO.WARMUP_REQUESTS
+    """
+    site = models.ForeignKey(
+        Site, default=settings.SITE_ID,
+        on_delete=models.CASCADE,
+        db_constraint=False,  # Site may be stored in a other database, see: routers.py
+        help_text=_("settings.SITE_ID")
+    )
+    request_no = models.PositiveSmallIntegerField(
+        help_text=_("Number of the request in the process: 1 == first request")
+    )
+    process_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_("Processes"),
+    )
+    response_time_min = models.FloatField(
+        default=0,
+        help_text=_("Minimum processing time.")
+    )
+    response_time_max = models.FloatField(
+        default=0,
+        help_text=_("Maximum processing time.")
+    )
+    response_time_avg = models.FloatField(
+        default=0,
+        help_text=_("Average processing time.")
+    )
+
+    def __str__(self):
+        return f"Warm-up request no. {self.request_no}"
+
+    class Meta:
+        verbose_name_plural = verbose_name = "Warm-up statistics"
+        ordering = ("site", "request_no")
+        unique_together = (("site", "request_no"),)
+
+
+class OutcomeStatistics(BaseModel):
+    """
+    Requests per view separated by response status class (2xx, 3xx, 304, 4xx, 5xx)
+    and by exception class, each with own response times.
+    """
+    OUTCOME_TYPE_STATUS = "status"
+    OUTCOME_TYPE_EXCEPTION = "exception"
+    OUTCOME_TYPE_CHOICES = (
+        (OUTCOME_TYPE_STATUS, _("Status class")),
+        (OUTCOME_TYPE_EXCEPTION, _("Exception class")),
+    )
+
+    site = models.ForeignKey(
+        Site, default=settings.SITE_ID,
+        on_delete=models.CASCADE,
+        db_constraint=False,  # Site may be stored in a other database, see: routers.py
+        help_text=_("settings.SITE_ID")
+    )
+    view_name = models.CharField(
+        max_length=255,
+        help_text=_("request.resolver_match.view_name")
+    )
+    outcome_type = models.CharField(
+        max_length=16,
+        choices=OUTCOME_TYPE_CHOICES,
+    )
+    outcome = models.CharField(
+        max_length=255,
+        help_text=_("Status class (e.g.: '2xx' or '304') or the exception class name")
+    )
+
+    request_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_("Requests"),
+    )
+    response_time_min = models.FloatField(
+        default=0,
+        help_text=_("Minimum processing time.")
+    )
+    response_time_max = models.FloatField(
+        default=0,
+        help_text=_("Maximum processing time.")
+    )
+    response_time_avg = models.FloatField(
+        default=0,
+        help_text=_("Average processing time.")
+    )
+    response_time_sum = models.FloatField(
+        default=0,
+        help_text=_("Total processing time.")
+    )
+
+    def __str__(self):
+        return f"{self.view_name}: {self.outcome}"
+
+    class Meta:
+        verbose_name_plural = verbose_name = "Outcome statistics"
+        ordering = ("view_name", "outcome_type", "outcome")
+        unique_together = (("site", "view_name", "outcome_type", "outcome"),)
+
+
+class TemplateStatistics(BaseModel):
+    """
+    Render time of the templates per view, see: settings.PROCESSINFO.TEMPLATE_TIMING
+    """
+    site = models.ForeignKey(
+        Site, default=settings.SITE_ID,
+        on_delete=models.CASCADE,
+        db_constraint=False,  # Site may be stored in a other database, see: routers.py
+        help_text=_("settings.SITE_ID")
+    )
+    view_name = models.CharField(
+        max_length=255,
+        help_text=_("request.resolver_match.view_name")
+    )
+    template_name = models.CharField(
+        max_length=255,
+        help_text=_("Name of the template (e.g.: 'admin/change_list.html')")
+    )
+
+    request_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_("Requests"),
+        help_text=_("Number of requests that rendered this template")
+    )
+    render_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_("Renders"),
+        help_text=_("Total number of renderings (e.g. {% include %} in a loop)")
+    )
+    time_max = models.FloatField(
+        default=0,
+        help_text=_("Maximum render time in one request")
+    )
+    time_sum = models.FloatField(
+        default=0,
+        help_text=_("Total render time (without the time of included templates)")
+    )
+
+    def __str__(self):
+        return f"{self.view_name}: {self.template_name}"
+
+    class Meta:
+        verbose_name_plural = verbose_name = "Template statistics"
+        ordering = ("-time_sum",)
+        unique_together = (("site", "view_name", "template_name"),)
+
+
+class MiddlewareStatistics(BaseModel):
+    """
+    Time of the middlewares per process, see: settings.PROCESSINFO.MIDDLEWARE_TIMING
+    """
+    site = models.ForeignKey(
+        Site, default=settings.SITE_ID,
+        on_delete=models.CASCADE,
+        db_constraint=False,  # Site may be stored in a other database, see: routers.py
+        help_text=_("settings.SITE_ID")
+    )
+    pid = models.PositiveIntegerField(
+        help_text=_("Process ID"),
+    )
+    middleware = models.CharField(
+        max_length=255,
+        help_text=_("Path of the middleware class or '<view>' for the view handling")
+    )
+
+    request_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_("Requests"),
+    )
+    inclusive_time_sum = models.FloatField(
+        default=0,
+        help_text=_("Total time with the inner middlewares and the view")
+    )
+    inclusive_time_max = models.FloatField(
+        default=0,
+        help_text=_("Maximum time with the inner middlewares and the view in one request")
+    )
+    exclusive_time_sum = models.FloatField(
+        default=0,
+        help_text=_("Total time of only this middleware")
+    )
+    exclusive_time_max = models.FloatField(
+        default=0,
+        help_text=_("Maximum time of only this middleware in one request")
+    )
+
+    def __str__(self):
+        return f"{self.pid}: {self.middleware}"
+
+    class Meta:
+        verbose_name_plural = verbose_name = "Middleware statistics"
+        ordering = ("-exclusive_time_sum",)
+        unique_together = (("site", "pid", "middleware"),)
+
+
+class ConnectionStatistics(BaseModel):
+    """
+    Database connection lifecycle per process, see: settings.PROCESSINFO.DB_CONNECTION_STATS
+    """
+    site = models.ForeignKey(
+        Site, default=settings.SITE_ID,
+        on_delete=models.CASCADE,
+        db_constraint=False,  # Site may be stored in a other database, see: routers.py
+        help_text=_("settings.SITE_ID")
+    )
+    pid = models.PositiveIntegerField(
+        help_text=_("Process ID"),
+    )
+    alias = models.CharField(
+        max_length=100,
+        help_text=_("Database alias from settings.DATABASES")
+    )
+    vendor = models.CharField(
+        max_length=100,
+        help_text=_("Database vendor, e.g.: 'postgresql'")
+    )
+
+    connect_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_("Connects"),
+        help_text=_("Number of new database connections")
+    )
+    connect_time_sum = models.FloatField(
+        default=0,
+        help_text=_("Total time to connect")
+    )
+    connect_time_max = models.FloatField(
+        default=0,
+        help_text=_("Maximum time to connect")
+    )
+    request_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_("Requests"),
+        help_text=_("Number of requests that were served with a open connection")
+    )
+    close_check_count = models.PositiveIntegerField(
+        default=0,
+        help_text=_("Number of close_old_connections() checks")
+    )
+    close_check_time_sum = models.FloatField(
+        default=0,
+        help_text=_("Total time of the close_old_connections() checks")
+    )
+    close_count = models.PositiveIntegerField(
+        default=0,
+        help_text=_("Number of connections closed by close_old_connections() (CONN_MAX_AGE or unusable)")
+    )
+
+    def get_requests_per_connection(self):
+        if not self.connect_count:
+            return None
+        return self.request_count / self.connect_count
+
+    def get_connect_time_avg(self):
+        if not self.connect_count:
+            return None
+        return self.connect_time_sum / self.connect_count
+
+    def __str__(self):
+        return f"{self.pid}: {self.alias}"
+
+    class Meta:
+        verbose_name_plural = verbose_name = "Connection statistics"
+        ordering = ("-connect_time_sum",)
+        unique_together = (("site", "pid", "alias"),)
+
+
+class ProcessSample(models.Model):
+    """
+    /proc information of a process, collected in the background, see: sampler.py
+    """
+    pid = models.PositiveIntegerField(
+        db_index=True,
+        help_text=_("process ID.")
+    )
+    sample_time = models.DateTimeField(
+        db_index=True,
+        help_text=_("Time of the sample")
+    )
+    memory = models.PositiveBigIntegerField(
+        help_text=_("Non-paged memory (VmRSS - Resident set size) in Bytes")
+    )
+    vm_peak = models.PositiveBigIntegerField(
+        help_text=_("Peak virtual memory size (VmPeak) in Bytes")
+    )
+    threads = models.PositiveSmallIntegerField(
+        help_text=_("Number of threads")
+    )
+    user_time = models.FloatField(
+        help_text=_("user mode time since process start")
+    )
+    system_time = models.FloatField(
+        help_text=_("system mode time since process start")
+    )
+    read_bytes = models.PositiveBigIntegerField(
+        null=True, blank=True,
+        help_text=_("Bytes read from storage since process start (None == not available)")
+    )
+    write_bytes = models.PositiveBigIntegerField(
+        null=True, blank=True,
+        help_text=_("Bytes written to storage since process start (None == not available)")
+    )
+
+    def __str__(self):
+        return f"PID {self.pid} at {self.sample_time}"
+
+    class Meta:
+        verbose_name_plural = verbose_name = "Process samples"
+        ordering = ("-sample_time",)
+
+
+class HostSample(models.Model):
+    """
+    Time series of the host system load, see: host_collector.py
+    The CPU times are stored as differences to the previous sample.
+    """
+    sample_time = models.DateTimeField(
+        db_index=True,
+        help_text=_("Time of the sample")
+    )
+
+    # CPU times (in jiffies) since the previous sample:
+    cpu_user = models.PositiveIntegerField(
+        help_text=_("CPU time in user mode (incl. nice) since the previous sample (jiffies)")
+    )
+    cpu_system = models.PositiveIntegerField(
+        help_text=_("CPU time in system mode (incl. irq) since the previous sample (jiffies)")
+    )
+    cpu_iowait = models.PositiveIntegerField(
+        help_text=_("CPU time waiting for I/O since the previous sample (jiffies)")
+    )
+    cpu_steal = models.PositiveIntegerField(
+        help_text=_("CPU time stolen by the hypervisor since the previous sample (jiffies)")
+    )
+    cpu_idle = models.PositiveIntegerField(
+        help_text=_("CPU idle time since the previous sample (jiffies)")
+    )
+
+    mem_used = models.PositiveBigIntegerField(
+        help_text=_("Used memory (without buffers/cache) in Bytes")
+    )
+    swap_used = models.PositiveBigIntegerField(
+        help_text=_("Used swap in Bytes")
+    )
+
+    load_1 = models.FloatField(help_text=_("load average (1 min)"))
+    load_5 = models.FloatField(help_text=_("load average (5 min)"))
+    load_15 = models.FloatField(help_text=_("load average (15 min)"))
+
+    # Pressure Stall Information (avg10 percentages), None == not available:
+    psi_cpu_some = models.FloatField(
+        null=True, blank=True,
+        help_text=_("Percentage of time some tasks stalled on CPU (10 sec. average)")
+    )
+    psi_memory_some = models.FloatField(
+        null=True, blank=True,
+        help_text=_("Percentage of time some tasks stalled on memory (10 sec. average)")
+    )
+    psi_memory_full = models.FloatField(
+        null=True, blank=True,
+        help_text=_("Percentage of time all tasks stalled on memory (10 sec. average)")
+    )
+    psi_io_some = models.FloatField(
+        null=True, blank=True,
+        help_text=_("Percentage of time some tasks stalled on I/O (10 sec. average)")
+    )
+    psi_io_full = models.FloatField(
+        null=True, blank=True,
+        help_text=_("Percentage of time all tasks stalled on I/O (10 sec. average)")
+    )
+
+    def cpu_usage(self):
+        """
+        Percentage of used CPU time since the previous sample.
+        """
+        total = self.cpu_user + self.cpu_system + self.cpu_iowait + self.cpu_steal + self.cpu_idle
+        if not total:
+            return 0.0
+        return (self.cpu_user + self.cpu_system + self.cpu_steal) / total * 100
+
+    def __str__(self):
+        return f"Host sample at {self.sample_time}"
+
+    class Meta:
+        verbose_name_plural = verbose_name = "Host samples"
+        ordering = ("-sample_time",)
@@ -0,0 +1,105 @@
+"""
+    Graceful worker recycling
+    ~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Let a worker finish the current request and exit, if it uses too much memory,
+    handled too many requests or leaks memory (like uWSGI's "reload-on-rss").
+    The master process (e.g.: gunicorn, uWSGI) will spawn a fresh worker.
+
+    Activate one or more policies in your settings.py, e.g.:
+
+        PROCESSINFO.RECYCLE_RSS_LIMIT = 512 * 1024 * 1024  # bytes
+        PROCESSINFO.RECYCLE_MAX_REQUESTS = 10000
+        PROCESSINFO.RECYCLE_RSS_SLOPE_LIMIT = 10 * 1024  # bytes per request
+
+    The action is called after the response was sent to the client.
+    The default action sends SIGTERM to the own process (graceful shutdown
+    of a gunicorn worker). Use a own callable for other servers, e.g.:
+
+        PROCESSINFO.RECYCLE_ACTION = "myproject.utils.recycle_worker"
+
+    It's called with the pid and the reason as keyword arguments.
+
+    :copyleft: 2011-2022 by the django-processinfo team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import logging
+import os
+import signal
+
+from django.conf import settings
+from django.template.defaultfilters import filesizeformat
+from django.utils.module_loading import import_string
+
+
+logger = logging.getLogger(__name__)
+
+
+def get_recycle_reason(process_info, memory):
+    """
+    returns the reason why the worker should be recycled or None
+
+    >>> from types import SimpleNamespace
+    >>> from unittest import mock
+    >>> process_info = SimpleNamespace(request_count=10, growth_count=0)
+    >>> get_recycle_reason(process_info, memory=1024) is None
+    True
+    >>> with mock.patch.object(settings.PROCESSINFO, "RECYCLE_RSS_LIMIT", 1000):
+    ...     get_recycle_reason(process_info, memory=1024)
+    'VmRSS 1.0\\xa0KB exceeds the limit of 1000\\xa0bytes'
+    >>> with mock.patch.object(settings.PROCESSINFO, "RECYCLE_MAX_REQUESTS", 10):
+    ...     get_recycle_reason(process_info, memory=1024)
+    '10 requests handled'
+    """
+    rss_limit = settings.PROCESSINFO.RECYCLE_RSS_LIMIT
+    if rss_limit is not None and memory > rss_limit:
+        return f"VmRSS {filesizeformat(memory)} exceeds the limit of {filesizeformat(rss_limit)}"
+
+    max_requests = settings.PROCESSINFO.RECYCLE_MAX_REQUESTS
+    if max_requests is not None and process_info.request_count >= max_requests:
+        return f"{process_info.request_count} requests handled"
+
+    slope_limit = settings.PROCESSINFO.RECYCLE_RSS_SLOPE_LIMIT
+    if slope_limit is not None and process_info.growth_count >= settings.PROCESSINFO.LEAK_MIN_REQUESTS:
+        rss_per_request = process_info.get_rss_per_request()
+        if rss_per_request > slope_limit:
+            return (
+                f"VmRSS grows {filesizeformat(rss_per_request)}/request"
+                f" (limit: {filesizeformat(slope_limit)}/request)"
+            )
+
+    return None
+
+
+def get_recycle_action():
+    action = settings.PROCESSINFO.RECYCLE_ACTION
+    if isinstance(action, str):
+        action = import_string(action)
+    return action
+
+
+def terminate(pid, reason):
+    """
+    The default action: Send SIGTERM to the own process.
+    gunicorn workers will exit gracefully and the master spawns a new one.
+    """
+    logger.warning("Recycle worker %i: %s", pid, reason)
+    os.kill(pid, signal.SIGTERM)
+
+
+def schedule_recycle(response, pid, reason):
+    """
+    Call the recycle action after the response was sent to the client
+    (The WSGI server calls response.close() at the end).
+    """
+    action = get_recycle_action()
+    close = response.close
+
+    def close_and_recycle():
+        try:
+            close()
+        finally:
+            action(pid=pid, reason=reason)
+
+    response.close = close_and_recycle
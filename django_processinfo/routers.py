@@ -0,0 +1,93 @@
+"""
+    database router
+    ~~~~~~~~~~~~~~~
+
+    Send all django-processinfo database traffic to settings.PROCESSINFO.DATABASE
+
+    Add this into your settings.py:
+
+        DATABASE_ROUTERS = ['django_processinfo.routers.ProcessInfoRouter']
+        PROCESSINFO.DATABASE = 'processinfo'
+
+    :copyleft: 2011-2022 by the django-processinfo team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, router
+
+
+APP_LABEL = 'django_processinfo'
+ROUTER = 'django_processinfo.routers.ProcessInfoRouter'
+
+
+def get_database_alias():
+    """
+    Returns the database alias that stores all django-processinfo data.
+    """
+    return settings.PROCESSINFO.DATABASE or DEFAULT_DB_ALIAS
+
+
+def is_own_model(model_or_obj):
+    return model_or_obj._meta.app_label == APP_LABEL
+
+
+class ProcessInfoRouter:
+    """
+    Route all django-processinfo models to settings.PROCESSINFO.DATABASE
+
+    The statistic tables have no database constraints to other tables,
+    so e.g. the referenced Site table can stay in the default database.
+    """
+
+    def _db_for(self, model, hints, router_func):
+        if not settings.PROCESSINFO.DATABASE:
+            return None
+
+        if is_own_model(model):
+            return settings.PROCESSINFO.DATABASE
+
+        instance = hints.get('instance')
+        if instance is not None and is_own_model(instance):
+            # e.g.: SiteStatistics().site -> Don't use the django-processinfo
+            # database (the default fallback) for the related Site object.
+            return router_func(model)
+
+        return None
+
+    def db_for_read(self, model, **hints):
+        return self._db_for(model, hints, router.db_for_read)
+
+    def db_for_write(self, model, **hints):
+        return self._db_for(model, hints, router.db_for_write)
+
+    def allow_relation(self, obj1, obj2, **hints):
+        if is_own_model(obj1) or is_own_model(obj2):
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if not settings.PROCESSINFO.DATABASE:
+            return None
+
+        if app_label == APP_LABEL:
+            return db == settings.PROCESSINFO.DATABASE
+
+        return None
+
+
+def activate_sqlite_wal(sender, connection, **kwargs):
+    """
+    connection_created signal handler:
+    Activate the SQLite "Write-Ahead Logging" for the django-processinfo database,
+    so the statistic writes don't block the readers (e.g. the admin) and vice versa.
+    """
+    if not settings.PROCESSINFO.SQLITE_WAL:
+        return
+
+    if connection.alias != settings.PROCESSINFO.DATABASE or connection.vendor != 'sqlite':
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute('PRAGMA journal_mode=WAL;')
+        cursor.execute('PRAGMA synchronous=NORMAL;')
@@ -0,0 +1,286 @@
+"""
+    background samplers
+    ~~~~~~~~~~~~~~~~~~~
+
+    Optional daemon threads per process that collect information
+    in a fixed interval, independent of the request traffic.
+    The samples are collected in a in-memory ring buffer and stored in batches.
+
+    * ProcSampler: /proc information of every process,
+      activate it with: settings.PROCESSINFO.PROC_SAMPLER_INTERVAL
+    * HostSampler: Host system load, collected by only one elected process,
+      activate it with: settings.PROCESSINFO.HOST_SAMPLER_INTERVAL
+
+    :copyleft: 2011-2022 by the django-processinfo team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import abc
+import atexit
+import collections
+import fcntl
+import logging
+import os
+import threading
+
+from django.conf import settings
+from django.db import connections
+from django.utils import timezone
+
+from django_processinfo.host_collector import HostCollector
+from django_processinfo.models import HostSample, ProcessSample
+from django_processinfo.utils.proc_info import (
+    open_fd_count,
+    process_information,
+    process_io,
+    process_stat,
+)
+
+
+logger = logging.getLogger(__name__)
+
+Sample = collections.namedtuple(
+    "Sample",
+    (
+        "pid", "sample_time",
+        "memory", "vm_peak", "threads",
+        "user_time", "system_time",
+        "read_bytes", "write_bytes",
+        "fds",  # not stored in ProcessSample, used for the leak detection, see: middlewares.py
+    ),
+)
+
+
+def take_sample():
+    """
+    Collect the information from /proc/self/status, /proc/self/stat, /proc/self/io and /proc/self/fd
+    """
+    status = dict(process_information())
+    stat = dict(process_stat())
+    try:
+        io = dict(process_io())
+    except OSError:  # e.g.: Not allowed in a container
+        io = {}
+    try:
+        fds = open_fd_count()
+    except OSError:
+        fds = None
+
+    return Sample(
+        pid=status["Pid"],
+        sample_time=timezone.now(),
+        memory=status["VmRSS"],
+        vm_peak=status["VmPeak"],
+        threads=status["Threads"],
+        user_time=stat["utime"],
+        system_time=stat["stime"],
+        read_bytes=io.get("read_bytes"),
+        write_bytes=io.get("write_bytes"),
+        fds=fds,
+    )
+
+
+def delete_oldest(model, max_count):
+    """
+    Auto cleanup the table to protect against overloading.
+    """
+    queryset = model.objects.order_by("-pk")
+    last_pks = tuple(queryset[max_count:max_count + 1].values_list("pk", flat=True))
+    if last_pks:
+        model.objects.filter(pk__lte=last_pks[0]).delete()
+
+
+class BaseSampler(abc.ABC):
+    thread_name = None
+    model = None
+
+    # Names of the settings.PROCESSINFO attributes:
+    interval_setting = None
+    flush_count_setting = None
+    buffer_size_setting = None
+    max_count_setting = None
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.pid = None
+        self.thread = None
+        self.stop_event = None
+        self.buffer = collections.deque()
+        self.latest = None  # The last sample of the current process
+
+    def get_setting(self, name):
+        return getattr(settings.PROCESSINFO, name)
+
+    def ensure_running(self):
+        """
+        Start the sampler thread, if activated. Called in every request.
+        The thread will be started once per process (Threads doesn't survive a fork).
+        """
+        interval = self.get_setting(self.interval_setting)
+        if not interval:
+            return False
+
+        pid = os.getpid()
+        if self.pid == pid:
+            return True
+
+        with self.lock:
+            if self.pid != pid:
+                self.pid = pid
+                self.reset()
+                self.stop_event = threading.Event()
+                self.thread = threading.Thread(
+                    target=self.run,
+                    args=(interval, self.stop_event),
+                    name=self.thread_name,
+                    daemon=True,
+                )
+                self.thread.start()
+                atexit.register(self.flush)
+        return True
+
+    def reset(self):
+        """
+        Forget all information from the parent process.
+        """
+        self.latest = None
+        self.buffer = collections.deque(maxlen=self.get_setting(self.buffer_size_setting))
+
+    def is_elected(self):
+        """
+        Should this process collect samples?
+        """
+        return True
+
+    def run(self, interval, stop_event):
+        flush_count = self.get_setting(self.flush_count_setting)
+        while not stop_event.is_set():
+            if self.is_elected():
+                try:
+                    self.sample()
+                except Exception:
+                    logger.exception("Can't collect %s", self.model._meta.verbose_name)
+
+                if len(self.buffer) >= flush_count:
+                    self.flush()
+                    connections.close_all()  # Close only the connections of this thread
+
+            stop_event.wait(interval)
+
+    def stop(self):
+        if self.thread is not None:
+            self.stop_event.set()
+            self.thread.join()
+            self.thread = None
+        self.pid = None
+
+    @abc.abstractmethod
+    def take_sample(self):
+        """
+        returns the current sample or None
+        """
+
+    def to_model_instance(self, sample):
+        return sample
+
+    def sample(self):
+        sample = self.take_sample()
+        if sample is None:
+            return
+        self.latest = sample
+        self.buffer.append(sample)
+
+    def flush(self):
+        """
+        Store all collected samples in the database.
+        """
+        samples = []
+        while True:
+            try:
+                samples.append(self.buffer.popleft())
+            except IndexError:
+                break
+
+        if not samples:
+            return
+
+        try:
+            self.model.objects.bulk_create(
+                [self.to_model_instance(sample) for sample in samples]
+            )
+
+            delete_oldest(self.model, max_count=self.get_setting(self.max_count_setting))
+        except Exception:
+            logger.exception("Can't store %i %s", len(samples), self.model._meta.verbose_name)
+
+
+class ProcSampler(BaseSampler):
+    """
+    Collect /proc information of the current process.
+    """
+    thread_name = "django-processinfo-sampler"
+    model = ProcessSample
+    interval_setting = "PROC_SAMPLER_INTERVAL"
+    flush_count_setting = "PROC_SAMPLER_FLUSH_COUNT"
+    buffer_size_setting = "PROC_SAMPLER_BUFFER_SIZE"
+    max_count_setting = "MAX_PROCESS_SAMPLE_COUNT"
+
+    def take_sample(self):
+        return take_sample()
+
+    def to_model_instance(self, sample):
+        values = sample._asdict()
+        del values["fds"]
+        return ProcessSample(**values)
+
+
+class HostSampler(BaseSampler):
+    """
+    Collect the host system load. Every process starts the thread, but only one
+    process collects the samples: The one that holds the lock on HOST_SAMPLER_LOCK_FILE
+    If this process dies, another process will take over.
+    """
+    thread_name = "django-processinfo-host-sampler"
+    model = HostSample
+    interval_setting = "HOST_SAMPLER_INTERVAL"
+    flush_count_setting = "HOST_SAMPLER_FLUSH_COUNT"
+    buffer_size_setting = "HOST_SAMPLER_BUFFER_SIZE"
+    max_count_setting = "MAX_HOST_SAMPLE_COUNT"
+
+    def __init__(self):
+        super().__init__()
+        self.lock_file = None
+        self.collector = None
+
+    def reset(self):
+        super().reset()
+        # Note: Don't close a inherited lock file, this would release the lock of the parent.
+        self.lock_file = None
+        self.collector = None
+
+    def is_elected(self):
+        if self.lock_file is not None:
+            return True
+
+        lock_file = open(settings.PROCESSINFO.HOST_SAMPLER_LOCK_FILE, "a")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            # Another process collects the host samples
+            lock_file.close()
+            return False
+
+        # Keep the file open -> the lock will be released if this process dies
+        self.lock_file = lock_file
+        return True
+
+    def take_sample(self):
+        if self.collector is None:
+            # The first call only collects the start values for the CPU time differences
+            self.collector = HostCollector()
+            return None
+        return self.collector.collect()
+
+
+proc_sampler = ProcSampler()
+host_sampler = HostSampler()
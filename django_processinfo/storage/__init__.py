@@ -0,0 +1,41 @@
+"""
+    Storage backends
+    ~~~~~~~~~~~~~~~~
+
+    The recorded statistics are written and read through a storage backend,
+    so every site can choose the write costs per request:
+
+        orm.OrmStorage            All statistics in the database (default)
+        memory.MemoryStorage      Only in the memory of the current process (tests, development)
+        file.AppendOnlyFileStorage  One appended line per request, aggregated on read
+        kv.KeyValueStorage        Key-value store like Redis (with a local stand-in)
+
+    e.g.:
+
+        PROCESSINFO.STORAGE_BACKEND = "django_processinfo.storage.file.AppendOnlyFileStorage"
+        PROCESSINFO.STORAGE_OPTIONS = {"path": "/var/log/django-processinfo.jsonl"}
+
+    :copyleft: 2011-2022 by the django-processinfo team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+
+# One instance per backend and options (e.g.: the MemoryStorage holds the data):
+_storages = {}
+
+
+def get_storage():
+    """
+    returns the storage backend instance, see: settings.PROCESSINFO.STORAGE_BACKEND
+    """
+    backend = settings.PROCESSINFO.STORAGE_BACKEND
+    options = settings.PROCESSINFO.STORAGE_OPTIONS
+    key = (backend, repr(sorted(options.items())))
+    storage = _storages.get(key)
+    if storage is None:
+        storage_class = import_string(backend) if isinstance(backend, str) else backend
+        storage = _storages.setdefault(key, storage_class(**options))
+    return storage
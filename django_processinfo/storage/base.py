@@ -0,0 +1,241 @@
+"""
+    Storage backends - base
+    ~~~~~~~~~~~~~~~~~~~~~~~
+
+    The interface of all storage backends and the aggregation of the backends
+    that don't use the models.
+
+    :copyleft: 2011-2022 by the django-processinfo team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import abc
+import datetime
+import time
+from types import SimpleNamespace
+
+from django.conf import settings
+
+from django_processinfo.utils.average import update_min_max_avg
+
+
+# The values that every backend returns, named like the model fields:
+PROCESS_FIELDS = (
+    "pid", "site_id", "kind", "request_count", "exception_count",
+    "response_time_min", "response_time_max", "response_time_avg", "response_time_sum",
+    "user_time_total", "system_time_total",
+    "memory_min", "memory_max", "memory_avg", "threads_max",
+    "start_time", "lastupdate_time",
+)
+VIEW_FIELDS = (
+    "site_id", "kind", "view_name", "request_count", "exception_count",
+    "response_time_min", "response_time_max", "response_time_avg", "response_time_sum",
+    "start_time", "lastupdate_time",
+)
+
+SITE_FIELDS = (
+    "site_id", "process_count", "request_count", "exception_count",
+    "response_time_min", "response_time_max", "response_time_avg", "response_time_sum",
+    "user_time_total", "system_time_total",
+    "memory_min", "memory_max", "memory_avg", "threads_max",
+    "start_time", "lastupdate_time",
+)
+
+
+class BaseStorage(abc.ABC):
+    """
+    Interface of all storage backends.
+    """
+
+    @abc.abstractmethod
+    def save(self, info, exception):
+        """
+        Store the measured values of one request/task, see: middlewares.StatisticsRecorder
+        """
+
+    @abc.abstractmethod
+    def get_process_statistics(self):
+        """
+        returns a list of dicts (with PROCESS_FIELDS) per process, sorted by pid.
+        """
+
+    @abc.abstractmethod
+    def get_view_statistics(self):
+        """
+        returns a list of dicts (with VIEW_FIELDS) per site, kind and view, sorted by this values.
+        """
+
+    def get_site_statistics(self):
+        """
+        returns a list of dicts (with SITE_FIELDS) per site, sorted by site_id.
+        """
+        return site_statistics(self.get_process_statistics())
+
+    @abc.abstractmethod
+    def reset(self):
+        """
+        Delete all recorded data.
+        """
+
+
+def get_record(info, exception):
+    """
+    returns the values of a RequestInfo that will be stored by the aggregating backends
+    """
+    return {
+        "time": time.time(),
+        "pid": info.pid,
+        "site_id": settings.SITE_ID,
+        "kind": info.kind,
+        "view_name": info.view_name,
+        "exception": bool(exception),
+        "response_time": info.response_time,
+        "user_time": info.user_time,
+        "system_time": info.system_time,
+        "memory": info.memory,
+        "threads": info.threads,
+    }
+
+
+def new_statistics(record, fields):
+    stats = SimpleNamespace(**{field: 0 for field in fields})
+    for field in ("pid", "site_id", "kind", "view_name"):
+        if field in fields:
+            setattr(stats, field, record[field])
+    stats.start_time = record["time"]
+    return stats
+
+
+def update_statistics(stats, record):
+    """
+    Update the statistics of a process or view with a record.
+
+    >>> record = {"time": 1, "site_id": 1, "kind": "task", "view_name": "foo", "exception": False,
+    ...           "response_time": 0.2, "memory": 100, "threads": 1, "user_time": 0.1, "system_time": 0}
+    >>> stats = new_statistics(record, VIEW_FIELDS)
+    >>> update_statistics(stats, record)
+    >>> update_statistics(stats, {**record, "response_time": 0.4, "exception": True})
+    >>> stats.request_count, stats.exception_count, stats.response_time_max
+    (2, 1, 0.4)
+    >>> round(stats.response_time_avg, 2), round(stats.response_time_sum, 2)
+    (0.3, 0.6)
+    """
+    update_min_max_avg(stats, "response_time", record["response_time"], stats.request_count)
+    if hasattr(stats, "memory_avg"):
+        update_min_max_avg(stats, "memory", record["memory"], stats.request_count)
+        stats.threads_max = max(stats.threads_max, record["threads"])
+        stats.user_time_total += record["user_time"]
+        stats.system_time_total += record["system_time"]
+    stats.request_count += 1
+    if record["exception"]:
+        stats.exception_count += 1
+    stats.lastupdate_time = record["time"]
+
+
+def merge_statistics(stats, other):
+    """
+    Merge the statistics of the same view from different processes.
+
+    >>> a = SimpleNamespace(request_count=1, exception_count=0, start_time=5, lastupdate_time=5,
+    ...     response_time_min=1.0, response_time_max=1.0, response_time_avg=1.0, response_time_sum=1.0)
+    >>> b = SimpleNamespace(request_count=3, exception_count=1, start_time=2, lastupdate_time=9,
+    ...     response_time_min=2.0, response_time_max=4.0, response_time_avg=3.0, response_time_sum=9.0)
+    >>> merge_statistics(a, b)
+    >>> a.request_count, a.exception_count, a.start_time, a.lastupdate_time
+    (4, 1, 2, 9)
+    >>> a.response_time_min, a.response_time_max, a.response_time_avg, a.response_time_sum
+    (1.0, 4.0, 2.5, 10.0)
+    """
+    stats.response_time_min = min(stats.response_time_min, other.response_time_min)
+    stats.response_time_max = max(stats.response_time_max, other.response_time_max)
+    stats.response_time_avg = (
+        stats.response_time_sum + other.response_time_sum
+    ) / (stats.request_count + other.request_count)
+    stats.response_time_sum += other.response_time_sum
+    stats.request_count += other.request_count
+    stats.exception_count += other.exception_count
+    stats.start_time = min(stats.start_time, other.start_time)
+    stats.lastupdate_time = max(stats.lastupdate_time, other.lastupdate_time)
+
+
+def statistics2dict(stats, fields):
+    """
+    returns the statistics as dict, with datetime objects like the model fields
+    """
+    result = {field: getattr(stats, field) for field in fields}
+    for field in ("start_time", "lastupdate_time"):
+        result[field] = datetime.datetime.fromtimestamp(result[field], tz=datetime.timezone.utc)
+    return result
+
+
+def view_key(record):
+    return (record["site_id"], record["kind"], record["view_name"])
+
+
+def add_record(processes, views, record):
+    """
+    Update the statistics dicts (pid -> process statistics, view_key -> view statistics)
+    """
+    stats = processes.get(record["pid"])
+    if stats is None:
+        stats = processes[record["pid"]] = new_statistics(record, PROCESS_FIELDS)
+    update_statistics(stats, record)
+
+    if record["view_name"] is not None:
+        key = view_key(record)
+        stats = views.get(key)
+        if stats is None:
+            stats = views[key] = new_statistics(record, VIEW_FIELDS)
+        update_statistics(stats, record)
+
+
+def process_statistics2list(processes):
+    return [statistics2dict(processes[pid], PROCESS_FIELDS) for pid in sorted(processes)]
+
+
+def view_statistics2list(views):
+    return [statistics2dict(views[key], VIEW_FIELDS) for key in sorted(views)]
+
+
+def site_statistics(processes):
+    """
+    Combine the process statistics per site: The min/max/avg values are averaged
+    over the processes (like the memory of a typical process), the others are summed up.
+
+    >>> processes = [
+    ...     {"site_id": 1, "request_count": 1, "exception_count": 0, "response_time_min": 0.1,
+    ...      "response_time_max": 0.1, "response_time_avg": 0.1, "response_time_sum": 0.1,
+    ...      "user_time_total": 0.1, "system_time_total": 0, "memory_min": 100, "memory_max": 100,
+    ...      "memory_avg": 100, "threads_max": 1, "start_time": 2, "lastupdate_time": 3},
+    ...     {"site_id": 1, "request_count": 3, "exception_count": 1, "response_time_min": 0.2,
+    ...      "response_time_max": 0.5, "response_time_avg": 0.3, "response_time_sum": 0.9,
+    ...      "user_time_total": 0.2, "system_time_total": 0.1, "memory_min": 200, "memory_max": 400,
+    ...      "memory_avg": 300, "threads_max": 4, "start_time": 1, "lastupdate_time": 5},
+    ... ]
+    >>> site = site_statistics(processes)[0]
+    >>> site["process_count"], site["request_count"], site["exception_count"], site["threads_max"]
+    (2, 4, 1, 4)
+    >>> site["memory_min"], site["memory_avg"], site["memory_max"], round(site["response_time_sum"], 2)
+    (150.0, 200.0, 250.0, 1.0)
+    >>> site["start_time"], site["lastupdate_time"]
+    (1, 5)
+    """
+    sites = {}
+    for process in processes:
+        sites.setdefault(process["site_id"], []).append(process)
+
+    result = []
+    for site_id in sorted(sites):
+        processes = sites[site_id]
+        site = {"site_id": site_id, "process_count": len(processes)}
+        for field in ("request_count", "exception_count", "response_time_sum", "user_time_total", "system_time_total"):
+            site[field] = sum(process[field] for process in processes)
+        for field in (
+            "response_time_min", "response_time_max", "response_time_avg", "memory_min", "memory_max", "memory_avg"
+        ):
+            site[field] = sum(process[field] for process in processes) / len(processes)
+        site["threads_max"] = max(process["threads_max"] for process in processes)
+        site["start_time"] = min(process["start_time"] for process in processes)
+        site["lastupdate_time"] = max(process["lastupdate_time"] for process in processes)
+        result.append({field: site[field] for field in SITE_FIELDS})
+    return result
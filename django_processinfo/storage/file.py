@@ -0,0 +1,72 @@
+"""
+    Storage backends - append-only file
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Append one JSON line per request to a local file. No read and no lock is
+    needed to write: The line is written with a single write() call in O_APPEND
+    mode, so the lines of several processes are not mixed.
+    The statistics are aggregated on read, so the read costs grows with the file.
+
+    :copyleft: 2011-2022 by the django-processinfo team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import json
+import os
+import tempfile
+
+from django_processinfo.storage.base import (
+    BaseStorage,
+    add_record,
+    get_record,
+    process_statistics2list,
+    view_statistics2list,
+)
+
+
+DEFAULT_PATH = os.path.join(tempfile.gettempdir(), "django-processinfo-records.jsonl")
+
+
+class AppendOnlyFileStorage(BaseStorage):
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+
+    def save(self, info, exception):
+        line = json.dumps(get_record(info, exception), separators=(",", ":")) + "\n"
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line.encode("utf-8"))
+        finally:
+            os.close(fd)
+
+    def iter_records(self):
+        try:
+            f = open(self.path, encoding="utf-8")
+        except FileNotFoundError:
+            return
+        with f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:  # e.g.: a incomplete last line after a crash
+                    continue
+
+    def aggregate(self):
+        processes, views = {}, {}
+        for record in self.iter_records():
+            add_record(processes, views, record)
+        return processes, views
+
+    def get_process_statistics(self):
+        processes, views = self.aggregate()
+        return process_statistics2list(processes)
+
+    def get_view_statistics(self):
+        processes, views = self.aggregate()
+        return view_statistics2list(views)
+
+    def reset(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,140 @@
+"""
+    Storage backends - key-value store
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Store the aggregated statistics in a key-value store. Only the Redis methods
+    get(), set(), delete() and scan_iter() are used, e.g.:
+
+        PROCESSINFO.STORAGE_BACKEND = "django_processinfo.storage.kv.KeyValueStorage"
+        PROCESSINFO.STORAGE_OPTIONS = {
+            "client": "redis.from_url",
+            "client_kwargs": {"url": "redis://localhost:6379/0"},
+        }
+
+    Without a client, the LocalKeyValueStore stand-in (in memory of the current
+    process) is used, e.g. for development and tests.
+
+    Every process writes only its own keys (the view statistics are stored per pid, too),
+    so no lock in the key-value store is needed. They are merged on read.
+
+    :copyleft: 2011-2022 by the django-processinfo team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import fnmatch
+import json
+import threading
+from types import SimpleNamespace
+
+from django.utils.module_loading import import_string
+
+from django_processinfo.storage.base import (
+    PROCESS_FIELDS,
+    VIEW_FIELDS,
+    BaseStorage,
+    get_record,
+    merge_statistics,
+    new_statistics,
+    process_statistics2list,
+    update_statistics,
+    view_key,
+    view_statistics2list,
+)
+
+
+class LocalKeyValueStore:
+    """
+    Local stand-in for a Redis client, with the used subset of the API.
+
+    >>> store = LocalKeyValueStore()
+    >>> store.set("foo:1", "bar")
+    >>> store.get("foo:1"), store.get("foo:2")
+    (b'bar', None)
+    >>> list(store.scan_iter(match="foo:*"))
+    [b'foo:1']
+    >>> store.delete("foo:1")
+    1
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.data = {}
+
+    @staticmethod
+    def _encode(value):
+        if isinstance(value, str):
+            value = value.encode("utf-8")
+        return value
+
+    def get(self, key):
+        with self.lock:
+            return self.data.get(self._encode(key))
+
+    def set(self, key, value):
+        with self.lock:
+            self.data[self._encode(key)] = self._encode(value)
+
+    def delete(self, *keys):
+        with self.lock:
+            return sum(self.data.pop(self._encode(key), None) is not None for key in keys)
+
+    def scan_iter(self, match="*"):
+        match = self._encode(match)
+        with self.lock:
+            keys = list(self.data)
+        for key in keys:
+            if fnmatch.fnmatchcase(key, match):
+                yield key
+
+
+class KeyValueStorage(BaseStorage):
+    def __init__(self, client="django_processinfo.storage.kv.LocalKeyValueStore", client_kwargs=None,
+                 prefix="processinfo"):
+        if isinstance(client, str):
+            client = import_string(client)
+        self.client = client(**(client_kwargs or {}))
+        self.prefix = prefix
+        # Only the threads of this process are writing the keys of this process:
+        self.lock = threading.Lock()
+
+    def _update(self, key, record, fields):
+        value = self.client.get(key)
+        if value is None:
+            stats = new_statistics(record, fields)
+        else:
+            stats = SimpleNamespace(**json.loads(value))
+        update_statistics(stats, record)
+        self.client.set(key, json.dumps(vars(stats)))
+
+    def save(self, info, exception):
+        record = get_record(info, exception)
+        pid = record["pid"]
+        with self.lock:
+            self._update(f"{self.prefix}:process:{pid}", record, PROCESS_FIELDS)
+            if record["view_name"] is not None:
+                self._update(f"{self.prefix}:view:{pid}:{json.dumps(view_key(record))}", record, VIEW_FIELDS)
+
+    def _iter_statistics(self, kind):
+        for key in self.client.scan_iter(match=f"{self.prefix}:{kind}:*"):
+            value = self.client.get(key)
+            if value is not None:  # deleted in the meantime
+                yield SimpleNamespace(**json.loads(value))
+
+    def get_process_statistics(self):
+        processes = {stats.pid: stats for stats in self._iter_statistics("process")}
+        return process_statistics2list(processes)
+
+    def get_view_statistics(self):
+        views = {}
+        for stats in self._iter_statistics("view"):
+            key = view_key(vars(stats))
+            if key in views:
+                merge_statistics(views[key], stats)
+            else:
+                views[key] = stats
+        return view_statistics2list(views)
+
+    def reset(self):
+        keys = list(self.client.scan_iter(match=f"{self.prefix}:*"))
+        if keys:
+            self.client.delete(*keys)
@@ -0,0 +1,46 @@
+"""
+    Storage backends - memory
+    ~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Aggregate the statistics only in the memory of the current process.
+    Nearly no write costs, but every process has its own data and it's lost
+    on exit. Useful for tests and development, e.g. with "runserver".
+
+    :copyleft: 2011-2022 by the django-processinfo team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import threading
+
+from django_processinfo.storage.base import (
+    BaseStorage,
+    add_record,
+    get_record,
+    process_statistics2list,
+    view_statistics2list,
+)
+
+
+class MemoryStorage(BaseStorage):
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.processes = {}
+        self.views = {}
+
+    def save(self, info, exception):
+        record = get_record(info, exception)
+        with self.lock:
+            add_record(self.processes, self.views, record)
+
+    def get_process_statistics(self):
+        with self.lock:
+            return process_statistics2list(self.processes)
+
+    def get_view_statistics(self):
+        with self.lock:
+            return view_statistics2list(self.views)
+
+    def reset(self):
+        with self.lock:
+            self.processes.clear()
+            self.views.clear()
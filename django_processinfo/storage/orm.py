@@ -0,0 +1,492 @@
+"""
+    Storage backends - ORM
+    ~~~~~~~~~~~~~~~~~~~~~~
+
+    Store all statistics in the models (the default backend). Needed for
+    the admin change lists and for the worker recycling, see: recycle.py
+
+    :copyleft: 2011-2022 by the django-processinfo team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.db import connections, transaction
+from django.db.models import F, Value
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from django_processinfo import middlewares
+from django_processinfo.middlewares import (
+    get_status_class,
+    update_cache_statistics,
+    update_gc_statistics,
+    update_io_statistics,
+)
+from django_processinfo.models import (
+    KIND_REQUEST,
+    ConnectionStatistics,
+    MiddlewareStatistics,
+    OutcomeStatistics,
+    ProcessInfo,
+    QueryFingerprint,
+    SiteStatistics,
+    TemplateStatistics,
+    ViewStatistics,
+    WarmupStatistics,
+)
+from django_processinfo.recycle import get_recycle_reason
+from django_processinfo.routers import get_database_alias
+from django_processinfo.storage.base import PROCESS_FIELDS, VIEW_FIELDS, BaseStorage
+from django_processinfo.utils.average import average, update_min_max_avg
+from django_processinfo.utils.growth import update_growth_fit
+
+
+class OrmStorage(BaseStorage):
+    def save(self, info, exception):
+        # All writes in one short transaction on the django-processinfo database.
+        # Note: With a own settings.PROCESSINFO.DATABASE it's a own connection, too.
+        # So we are outside of a e.g. ATOMIC_REQUESTS transaction of the application.
+        alias = get_database_alias()
+        with transaction.atomic(using=alias):
+            self._lock_for_write(alias)
+            self._save_statistics(info, exception)
+
+    def _lock_for_write(self, alias):
+        """
+        A SQLite transaction starts as reader: If two processes have read and then want to write,
+        one gets "database is locked" at once, without waiting for the busy timeout.
+        With a write as first statement, the worker processes wait for each other instead.
+
+        Only for a own SQLite database (settings.PROCESSINFO.DATABASE): On the "default"
+        database the statistic writes should not wait for the writes of the application.
+        """
+        if alias != settings.PROCESSINFO.DATABASE:
+            return
+        connection = connections[alias]
+        if connection.vendor != "sqlite":
+            return
+        table = connection.ops.quote_name(SiteStatistics._meta.db_table)
+        with connection.cursor() as cursor:
+            cursor.execute(f"UPDATE {table} SET process_spawn = process_spawn WHERE 0")
+
+    def get_process_statistics(self):
+        return list(ProcessInfo.objects.order_by("pid").values(*PROCESS_FIELDS))
+
+    def get_view_statistics(self):
+        return list(
+            ViewStatistics.objects.order_by("site_id", "kind", "view_name").values(*VIEW_FIELDS)
+        )
+
+    def reset(self):
+        ProcessInfo.objects.all().delete()
+        SiteStatistics.objects.all().delete()
+        ViewStatistics.objects.all().delete()
+        OutcomeStatistics.objects.all().delete()
+        WarmupStatistics.objects.all().delete()
+        QueryFingerprint.objects.all().delete()
+        TemplateStatistics.objects.all().delete()
+        MiddlewareStatistics.objects.all().delete()
+        ConnectionStatistics.objects.all().delete()
+
+    def _save_statistics(self, info, exception):
+        process_info, process_created = ProcessInfo.objects.get_or_create(
+            pid=info.pid,
+            defaults={
+                "kind": info.kind,
+                "db_query_count_min": info.query_count,
+                "db_query_count_max": info.query_count,
+                "db_query_count_avg": info.query_count,
+                "response_time_min": info.response_time,
+                "response_time_max": info.response_time,
+                "response_time_avg": info.response_time,
+                "response_time_sum": info.response_time,
+                "threads_avg": info.threads,
+                "threads_min": info.threads,
+                "threads_max": info.threads,
+                "user_time_min": info.user_time,
+                "user_time_max": info.user_time,
+                "user_time_total": info.user_time,
+                "system_time_total": info.system_time,
+                "system_time_min": info.system_time,
+                "system_time_max": info.system_time,
+                "vm_peak_min": info.vmpeak,
+                "vm_peak_max": info.vmpeak,
+                "vm_peak_avg": info.vmpeak,
+                "memory_min": info.memory,
+                "memory_max": info.memory,
+                "memory_avg": info.memory,
+                **info.load_values,
+            }
+        )
+        if exception:
+            process_info.exception_count += 1
+
+        if process_created:
+            process_info.startup_time = middlewares.startup_timer.get_startup_time()
+            process_info.first_response_time = info.response_time
+        else:
+            process_info.request_count += 1
+            request_count = process_info.request_count
+
+            if settings.DEBUG:
+                process_info.db_query_count_min = min((process_info.db_query_count_min, info.query_count))
+                process_info.db_query_count_max = max((process_info.db_query_count_max, info.query_count))
+                process_info.db_query_count_avg = average(
+                    process_info.db_query_count_avg, info.query_count, request_count
+                )
+
+            process_info.response_time_min = min((process_info.response_time_min, info.response_time))
+            process_info.response_time_max = max((process_info.response_time_max, info.response_time))
+            process_info.response_time_avg = average(
+                process_info.response_time_avg, info.response_time, request_count
+            )
+            process_info.response_time_sum += info.response_time
+
+            process_info.threads_min = min((process_info.threads_min, info.threads))
+            process_info.threads_max = max((process_info.threads_max, info.threads))
+            process_info.threads_avg = average(
+                process_info.threads_avg, info.threads, request_count
+            )
+
+            process_info.user_time_min = min((process_info.user_time_min, info.user_time))
+            process_info.user_time_max = max((process_info.user_time_min, info.user_time))
+            process_info.user_time_total += info.user_time
+
+            process_info.system_time_min = min((process_info.system_time_min, info.system_time))
+            process_info.system_time_max = max((process_info.system_time_min, info.system_time))
+            process_info.system_time_total += info.system_time
+
+            process_info.vm_peak_min = min((process_info.vm_peak_min, info.vmpeak))
+            process_info.vm_peak_max = max((process_info.vm_peak_max, info.vmpeak))
+            process_info.vm_peak_avg = average(
+                process_info.vm_peak_avg, info.vmpeak, request_count
+            )
+
+            process_info.memory_min = min((process_info.memory_min, info.memory))
+            process_info.memory_max = max((process_info.memory_max, info.memory))
+            process_info.memory_avg = average(
+                process_info.memory_avg, info.memory, request_count
+            )
+
+            for field_name, value in info.load_values.items():
+                setattr(process_info, field_name, value)
+
+        if info.queue_time is not None:
+            update_min_max_avg(
+                process_info, "queue_time", info.queue_time, process_info.queue_time_count
+            )
+            process_info.queue_time_count += 1
+
+        if info.io_deltas is not None:
+            update_io_statistics(process_info, info.io_deltas)
+        if info.gc_deltas is not None:
+            update_gc_statistics(process_info, info.gc_deltas)
+        if info.cache_deltas is not None:
+            update_cache_statistics(process_info, info.cache_deltas)
+
+        update_min_max_avg(
+            process_info, "concurrency", info.concurrency, process_info.request_count - 1
+        )
+
+        if info.fds is not None:
+            process_info.fds = info.fds
+            process_info.fds_max = max(process_info.fds_max, info.fds)
+            if process_info.request_count > settings.PROCESSINFO.GROWTH_WARMUP_REQUESTS:
+                update_growth_fit(
+                    process_info, "growth",
+                    x_values={"requests": process_info.request_count, "uptime": info.overall_time},
+                    y_values={"rss": info.memory, "fds": info.fds, "threads": info.threads},
+                )
+        process_info.saturation = info.saturation
+
+        if info.memory_details is not None:
+            update_min_max_avg(
+                process_info, "pss", info.memory_details["pss"], process_info.pss_count
+            )
+            process_info.pss_count += 1
+            process_info.uss = info.memory_details["uss"]
+            process_info.shared_clean = info.memory_details["shared_clean"]
+            process_info.private_dirty = info.memory_details["private_dirty"]
+
+        is_warmup = process_info.request_count <= settings.PROCESSINFO.WARMUP_REQUESTS
+        if is_warmup:
+            process_info.warmup_count += 1
+            process_info.warmup_response_time_sum += info.response_time
+
+        if info.kind == KIND_REQUEST and not process_info.recycle_reason:
+            # Recycle the worker only once, e.g.: other threads may still handle requests
+            info.recycle_reason = get_recycle_reason(process_info, memory=info.memory)
+            if info.recycle_reason is not None:
+                process_info.recycle_reason = info.recycle_reason[:255]
+
+        process_info.save()
+
+        current_site = Site.objects.get_current()
+
+        if info.view_name is not None:
+            self._save_view_statistics(info, current_site, exception)
+            if info.query_collector is not None:
+                self._save_query_fingerprints(info, current_site)
+            if info.template_collector is not None:
+                self._save_template_statistics(info, current_site)
+            self._save_outcome_statistics(info, current_site)
+
+        if info.middleware_collector is not None:
+            self._save_middleware_statistics(info, current_site)
+        if info.connection_stats:
+            self._save_connection_statistics(info, current_site)
+
+        if is_warmup:
+            warmup_stats, created = WarmupStatistics.objects.select_for_update().get_or_create(
+                site=current_site, request_no=process_info.request_count
+            )
+            update_min_max_avg(
+                warmup_stats, "response_time", info.response_time, warmup_stats.process_count
+            )
+            warmup_stats.process_count += 1
+            warmup_stats.save()
+
+        site_stats, created = SiteStatistics.objects.get_or_create(
+            site=current_site
+        )
+        if info.recycle_reason is not None:
+            site_stats.process_recycled += 1
+
+        if created or process_created:
+            if not created and process_created:
+                site_stats.process_spawn += 1
+            site_stats.update_informations()
+            site_stats.save()
+
+            # Auto cleanup ProcessInfo table to protect against overloading.
+            queryset = ProcessInfo.objects.order_by('-lastupdate_time')
+            max_count = settings.PROCESSINFO.MAX_PROCESSINFO_COUNT
+            ids = tuple(queryset[max_count:].values_list('pk', flat=True))
+            if ids:
+                queryset.filter(pk__in=ids).delete()
+        elif info.recycle_reason is not None:
+            site_stats.save()
+
+    def _save_view_statistics(self, info, site, exception):
+        # The row is shared by all processes: Lock it until the end of the transaction
+        view_stats, created = ViewStatistics.objects.select_for_update().get_or_create(
+            site=site, kind=info.kind, view_name=info.view_name
+        )
+        update_min_max_avg(
+            view_stats, "response_time", info.response_time, view_stats.request_count
+        )
+        view_stats.request_count += 1
+        if exception:
+            view_stats.exception_count += 1
+
+        if info.queue_time is not None:
+            update_min_max_avg(
+                view_stats, "queue_time", info.queue_time, view_stats.queue_time_count
+            )
+            view_stats.queue_time_count += 1
+
+        if info.io_deltas is not None:
+            update_io_statistics(view_stats, info.io_deltas)
+        if info.gc_deltas is not None:
+            update_gc_statistics(view_stats, info.gc_deltas)
+        if info.cache_deltas is not None:
+            update_cache_statistics(view_stats, info.cache_deltas)
+        if info.template_collector is not None:
+            template_time = info.template_collector.time
+            view_stats.template_count += 1
+            view_stats.template_time_sum += template_time
+            view_stats.template_time_max = max(view_stats.template_time_max, template_time)
+
+        view_stats.save()
+
+    def _save_outcome_statistics(self, info, site):
+        """
+        Count the request per status class and per exception class, with own response times,
+        e.g.: fast 304 and slow 500 responses should not distort each other.
+        """
+        outcomes = []
+        if info.status_code is not None:  # Not set for e.g. tasks, see: instrument.py
+            outcomes.append((OutcomeStatistics.OUTCOME_TYPE_STATUS, get_status_class(info.status_code)))
+        if info.exception_name is not None:
+            outcomes.append((OutcomeStatistics.OUTCOME_TYPE_EXCEPTION, info.exception_name))
+
+        for outcome_type, outcome in outcomes:
+            outcome_stats, created = OutcomeStatistics.objects.select_for_update().get_or_create(
+                site=site, view_name=info.view_name, outcome_type=outcome_type, outcome=outcome
+            )
+            update_min_max_avg(
+                outcome_stats, "response_time", info.response_time, outcome_stats.request_count
+            )
+            outcome_stats.request_count += 1
+            outcome_stats.save()
+
+    def _save_query_fingerprints(self, info, site):
+        """
+        Store the costliest queries of this request (one UPDATE per query).
+        """
+        queries = info.query_collector.get_costliest(
+            max_count=settings.PROCESSINFO.MAX_FINGERPRINTS_PER_REQUEST
+        )
+        if not queries:
+            return
+
+        queries = {query.fingerprint: query for query in queries}
+        queryset = QueryFingerprint.objects.filter(site=site, view_name=info.view_name)
+        existing = set(queryset.filter(fingerprint__in=queries.keys()).values_list("fingerprint", flat=True))
+        to_create = [
+            QueryFingerprint(site=site, view_name=info.view_name, fingerprint=fingerprint, sql=query.sql)
+            for fingerprint, query in queries.items()
+            if fingerprint not in existing
+        ]
+        if to_create:
+            # A other process may create the same entries at the same time:
+            QueryFingerprint.objects.bulk_create(to_create, ignore_conflicts=True)
+
+        # The entries are shared by all processes: Update them relative to the current values
+        threshold = settings.PROCESSINFO.N_PLUS_ONE_THRESHOLD
+        now = timezone.now()
+        for fingerprint, query in queries.items():
+            queryset.filter(fingerprint=fingerprint).update(
+                request_count=F("request_count") + 1,
+                execution_count=F("execution_count") + query.count,
+                execution_max=Greatest("execution_max", Value(query.count)),
+                n_plus_one_count=F("n_plus_one_count") + (1 if query.count > threshold else 0),
+                time_max=Greatest("time_max", Value(query.time_max)),
+                time_sum=F("time_sum") + query.time_sum,
+                lastupdate_time=now,
+            )
+
+        if to_create:
+            # Bounded cardinality: Delete the entries that are not used for the longest time
+            queryset = QueryFingerprint.objects.order_by("-lastupdate_time")
+            max_count = settings.PROCESSINFO.MAX_QUERY_FINGERPRINT_COUNT
+            ids = tuple(queryset[max_count:].values_list("pk", flat=True))
+            if ids:
+                QueryFingerprint.objects.filter(pk__in=ids).delete()
+
+    def _save_template_statistics(self, info, site):
+        """
+        Store the costliest templates of this request (one UPDATE per template).
+        """
+        templates = info.template_collector.get_costliest(
+            max_count=settings.PROCESSINFO.MAX_TEMPLATES_PER_REQUEST
+        )
+        if not templates:
+            return
+
+        templates = {template.name[:255]: template for template in templates}
+        queryset = TemplateStatistics.objects.filter(site=site, view_name=info.view_name)
+        existing = set(
+            queryset.filter(template_name__in=templates.keys()).values_list("template_name", flat=True)
+        )
+        to_create = [
+            TemplateStatistics(site=site, view_name=info.view_name, template_name=template_name)
+            for template_name in templates
+            if template_name not in existing
+        ]
+        if to_create:
+            # A other process may create the same entries at the same time:
+            TemplateStatistics.objects.bulk_create(to_create, ignore_conflicts=True)
+
+        # The entries are shared by all processes: Update them relative to the current values
+        now = timezone.now()
+        for template_name, template in templates.items():
+            queryset.filter(template_name=template_name).update(
+                request_count=F("request_count") + 1,
+                render_count=F("render_count") + template.count,
+                time_max=Greatest("time_max", Value(template.time_sum)),
+                time_sum=F("time_sum") + template.time_sum,
+                lastupdate_time=now,
+            )
+
+        if to_create:
+            # Bounded cardinality: Delete the entries that are not used for the longest time
+            queryset = TemplateStatistics.objects.order_by("-lastupdate_time")
+            max_count = settings.PROCESSINFO.MAX_TEMPLATE_STATISTICS_COUNT
+            ids = tuple(queryset[max_count:].values_list("pk", flat=True))
+            if ids:
+                TemplateStatistics.objects.filter(pk__in=ids).delete()
+
+    def _save_middleware_statistics(self, info, site):
+        """
+        Add the inclusive/exclusive time per middleware of this request to the current process.
+        """
+        middlewares = info.middleware_collector.middlewares
+        if not middlewares:
+            return
+        middlewares = {name[:255]: middleware for name, middleware in middlewares.items()}
+
+        existing = MiddlewareStatistics.objects.filter(
+            site=site, pid=info.pid, middleware__in=middlewares.keys()
+        )
+        existing = {obj.middleware: obj for obj in existing}
+
+        now = timezone.now()
+        to_create = []
+        for name, middleware in middlewares.items():
+            obj = existing.get(name)
+            if obj is None:
+                obj = MiddlewareStatistics(site=site, pid=info.pid, middleware=name)
+                to_create.append(obj)
+            obj.request_count += 1
+            obj.inclusive_time_sum += middleware.inclusive
+            obj.inclusive_time_max = max(obj.inclusive_time_max, middleware.inclusive)
+            obj.exclusive_time_sum += middleware.exclusive
+            obj.exclusive_time_max = max(obj.exclusive_time_max, middleware.exclusive)
+            obj.lastupdate_time = now
+
+        if existing:
+            MiddlewareStatistics.objects.bulk_update(
+                existing.values(),
+                fields=(
+                    "request_count", "inclusive_time_sum", "inclusive_time_max",
+                    "exclusive_time_sum", "exclusive_time_max", "lastupdate_time",
+                ),
+            )
+        if to_create:
+            MiddlewareStatistics.objects.bulk_create(to_create)
+
+            # Bounded cardinality: Delete the entries that are not used for the longest time
+            queryset = MiddlewareStatistics.objects.order_by("-lastupdate_time")
+            max_count = settings.PROCESSINFO.MAX_MIDDLEWARE_STATISTICS_COUNT
+            ids = tuple(queryset[max_count:].values_list("pk", flat=True))
+            if ids:
+                MiddlewareStatistics.objects.filter(pk__in=ids).delete()
+
+    def _save_connection_statistics(self, info, site):
+        """
+        Store the current connection lifecycle values of this process.
+        """
+        existing = ConnectionStatistics.objects.filter(site=site, pid=info.pid)
+        existing = {obj.alias: obj for obj in existing}
+
+        fields = (
+            "connect_count", "connect_time_sum", "connect_time_max", "request_count",
+            "close_check_count", "close_check_time_sum", "close_count",
+        )
+        now = timezone.now()
+        to_create = []
+        to_update = []
+        for values in info.connection_stats:
+            obj = existing.get(values.alias)
+            if obj is None:
+                obj = ConnectionStatistics(site=site, pid=info.pid, alias=values.alias, vendor=values.vendor)
+                to_create.append(obj)
+            else:
+                to_update.append(obj)
+            for field_name in fields:
+                setattr(obj, field_name, getattr(values, field_name))
+            obj.lastupdate_time = now
+
+        if to_update:
+            ConnectionStatistics.objects.bulk_update(to_update, fields=(*fields, "lastupdate_time"))
+        if to_create:
+            ConnectionStatistics.objects.bulk_create(to_create)
+
+            # Auto cleanup, like the ProcessInfo table
+            queryset = ConnectionStatistics.objects.order_by("-lastupdate_time")
+            max_count = settings.PROCESSINFO.MAX_PROCESSINFO_COUNT * len(settings.DATABASES)
+            ids = tuple(queryset[max_count:].values_list("pk", flat=True))
+            if ids:
+                ConnectionStatistics.objects.filter(pk__in=ids).delete()
@@ -21,3 +21,31 @@ def average(old_avg, current_value, count):
     if old_avg is None:
         return current_value
     return (float(old_avg) * count + current_value) / (count + 1)
+
+
+def update_min_max_avg(obj, prefix, value, count):
+    """
+    Update the "<prefix>_min", "<prefix>_max", "<prefix>_avg" and (if exists)
+    "<prefix>_sum" attributes with a new value. Count is the number of old values.
+
+    >>> from types import SimpleNamespace
+    >>> obj = SimpleNamespace(foo_min=0, foo_max=0, foo_avg=0, foo_sum=0)
+    >>> update_min_max_avg(obj, "foo", 2, count=0)
+    >>> obj
+    namespace(foo_min=2, foo_max=2, foo_avg=2, foo_sum=2)
+    >>> update_min_max_avg(obj, "foo", 4, count=1)
+    >>> obj
+    namespace(foo_min=2, foo_max=4, foo_avg=3.0, foo_sum=6)
+    """
+    if count == 0:
+        setattr(obj, f"{prefix}_min", value)
+        setattr(obj, f"{prefix}_max", value)
+        setattr(obj, f"{prefix}_avg", value)
+    else:
+        setattr(obj, f"{prefix}_min", min(getattr(obj, f"{prefix}_min"), value))
+        setattr(obj, f"{prefix}_max", max(getattr(obj, f"{prefix}_max"), value))
+        setattr(obj, f"{prefix}_avg", average(getattr(obj, f"{prefix}_avg"), value, count))
+
+    sum_attr = f"{prefix}_sum"
+    if hasattr(obj, sum_attr):
+        setattr(obj, sum_attr, getattr(obj, sum_attr) + value)
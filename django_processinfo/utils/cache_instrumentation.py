@@ -0,0 +1,148 @@
+"""
+    django-processinfo - utils
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Count the calls, hits/misses and the time of the Django cache backends,
+    see: settings.PROCESSINFO.CACHE_INSTRUMENTATION
+
+    The methods of the configured cache backend classes are wrapped once.
+    The counters are accumulated per thread: The values of a request are the
+    differences of two snapshots (like the processor times).
+
+    :copyleft: 2011-2022 by the django-processinfo team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import functools
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+
+
+CACHE_COUNTERS = ("hits", "misses", "sets", "deletes", "time")
+
+READ_METHODS = ("get", "get_many", "has_key")
+WRITE_METHODS = ("set", "add", "set_many", "touch", "incr", "decr")
+DELETE_METHODS = ("delete", "delete_many", "clear")
+
+_MISSING = object()
+
+
+class CacheCounters(threading.local):
+    def __init__(self):
+        self.depth = 0  # Count only the outer call, e.g.: get_many() -> get()
+        self.hits = 0
+        self.misses = 0
+        self.sets = 0
+        self.deletes = 0
+        self.time = 0.0
+
+
+counters = CacheCounters()
+
+
+def count_read(method_name, args, kwargs, result):
+    if method_name == "get":
+        if result is _MISSING:
+            counters.misses += 1
+        else:
+            counters.hits += 1
+    elif method_name == "get_many":
+        keys = list(args[0] if args else kwargs["keys"])
+        counters.hits += len(result)
+        counters.misses += len(keys) - len(result)
+    elif result:  # has_key()
+        counters.hits += 1
+    else:
+        counters.misses += 1
+
+
+def instrument_method(method, method_name):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if counters.depth:
+            return method(self, *args, **kwargs)
+
+        default = None
+        if method_name == "get":
+            # Detect a miss independent of the given default:
+            if len(args) > 1:
+                default = args[1]
+                args = (args[0], _MISSING, *args[2:])
+            else:
+                default = kwargs.get("default")
+                kwargs["default"] = _MISSING
+
+        counters.depth += 1
+        start_time = time.perf_counter()
+        try:
+            result = method(self, *args, **kwargs)
+        finally:
+            counters.time += time.perf_counter() - start_time
+            counters.depth -= 1
+
+        if method_name in READ_METHODS:
+            count_read(method_name, args, kwargs, result)
+        elif method_name in WRITE_METHODS:
+            counters.sets += 1
+        else:
+            counters.deletes += 1
+
+        if result is _MISSING:
+            return default
+        return result
+
+    wrapper._processinfo_instrumented = True
+    return wrapper
+
+
+def instrument_backend_class(backend_class):
+    for method_name in READ_METHODS + WRITE_METHODS + DELETE_METHODS:
+        method = getattr(backend_class, method_name, None)
+        if method is None or getattr(method, "_processinfo_instrumented", False):
+            continue
+        setattr(backend_class, method_name, instrument_method(method, method_name))
+
+
+def install():
+    """
+    Wrap the methods of all configured cache backends (only once)
+    """
+    for alias in settings.CACHES:
+        instrument_backend_class(type(caches[alias]))
+
+
+def snapshot():
+    return threading.get_ident(), tuple(getattr(counters, name) for name in CACHE_COUNTERS)
+
+
+def get_deltas(start):
+    """
+    returns a dict with the cache usage since the snapshot 'start'
+    (None if the snapshot was taken in a other thread, e.g. ASGI)
+
+    >>> from django.core.cache.backends.locmem import LocMemCache
+    >>> cache = LocMemCache("doctest", {})
+    >>> instrument_backend_class(LocMemCache)
+    >>> start = snapshot()
+    >>> cache.get("foo") is None
+    True
+    >>> cache.set("foo", "bar")
+    >>> cache.get("foo", default="default")
+    'bar'
+    >>> cache.get("unknown", "default")
+    'default'
+    >>> cache.get_many(["foo", "bar"])
+    {'foo': 'bar'}
+    >>> cache.delete("foo")
+    True
+    >>> deltas = get_deltas(start)
+    >>> [deltas[key] for key in ("hits", "misses", "sets", "deletes")]
+    [2, 3, 1, 1]
+    """
+    end = snapshot()
+    if end[0] != start[0]:
+        return None
+    return {name: end_value - start_value for name, start_value, end_value in zip(CACHE_COUNTERS, start[1], end[1])}
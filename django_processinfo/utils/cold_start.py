@@ -0,0 +1,51 @@
+"""
+    django-processinfo - utils
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Measure the time from the process spawn until the application is ready.
+
+    :copyleft: 2011-2022 by the django-processinfo team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import os
+
+from django_processinfo.utils.proc_info import process_age
+
+
+class StartupTimer:
+    """
+    >>> timer = StartupTimer()
+    >>> timer.get_startup_time() is None
+    True
+    >>> timer.ready()
+    >>> timer.get_startup_time() >= 0
+    True
+    """
+
+    def __init__(self):
+        self.pid = None
+        self.startup_time = None
+
+    def ready(self):
+        """
+        Called if the middleware is created: Django is set up and the WSGI/ASGI handler is loaded.
+        """
+        if self.pid == os.getpid():
+            return  # Already ready, e.g.: a other handler instance
+
+        self.pid = os.getpid()
+        try:
+            self.startup_time = process_age()
+        except OSError:  # e.g.: /proc not available
+            self.startup_time = None
+
+    def get_startup_time(self):
+        """
+        returns the seconds from the process spawn until the application was ready
+        """
+        if self.pid is not None and self.pid != os.getpid():
+            # This process was forked after the application was loaded,
+            # e.g.: gunicorn --preload: It was ready immediately
+            return 0.0
+        return self.startup_time
@@ -0,0 +1,73 @@
+"""
+    django-processinfo - utils
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Count the requests that are processed at the same time in the current process.
+
+    :copyleft: 2011-2022 by the django-processinfo team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import threading
+
+
+class ConcurrencyGauge:
+    """
+    Thread-safe in-flight request counter that also measures the time
+    in which the process was saturated (in-flight requests >= limit).
+
+    >>> gauge = ConcurrencyGauge(now=0)
+    >>> gauge.enter(now=10, limit=2)
+    1
+    >>> gauge.enter(now=20, limit=2)
+    2
+    >>> gauge.leave(now=30, limit=2)
+    >>> gauge.leave(now=40, limit=2)
+    >>> gauge.in_flight
+    0
+
+    Saturated from 20 to 30 -> 10 of 40 seconds:
+    >>> gauge.get_saturation(now=40, limit=2)
+    25.0
+    """
+
+    def __init__(self, now):
+        self.lock = threading.Lock()
+        self.start_time = now
+        self.last_change = now
+        self.in_flight = 0
+        self.saturated_time = 0.0  # Seconds with in-flight requests >= limit
+
+    def _update(self, now, limit):
+        elapsed = now - self.last_change
+        if elapsed <= 0:
+            return
+
+        if limit and self.in_flight >= limit:
+            self.saturated_time += elapsed
+        self.last_change = now
+
+    def enter(self, now, limit):
+        """
+        A new request starts. Returns the current in-flight count (incl. the new request)
+        """
+        with self.lock:
+            self._update(now, limit)
+            self.in_flight += 1
+            return self.in_flight
+
+    def leave(self, now, limit):
+        with self.lock:
+            self._update(now, limit)
+            self.in_flight -= 1
+
+    def get_saturation(self, now, limit):
+        """
+        returns the percentage of time in which the process was saturated
+        """
+        with self.lock:
+            self._update(now, limit)
+            total_time = now - self.start_time
+            if total_time <= 0:
+                return 0.0
+            return self.saturated_time / total_time * 100
@@ -0,0 +1,168 @@
+"""
+    django-processinfo - utils
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Database connection lifecycle of the current process per database alias,
+    see: settings.PROCESSINFO.DB_CONNECTION_STATS
+
+        * number of new connections and the connect latency
+        * number of requests served per connection (e.g.: to check CONN_MAX_AGE)
+        * time spent in close_old_connections() and the number of closed connections
+
+    connect() and close_if_unusable_or_obsolete() of the database backend classes
+    are wrapped once, in AppConfig.ready(). (The connection_created signal
+    doesn't contain the time that was needed to connect)
+
+    :copyleft: 2011-2022 by the django-processinfo team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import functools
+import os
+import threading
+import time
+
+from django.db import connections
+
+
+class ConnectionInfo:
+    def __init__(self, alias, vendor):
+        self.alias = alias
+        self.vendor = vendor
+        self.connect_count = 0
+        self.connect_time_sum = 0.0
+        self.connect_time_max = 0.0
+        self.request_count = 0  # requests that were served with a open connection
+        self.close_check_count = 0
+        self.close_check_time_sum = 0.0
+        self.close_count = 0  # closed by close_old_connections(): obsolete or unusable
+
+
+class ConnectionMonitor:
+    """
+    Collects the values of all threads of the current process.
+
+    >>> monitor = ConnectionMonitor()
+    >>> class FakeConnection:
+    ...     alias, vendor, connection = "default", "sqlite", None
+    ...     def connect(self):
+    ...         self.connection = object()
+    ...     def close_if_unusable_or_obsolete(self):
+    ...         self.connection = None
+    >>> FakeConnection.connect = instrument_connect(FakeConnection.connect, monitor)
+    >>> FakeConnection.close_if_unusable_or_obsolete = instrument_close_check(
+    ...     FakeConnection.close_if_unusable_or_obsolete, monitor
+    ... )
+    >>> conn = FakeConnection()
+    >>> conn.connect()
+    >>> monitor.request_finished([conn])
+    >>> monitor.request_finished([conn])
+    >>> conn.close_if_unusable_or_obsolete()
+    >>> monitor.request_finished([conn])  # not counted: no connection
+    >>> info = monitor.get_values()[0]
+    >>> info.alias, info.connect_count, info.request_count, info.close_check_count, info.close_count
+    ('default', 1, 2, 1, 1)
+    >>> info.connect_time_sum >= info.connect_time_max > 0
+    True
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.pid = os.getpid()
+        self.connections = {}  # alias -> ConnectionInfo
+
+    def _get(self, connection):
+        if self.pid != os.getpid():
+            # Forked (e.g.: gunicorn --preload): Don't count the connections of the parent process
+            self.pid = os.getpid()
+            self.connections = {}
+        info = self.connections.get(connection.alias)
+        if info is None:
+            info = self.connections[connection.alias] = ConnectionInfo(connection.alias, connection.vendor)
+        return info
+
+    def connected(self, connection, duration):
+        with self.lock:
+            info = self._get(connection)
+            info.connect_count += 1
+            info.connect_time_sum += duration
+            info.connect_time_max = max(info.connect_time_max, duration)
+
+    def close_checked(self, connection, duration, closed):
+        with self.lock:
+            info = self._get(connection)
+            info.close_check_count += 1
+            info.close_check_time_sum += duration
+            if closed:
+                info.close_count += 1
+
+    def request_finished(self, connection_list):
+        """
+        Count the request for all open connections of the current thread.
+        """
+        with self.lock:
+            for connection in connection_list:
+                if connection.connection is not None:
+                    self._get(connection).request_count += 1
+
+    def get_values(self):
+        """
+        returns a copy of the ConnectionInfo instances
+        """
+        with self.lock:
+            if self.pid != os.getpid():
+                return []
+            values = []
+            for info in self.connections.values():
+                copy = ConnectionInfo(info.alias, info.vendor)
+                copy.__dict__.update(info.__dict__)
+                values.append(copy)
+            return values
+
+
+# Values of the current process:
+monitor = ConnectionMonitor()
+
+
+def instrument_connect(connect, monitor):
+    @functools.wraps(connect)
+    def wrapper(self, *args, **kwargs):
+        start_time = time.perf_counter()
+        result = connect(self, *args, **kwargs)
+        monitor.connected(self, duration=time.perf_counter() - start_time)
+        return result
+
+    wrapper._processinfo_instrumented = True
+    return wrapper
+
+
+def instrument_close_check(close_if_unusable_or_obsolete, monitor):
+    @functools.wraps(close_if_unusable_or_obsolete)
+    def wrapper(self, *args, **kwargs):
+        was_open = self.connection is not None
+        start_time = time.perf_counter()
+        try:
+            return close_if_unusable_or_obsolete(self, *args, **kwargs)
+        finally:
+            monitor.close_checked(
+                self,
+                duration=time.perf_counter() - start_time,
+                closed=was_open and self.connection is None,
+            )
+
+    wrapper._processinfo_instrumented = True
+    return wrapper
+
+
+def install():
+    """
+    Wrap the database backend classes of all configured databases (only once)
+    """
+    for connection in connections.all():
+        connection_class = type(connection)
+        if not getattr(connection_class.connect, "_processinfo_instrumented", False):
+            connection_class.connect = instrument_connect(connection_class.connect, monitor)
+        if not getattr(connection_class.close_if_unusable_or_obsolete, "_processinfo_instrumented", False):
+            connection_class.close_if_unusable_or_obsolete = instrument_close_check(
+                connection_class.close_if_unusable_or_obsolete, monitor
+            )
@@ -0,0 +1,73 @@
+"""
+    django-processinfo - utils
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Measure the garbage collector pauses via gc.callbacks
+
+    :copyleft: 2011-2022 by the django-processinfo team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import gc
+import time
+
+
+GENERATIONS = (0, 1, 2)
+
+
+class GCMonitor:
+    """
+    Accumulate the number of collections and the pause times per generation.
+    The pause time of a request is the difference of two snapshots, so every
+    in-flight request gets the complete pause time: All threads are stopped.
+
+    >>> monitor = GCMonitor()
+    >>> monitor.install()
+    >>> start = monitor.snapshot()
+    >>> unreachable = gc.collect(2)
+    >>> deltas = monitor.get_deltas(start)
+    >>> deltas['gc_count_2']
+    1
+    >>> deltas['gc_time_2'] > 0
+    True
+    >>> monitor.uninstall()
+    """
+
+    def __init__(self):
+        self.counts = [0] * len(GENERATIONS)
+        self.times = [0.0] * len(GENERATIONS)
+        self.start_time = None
+
+    def install(self):
+        if self.callback not in gc.callbacks:
+            gc.callbacks.append(self.callback)
+
+    def uninstall(self):
+        if self.callback in gc.callbacks:
+            gc.callbacks.remove(self.callback)
+
+    def callback(self, phase, info):
+        # time.perf_counter() is the clock with the highest resolution for short durations.
+        # It's used for all timings inside a request (GC pauses, SQL queries, cache calls,
+        # templates, middlewares and connects). time.monotonic() is used for the request itself.
+        if phase == "start":
+            self.start_time = time.perf_counter()
+        elif self.start_time is not None:
+            generation = info["generation"]
+            self.counts[generation] += 1
+            self.times[generation] += time.perf_counter() - self.start_time
+            self.start_time = None
+
+    def snapshot(self):
+        return tuple(self.counts), tuple(self.times)
+
+    def get_deltas(self, start):
+        """
+        returns a dict with the model field names as keys, e.g.: 'gc_count_0'
+        """
+        start_counts, start_times = start
+        deltas = {}
+        for generation in GENERATIONS:
+            deltas[f"gc_count_{generation}"] = self.counts[generation] - start_counts[generation]
+            deltas[f"gc_time_{generation}"] = self.times[generation] - start_times[generation]
+        return deltas
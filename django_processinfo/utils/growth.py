@@ -0,0 +1,82 @@
+"""
+    django-processinfo - utils
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Online least squares fit, e.g. to estimate the memory growth of a worker
+    per request. Only the means, the sums of squared deviations and the
+    co-moments are stored (Welford's algorithm), so a update is O(1) and
+    numerical stable.
+
+    :copyleft: 2011-2022 by the django-processinfo team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+
+def update_growth_fit(obj, prefix, x_values, y_values):
+    """
+    Add one data point to the fits of all y values against all x values.
+    Used attributes:
+        "<prefix>_count"
+        "<prefix>_<x>_mean", "<prefix>_<x>_m2" for all x names
+        "<prefix>_<y>_mean", "<prefix>_<y>_m2" for all y names
+        "<prefix>_<y>_<x>_co" for all combinations
+
+    >>> from types import SimpleNamespace
+    >>> obj = SimpleNamespace(
+    ...     fit_count=0, fit_x_mean=0, fit_x_m2=0, fit_y_mean=0, fit_y_m2=0, fit_y_x_co=0
+    ... )
+    >>> for x in range(1, 11):
+    ...     update_growth_fit(obj, "fit", x_values={"x": x}, y_values={"y": 100 + 3 * x})
+    >>> obj.fit_count, obj.fit_x_mean, obj.fit_y_mean
+    (10, 5.5, 116.5)
+    >>> get_slope(obj, "fit", y_name="y", x_name="x")
+    3.0
+    >>> get_r_squared(obj, "fit", y_name="y", x_name="x")
+    1.0
+    """
+    count = getattr(obj, f"{prefix}_count") + 1
+
+    x_deltas = {}
+    for x_name, x in x_values.items():
+        mean_attr = f"{prefix}_{x_name}_mean"
+        m2_attr = f"{prefix}_{x_name}_m2"
+        delta = x - getattr(obj, mean_attr)
+        mean = getattr(obj, mean_attr) + delta / count
+        setattr(obj, mean_attr, mean)
+        setattr(obj, m2_attr, getattr(obj, m2_attr) + delta * (x - mean))
+        x_deltas[x_name] = delta
+
+    for y_name, y in y_values.items():
+        mean_attr = f"{prefix}_{y_name}_mean"
+        m2_attr = f"{prefix}_{y_name}_m2"
+        delta = y - getattr(obj, mean_attr)
+        mean = getattr(obj, mean_attr) + delta / count
+        setattr(obj, mean_attr, mean)
+        setattr(obj, m2_attr, getattr(obj, m2_attr) + delta * (y - mean))
+        for x_name, x_delta in x_deltas.items():
+            co_attr = f"{prefix}_{y_name}_{x_name}_co"
+            setattr(obj, co_attr, getattr(obj, co_attr) + x_delta * (y - mean))
+
+    setattr(obj, f"{prefix}_count", count)
+
+
+def get_slope(obj, prefix, y_name, x_name):
+    """
+    returns the slope of the least squares line (0 if not enough data)
+    """
+    x_m2 = getattr(obj, f"{prefix}_{x_name}_m2")
+    if not x_m2:
+        return 0.0
+    return getattr(obj, f"{prefix}_{y_name}_{x_name}_co") / x_m2
+
+
+def get_r_squared(obj, prefix, y_name, x_name):
+    """
+    returns the coefficient of determination: 1.0 == all points are on the line
+    """
+    x_m2 = getattr(obj, f"{prefix}_{x_name}_m2")
+    y_m2 = getattr(obj, f"{prefix}_{y_name}_m2")
+    if not x_m2 or not y_m2:
+        return 0.0
+    co = getattr(obj, f"{prefix}_{y_name}_{x_name}_co")
+    return co * co / (x_m2 * y_m2)
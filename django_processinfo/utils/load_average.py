@@ -0,0 +1,169 @@
+"""
+    django-processinfo - utils
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    1, 5 and 15 minute exponentially-damped moving averages,
+    in the spirit of the kernel load average (see: os.getloadavg())
+
+    All updates are O(1): Values are only collected and the averages
+    are updated lazily in fixed tick intervals.
+
+    :copyleft: 2011-2022 by the django-processinfo team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import abc
+import math
+import threading
+
+
+LOAD_WINDOWS = (60, 5 * 60, 15 * 60)  # 1, 5 and 15 minutes in seconds
+TICK_INTERVAL = 5  # seconds, like the LOAD_FREQ from the kernel
+
+
+def decay(value, elapsed, window):
+    """
+    Decay a rate average for 'elapsed' seconds without any events.
+
+    >>> decay(10, 0, 60)
+    10.0
+    >>> round(decay(10, 60, 60), 4)
+    3.6788
+    """
+    return value * math.exp(-elapsed / window)
+
+
+class BaseMovingAverages(abc.ABC):
+    def __init__(self, now, tick_interval=TICK_INTERVAL, windows=LOAD_WINDOWS):
+        self.tick_interval = tick_interval
+        self.windows = windows
+        self.alphas = tuple(1 - math.exp(-tick_interval / window) for window in windows)
+        self.averages = [0.0] * len(windows)
+        self.pending_sum = 0.0
+        self.pending_count = 0
+        self.last_tick = now
+
+    @abc.abstractmethod
+    def update_averages(self, ticks):
+        """
+        Update the averages with the pending values of the past 'ticks' intervals.
+        """
+
+    def tick(self, now):
+        ticks = int((now - self.last_tick) // self.tick_interval)
+        if ticks < 1:
+            return
+
+        self.last_tick += ticks * self.tick_interval
+        self.update_averages(ticks)
+        self.pending_sum = 0.0
+        self.pending_count = 0
+
+    def add(self, now, value=1):
+        self.tick(now)
+        self.pending_sum += value
+        self.pending_count += 1
+
+    def get(self, now):
+        """
+        returns the 1, 5 and 15 minute averages as tuple
+        """
+        self.tick(now)
+        return tuple(self.averages)
+
+
+class RateAverages(BaseMovingAverages):
+    """
+    Moving averages of a rate per second, e.g. requests/sec.
+    The averages decay in time without events.
+
+    >>> rate = RateAverages(now=0)
+    >>> for now in range(0, 60):
+    ...     rate.add(now, value=2)  # two events per second
+    >>> [round(avg, 2) for avg in rate.get(now=60)]
+    [1.26, 0.36, 0.13]
+    >>> [round(avg, 2) for avg in rate.get(now=15 * 60)]
+    [0.0, 0.02, 0.05]
+    """
+
+    def update_averages(self, ticks):
+        rate = self.pending_sum / self.tick_interval
+        idle_time = (ticks - 1) * self.tick_interval
+        for index, (alpha, window) in enumerate(zip(self.alphas, self.windows)):
+            average = self.averages[index]
+            average += alpha * (rate - average)
+            if idle_time:
+                average = decay(average, idle_time, window)
+            self.averages[index] = average
+
+
+class MeanAverages(BaseMovingAverages):
+    """
+    Moving averages of values, e.g. the response time.
+    The averages stay unchanged in time without values.
+
+    >>> response_time = MeanAverages(now=0)
+    >>> response_time.get(now=10)
+    (0.0, 0.0, 0.0)
+    >>> response_time.add(now=10, value=0.5)
+    >>> response_time.get(now=15)
+    (0.5, 0.5, 0.5)
+    >>> response_time.add(now=20, value=1.5)
+    >>> [round(avg, 2) for avg in response_time.get(now=60 * 60)]
+    [0.58, 0.52, 0.51]
+    """
+
+    def update_averages(self, ticks):
+        if not self.pending_count:
+            return
+
+        mean = self.pending_sum / self.pending_count
+        for index, alpha in enumerate(self.alphas):
+            if self.averages[index] == 0.0:
+                # first value
+                self.averages[index] = mean
+            else:
+                self.averages[index] += alpha * (mean - self.averages[index])
+
+
+class WorkerLoad:
+    """
+    The moving averages of the current process.
+
+    >>> load = WorkerLoad(now=0)
+    >>> load.add_request(now=1, response_time=0.5, processor_time=0.25, exception=False)
+    >>> load.add_request(now=2, response_time=1.5, processor_time=0.75, exception=True)
+    >>> values = load.get_values(now=5)
+    >>> [round(values[key], 3) for key in ('request_rate_1', 'error_rate_1', 'cpu_load_1')]
+    [0.032, 0.016, 0.016]
+    >>> values['response_time_1']
+    1.0
+    """
+
+    def __init__(self, now):
+        self.lock = threading.Lock()
+        self.averages = {
+            'request_rate': RateAverages(now),  # requests per second
+            'error_rate': RateAverages(now),  # exceptions per second
+            'cpu_load': RateAverages(now),  # processor seconds per second
+            'response_time': MeanAverages(now),  # seconds
+        }
+
+    def add_request(self, now, response_time, processor_time, exception):
+        with self.lock:
+            self.averages['request_rate'].add(now)
+            if exception:
+                self.averages['error_rate'].add(now)
+            self.averages['cpu_load'].add(now, value=processor_time)
+            self.averages['response_time'].add(now, value=response_time)
+
+    def get_values(self, now):
+        """
+        returns a dict with the model field names as keys, e.g.: 'request_rate_1'
+        """
+        values = {}
+        with self.lock:
+            for prefix, averages in self.averages.items():
+                for minutes, value in zip((1, 5, 15), averages.get(now)):
+                    values[f'{prefix}_{minutes}'] = value
+        return values
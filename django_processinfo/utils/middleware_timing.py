@@ -0,0 +1,184 @@
+"""
+    django-processinfo - utils
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Measure the time of every middleware per request,
+    see: settings.PROCESSINFO.MIDDLEWARE_TIMING
+
+    The __call__() of the middleware classes in settings.MIDDLEWARE and the view
+    handling (BaseHandler._get_response() and _get_response_async()) are wrapped once,
+    in AppConfig.ready(). The time is only collected if a MiddlewareCollector is active
+    in the current context (thread or async task). (Middleware factory functions can't be wrapped)
+
+    Under ASGI a middleware __call__() returns a coroutine: The time is measured until it's done.
+
+    :copyleft: 2011-2022 by the django-processinfo team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import asyncio
+import contextvars
+import functools
+import time
+
+from django.conf import settings
+from django.core.handlers.base import BaseHandler
+from django.utils.module_loading import import_string
+
+
+# A context variable and not a threading.local(): Async tasks share the thread, but not the context
+_collector = contextvars.ContextVar("processinfo_middleware_collector", default=None)
+
+# Name of the view handling (URL resolving, view middlewares, the view and the rendering):
+VIEW = "<view>"
+
+OWN_MIDDLEWARE = "django_processinfo.middlewares.ProcessInfoMiddleware"
+
+
+def instrument_call(call, name):
+    if asyncio.iscoroutinefunction(call):
+        wrapper = instrument_async_call(call, name)
+    else:
+        wrapper = instrument_sync_call(call, name)
+    wrapper._processinfo_instrumented = True
+    return wrapper
+
+
+def instrument_sync_call(call, name):
+    """
+    A sync __call__() returns a coroutine under ASGI (e.g.: MiddlewareMixin.__acall__())
+    """
+    @functools.wraps(call)
+    def wrapper(self, *args, **kwargs):
+        collector = _collector.get()
+        if collector is None:
+            return call(self, *args, **kwargs)
+
+        collector.stack.append(0.0)
+        start_time = time.perf_counter()
+        try:
+            result = call(self, *args, **kwargs)
+        except BaseException:
+            collector.finish(name, start_time)
+            raise
+
+        if asyncio.iscoroutine(result):
+            return collector.finish_awaited(name, start_time, result)
+
+        collector.finish(name, start_time)
+        return result
+
+    return wrapper
+
+
+def instrument_async_call(call, name):
+    """
+    e.g.: BaseHandler._get_response_async() (Django checks if it's a coroutine function)
+    """
+    @functools.wraps(call)
+    async def wrapper(self, *args, **kwargs):
+        collector = _collector.get()
+        if collector is None:
+            return await call(self, *args, **kwargs)
+
+        collector.stack.append(0.0)
+        start_time = time.perf_counter()
+        try:
+            return await call(self, *args, **kwargs)
+        finally:
+            collector.finish(name, start_time)
+
+    return wrapper
+
+
+def install():
+    """
+    Wrap the __call__() of all middleware classes and the view handling of BaseHandler (only once)
+    """
+    for middleware_path in settings.MIDDLEWARE:
+        if middleware_path == OWN_MIDDLEWARE:
+            continue  # It's the measurement itself (the first middleware)
+        middleware = import_string(middleware_path)
+        if not isinstance(middleware, type):
+            continue  # A middleware factory function
+        if not getattr(middleware.__dict__.get("__call__"), "_processinfo_instrumented", False):
+            # Use the original method, if it's inherited from a other wrapped middleware:
+            call = getattr(middleware.__call__, "__wrapped__", middleware.__call__)
+            middleware.__call__ = instrument_call(call, name=middleware_path)
+
+    for method_name in ("_get_response", "_get_response_async"):
+        method = getattr(BaseHandler, method_name)
+        if not getattr(method, "_processinfo_instrumented", False):
+            setattr(BaseHandler, method_name, instrument_call(method, name=VIEW))
+
+
+class MiddlewareCollector:
+    """
+    Collects the inclusive time (with all inner middlewares and the view)
+    and the exclusive time (only the middleware itself) per middleware.
+
+    >>> def call(self, request):
+    ...     time.sleep(0.01)
+    ...     return self.get_response(request)
+    >>> class Outer:
+    ...     def __init__(self, get_response):
+    ...         self.get_response = get_response
+    ...     __call__ = instrument_call(call, name="Outer")
+    >>> class Inner(Outer):
+    ...     __call__ = instrument_call(call, name="Inner")
+    >>> handler = Outer(Inner(lambda request: "response"))
+    >>> with MiddlewareCollector() as collector:
+    ...     handler("request")
+    'response'
+    >>> outer, inner = collector.middlewares["Outer"], collector.middlewares["Inner"]
+    >>> outer.inclusive > inner.inclusive >= inner.exclusive >= 0.01
+    True
+    >>> abs(outer.exclusive - (outer.inclusive - inner.inclusive)) < 0.000001
+    True
+    """
+
+    def __init__(self):
+        self.middlewares = {}  # name -> MiddlewareInfo
+        self.stack = []  # time of the inner middlewares per active __call__()
+
+    def activate(self):
+        _collector.set(self)
+
+    def deactivate(self):
+        if _collector.get() is self:
+            _collector.set(None)
+
+    def __enter__(self):
+        self.activate()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.deactivate()
+
+    def finish(self, name, start_time):
+        inclusive = time.perf_counter() - start_time
+        child_time = self.stack.pop()
+        self.add(name, inclusive=inclusive, exclusive=inclusive - child_time)
+        if self.stack:
+            self.stack[-1] += inclusive
+
+    async def finish_awaited(self, name, start_time, coroutine):
+        try:
+            return await coroutine
+        finally:
+            self.finish(name, start_time)
+
+    def add(self, name, inclusive, exclusive):
+        try:
+            info = self.middlewares[name]
+        except KeyError:
+            info = self.middlewares[name] = MiddlewareInfo(name)
+        info.inclusive += inclusive
+        info.exclusive += exclusive
+
+
+class MiddlewareInfo:
+    def __init__(self, name):
+        self.name = name
+        self.inclusive = 0.0
+        self.exclusive = 0.0
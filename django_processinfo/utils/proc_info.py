@@ -10,6 +10,10 @@
 
 
 import datetime
+import os
+
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
 
 
 def process_information(pid=None):
@@ -70,6 +74,113 @@ def process_information(pid=None):
     return tuple(result)
 
 
+def process_stat(pid=None):
+    """
+    Get some process information from /proc/$$/stat (where $$ is the given pid).
+    If pid == None: We use "self" to get the current process information.
+
+    Times are converted to seconds and memory to bytes.
+    returns a tuple, which can be easy convert info a dict, e.g.:
+
+    >>> p = dict(process_stat())
+    >>> p["num_threads"] >= 1
+    True
+    >>> sorted(p.keys())
+    ['majflt', 'minflt', 'num_threads', 'rss', 'starttime', 'stime', 'utime', 'vsize']
+    """
+    if pid is None:
+        pid = "self"
+    path = f"/proc/{pid}/stat"
+
+    with open(path) as f:
+        data = f.read()
+
+    # The process name (second field) can contain spaces and brackets:
+    fields = data[data.rindex(")") + 2:].split()
+
+    clock_ticks = os.sysconf("SC_CLK_TCK")
+    return (
+        ("minflt", int(fields[7])),  # minor page faults
+        ("majflt", int(fields[9])),  # major page faults
+        ("utime", int(fields[11]) / clock_ticks),  # user mode time
+        ("stime", int(fields[12]) / clock_ticks),  # kernel mode time
+        ("num_threads", int(fields[17])),
+        ("starttime", int(fields[19]) / clock_ticks),  # start time after system boot
+        ("vsize", int(fields[20])),  # virtual memory size
+        ("rss", int(fields[21]) * PAGE_SIZE),  # resident set size
+    )
+
+
+def process_io(pid=None):
+    """
+    Get the I/O statistics from /proc/$$/io (where $$ is the given pid).
+    If pid == None: We use "self" to get the current process information.
+    Use e.g. pid="thread-self" for the current thread.
+
+    Note:
+      * read_bytes/write_bytes are only available with CONFIG_TASK_IO_ACCOUNTING
+      * Reading /proc/$$/io of other processes needs ptrace permissions.
+
+    >>> p = dict(process_io())
+    >>> p["rchar"] > 0
+    True
+    """
+    if pid is None:
+        pid = "self"
+    path = f"/proc/{pid}/io"
+
+    result = []
+    with open(path) as f:
+        for line in f:
+            key, value = line.split(":", 1)
+            result.append((key.strip(), int(value)))
+
+    return tuple(result)
+
+
+def smaps_rollup(pid=None):
+    """
+    Get the accumulated memory mappings from /proc/$$/smaps_rollup (where $$ is the given pid).
+    If pid == None: We use "self" to get the current process information.
+
+    Note:
+      * Only available since Linux 4.14
+      * It's expensive: The kernel must walk all page tables of the process!
+      * All values convert to bytes
+
+    >>> m = dict(smaps_rollup())
+    >>> m["Pss"] <= m["Rss"]
+    True
+    """
+    if pid is None:
+        pid = "self"
+    path = f"/proc/{pid}/smaps_rollup"
+
+    with open(path) as f:
+        f.readline()  # skip the header line, e.g.: "00400000-7ffebf1b8000 ---p 00000000 00:00 0 [rollup]"
+        return parse_smaps_rollup(f)
+
+
+def parse_smaps_rollup(lines):
+    """
+    >>> parse_smaps_rollup(["Rss:                1024 kB", "Pss:                 512 kB"])
+    (('Rss', 1048576), ('Pss', 524288))
+    >>> parse_smaps_rollup(["Rss:                1024 MB"])
+    Traceback (most recent call last):
+        ...
+    ValueError: Unexpected line in smaps_rollup: 'Rss:                1024 MB'
+    """
+    result = []
+    for line in lines:
+        key, _, values = line.partition(":")
+        values = values.split()
+        if len(values) != 2 or values[1] != "kB" or not values[0].isdigit():
+            raise ValueError(f"Unexpected line in smaps_rollup: {line!r}")
+        result.append((key, int(values[0]) * 1024))
+
+    return tuple(result)
+
+
 def meminfo():
     """
     returns information from /proc/meminfo
@@ -113,6 +224,64 @@ def meminfo():
     return tuple(result)
 
 
+def cpu_times():
+    """
+    Returns the accumulated CPU times of all CPUs from /proc/stat in jiffies
+    (USER_HZ, typically 1/100 sec.)
+
+    >>> c = dict(cpu_times())
+    >>> sorted(c.keys())
+    ['guest', 'guest_nice', 'idle', 'iowait', 'irq', 'nice', 'softirq', 'steal', 'system', 'user']
+    """
+    with open("/proc/stat") as f:
+        return parse_cpu_times(f.readline())
+
+
+def parse_cpu_times(line):
+    """
+    >>> dict(parse_cpu_times("cpu  10 1 5 100"))["idle"]
+    100
+    >>> dict(parse_cpu_times("cpu  10 1 5 100"))["steal"]  # Older kernels have not all fields
+    0
+    >>> parse_cpu_times("intr 123")
+    Traceback (most recent call last):
+        ...
+    ValueError: Unexpected first line in /proc/stat: 'intr 123'
+    """
+    values = line.split()
+    if not values or values[0] != "cpu" or not all(value.isdigit() for value in values[1:]):
+        raise ValueError(f"Unexpected first line in /proc/stat: {line!r}")
+
+    names = (
+        "user", "nice", "system", "idle", "iowait", "irq", "softirq", "steal", "guest", "guest_nice"
+    )
+    # Older kernels have not all fields:
+    values = [int(value) for value in values[1:]] + [0] * len(names)
+    return tuple(zip(names, values))
+
+
+def pressure_information(resource):
+    """
+    Returns the "Pressure Stall Information" from /proc/pressure/{cpu,memory,io}
+    e.g.: (("some_avg10", 0.0), ("some_avg60", 0.0), ("some_avg300", 0.0), ("some_total", 0), ...)
+
+    Note:
+      * Only available since Linux 4.20 and with CONFIG_PSI
+      * We don't catch the error, if /proc/pressure/... doesn't exists!
+    """
+    result = []
+    with open(f"/proc/pressure/{resource}") as f:
+        for line in f:
+            kind, *values = line.split()
+            for value in values:
+                key, value = value.split("=", 1)
+                if key == "total":
+                    result.append((f"{kind}_{key}", int(value)))
+                else:
+                    result.append((f"{kind}_{key}", float(value)))
+    return tuple(result)
+
+
 def uptime_infomation():
     """
     Returns a dict with informations from /proc/uptime
@@ -125,6 +294,32 @@ def uptime_infomation():
     return d
 
 
+def open_fd_count(pid=None):
+    """
+    returns the number of open file descriptors (entries in /proc/$$/fd)
+
+    >>> open_fd_count() > 0
+    True
+    """
+    if pid is None:
+        pid = "self"
+    return len(os.listdir(f"/proc/{pid}/fd"))
+
+
+def process_age(pid=None):
+    """
+    returns the seconds since the process was started
+    (resolution: clock ticks, usually 1/100 sec.)
+
+    >>> process_age() >= 0
+    True
+    """
+    starttime = dict(process_stat(pid))["starttime"]
+    with open("/proc/uptime") as f:
+        uptime = float(f.readline().split()[0])
+    return max(uptime - starttime, 0.0)
+
+
 if __name__ == "__main__":
     p = process_information()
     import pprint
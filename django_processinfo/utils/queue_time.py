@@ -0,0 +1,97 @@
+"""
+    django-processinfo - utils
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Calculate the time a request waits in the queue of e.g. nginx or gunicorn
+    before Django starts processing it. The proxy must set a timestamp header, e.g.:
+
+        nginx:
+            proxy_set_header X-Request-Start "t=${msec}";
+        Apache:
+            RequestHeader set X-Request-Start "%t"
+
+    :copyleft: 2011-2022 by the django-processinfo team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import math
+
+
+# The header is sent by the client, if no proxy replaces it. Ignore implausible queue times:
+MAX_QUEUE_TIME = 60 * 60
+
+
+def parse_request_start(value):
+    """
+    Returns the timestamp in seconds from a X-Request-Start/X-Queue-Start header value.
+    Seconds, milli-, micro- and nanoseconds are detected by the value size.
+
+    >>> parse_request_start('t=1660000000.123')  # nginx: t=${msec}
+    1660000000.123
+    >>> round(parse_request_start('t=1660000000123456'), 6)  # Apache: %t
+    1660000000.123456
+    >>> round(parse_request_start('1660000000123'), 3)
+    1660000000.123
+    >>> parse_request_start('t=') is None
+    True
+    >>> parse_request_start('foobar') is None
+    True
+
+    Values from a client are not trusted:
+    >>> [parse_request_start(f't={value}') for value in ('inf', '-inf', 'nan', '1e400', '1e30', '-1')]
+    [None, None, None, None, None, None]
+    """
+    value = value.strip()
+    if value.startswith('t='):
+        value = value[2:]
+
+    try:
+        timestamp = float(value)
+    except ValueError:
+        return None
+
+    if not math.isfinite(timestamp) or timestamp < 0:
+        return None
+
+    for _ in range(3):
+        if timestamp <= 1E11:
+            break
+        timestamp /= 1000  # Not seconds -> milli-, micro- or nanoseconds
+    else:
+        return None  # more than nanoseconds
+
+    return timestamp
+
+
+def get_queue_time(meta, header_names, now):
+    """
+    Returns the queue time in seconds (or None if no header was send)
+
+    >>> meta = {'HTTP_X_REQUEST_START': 't=1660000000.000'}
+    >>> get_queue_time(meta, header_names=('HTTP_X_REQUEST_START',), now=1660000000.25)
+    0.25
+    >>> get_queue_time(meta, header_names=('HTTP_X_QUEUE_START',), now=1660000000.25) is None
+    True
+
+    Timestamps in the future (e.g. not synchronized clocks) or older than MAX_QUEUE_TIME are ignored:
+    >>> get_queue_time(meta, header_names=('HTTP_X_REQUEST_START',), now=1659999999) is None
+    True
+    >>> get_queue_time(meta, header_names=('HTTP_X_REQUEST_START',), now=1660000000 + 2 * MAX_QUEUE_TIME) is None
+    True
+    """
+    for header_name in header_names:
+        value = meta.get(header_name)
+        if not value:
+            continue
+
+        request_start = parse_request_start(value)
+        if request_start is None:
+            continue
+
+        queue_time = now - request_start
+        if not 0 <= queue_time <= MAX_QUEUE_TIME:
+            continue
+
+        return queue_time
+
+    return None
@@ -0,0 +1,92 @@
+"""
+    django-processinfo - utils
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Throttled reading of the shared memory aware memory usage of the current process.
+
+    PSS (Proportional Set Size): private pages + shared pages divided by the number
+    of processes that share them. So the sum of the PSS of all forked workers is the
+    real memory usage (in contrast to the sum of VmRSS)
+    USS (Unique Set Size): Only the private pages, the memory that will be freed,
+    if the process exits.
+
+    :copyleft: 2011-2022 by the django-processinfo team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import logging
+import os
+import threading
+
+from django_processinfo.utils.proc_info import smaps_rollup
+
+
+logger = logging.getLogger(__name__)
+
+
+def get_memory_details(rollup):
+    """
+    >>> get_memory_details({
+    ...     "Rss": 400, "Pss": 250, "Shared_Clean": 200, "Shared_Dirty": 0,
+    ...     "Private_Clean": 50, "Private_Dirty": 150,
+    ... })
+    {'pss': 250, 'uss': 200, 'shared_clean': 200, 'private_dirty': 150}
+    """
+    return {
+        "pss": rollup["Pss"],
+        "uss": rollup["Private_Clean"] + rollup["Private_Dirty"],
+        "shared_clean": rollup["Shared_Clean"],
+        "private_dirty": rollup["Private_Dirty"],
+    }
+
+
+class SmapsThrottle:
+    """
+    Read /proc/self/smaps_rollup at most every 'interval' seconds per process.
+
+    >>> throttle = SmapsThrottle()
+    >>> values = throttle.get(now=0, interval=60)
+    >>> sorted(values.keys())
+    ['private_dirty', 'pss', 'shared_clean', 'uss']
+    >>> throttle.get(now=30, interval=60) is None
+    True
+    >>> throttle.get(now=60, interval=60) is None
+    False
+
+    A unexpected format doesn't break the request:
+    >>> from unittest import mock
+    >>> with mock.patch(f"{__name__}.smaps_rollup", side_effect=ValueError("Unexpected line")):
+    ...     SmapsThrottle().get(now=0, interval=60) is None
+    True
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.pid = None
+        self.next_time = None
+
+    def get(self, now, interval):
+        """
+        returns a dict with the memory details or None if it's not the time to read them.
+        """
+        pid = os.getpid()
+        with self.lock:
+            # Note: A forked process should read its own values as soon as possible.
+            if self.pid == pid and now < self.next_time:
+                return None
+            self.pid = pid
+            self.next_time = now + interval
+
+        try:
+            rollup = dict(smaps_rollup())
+        except OSError:  # e.g.: Linux older than 4.14
+            return None
+        except ValueError:
+            logger.exception("Can't parse smaps_rollup")
+            return None
+
+        try:
+            return get_memory_details(rollup)
+        except KeyError:
+            logger.exception("Missing value in smaps_rollup")
+            return None
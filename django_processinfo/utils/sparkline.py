@@ -0,0 +1,35 @@
+"""
+    django-processinfo - utils
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    :copyleft: 2011-2022 by the django-processinfo team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+
+def sparkline_points(values, width=120, height=20, max_value=None):
+    """
+    Returns the "points" attribute value of a SVG polyline.
+    None values are handled as 0.
+
+    >>> sparkline_points([0, 5, 10], width=10, height=10)
+    '0.0,10.0 5.0,5.0 10.0,0.0'
+    >>> sparkline_points([1, None, 1], width=10, height=10, max_value=2)
+    '0.0,5.0 5.0,10.0 10.0,5.0'
+    >>> sparkline_points([])
+    ''
+    """
+    values = [value or 0 for value in values]
+    if not values:
+        return ""
+
+    if max_value is None:
+        max_value = max(values)
+    if not max_value:
+        max_value = 1
+
+    step = width / max(len(values) - 1, 1)
+    return " ".join(
+        f"{index * step:.1f},{height - min(value / max_value, 1) * height:.1f}"
+        for index, value in enumerate(values)
+    )
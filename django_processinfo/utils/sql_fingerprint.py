@@ -0,0 +1,119 @@
+"""
+    django-processinfo - utils
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Normalize SQL queries into fingerprints and collect them per request,
+    e.g. to find the costliest queries and N+1 problems of a view.
+
+    :copyleft: 2011-2022 by the django-processinfo team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import hashlib
+import re
+import time
+
+
+STRING_RE = re.compile(r"'(?:[^']|'')*'")
+NUMBER_RE = re.compile(r"(?<![\w\"])-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?\b")
+PLACEHOLDER_RE = re.compile(r"%s|\?")
+IN_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+VALUES_LIST_RE = re.compile(r"\(\.\.\.\)(?:\s*,\s*\(\.\.\.\))+")
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_sql(sql):
+    """
+    Strip all literals and parameters, so the same query with other values
+    results in the same string.
+
+    >>> normalize_sql("SELECT * FROM foo WHERE id = 1 AND name = 'bar'")
+    'SELECT * FROM foo WHERE id = ? AND name = ?'
+    >>> normalize_sql('SELECT "t1"."id" FROM "t1" WHERE "t1"."id" IN (%s, %s, %s)')
+    'SELECT "t1"."id" FROM "t1" WHERE "t1"."id" IN (...)'
+    >>> normalize_sql("INSERT INTO foo (a, b) VALUES (%s, %s), (%s, %s)")
+    'INSERT INTO foo (a, b) VALUES (...)'
+    >>> normalize_sql("SELECT  a\\n FROM t2 LIMIT 21")
+    'SELECT a FROM t2 LIMIT ?'
+    """
+    sql = STRING_RE.sub("?", sql)
+    sql = NUMBER_RE.sub("?", sql)
+    sql = PLACEHOLDER_RE.sub("?", sql)
+    sql = IN_LIST_RE.sub("(...)", sql)
+    sql = VALUES_LIST_RE.sub("(...)", sql)
+    sql = WHITESPACE_RE.sub(" ", sql)
+    return sql.strip()
+
+
+def get_fingerprint(normalized_sql):
+    """
+    >>> get_fingerprint('SELECT ?')
+    '095f2345f262d090a83ff1ac64ca8c76'
+    """
+    return hashlib.md5(normalized_sql.encode("utf-8")).hexdigest()
+
+
+class QueryCollector:
+    """
+    A database "execute wrapper" that collects the number of executions and the time
+    per fingerprint, see:
+    https://docs.djangoproject.com/en/4.1/topics/db/instrumentation/
+
+    >>> collector = QueryCollector()
+    >>> def execute(sql, params, many, context):
+    ...     return "result"
+    >>> for pk in range(3):
+    ...     collector(execute, "SELECT * FROM foo WHERE id = %s", (pk,), False, {})
+    'result'
+    'result'
+    'result'
+    >>> collector(execute, "SELECT * FROM bar", (), False, {})
+    'result'
+    >>> sorted((info.sql, info.count) for info in collector.get_costliest(max_count=10))
+    [('SELECT * FROM bar', 1), ('SELECT * FROM foo WHERE id = ?', 3)]
+    """
+
+    def __init__(self):
+        self.queries = {}  # normalized SQL -> QueryInfo
+        self.normalize_cache = {}  # raw SQL -> normalized SQL
+
+    def __call__(self, execute, sql, params, many, context):
+        start_time = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - start_time
+            self.add(sql, duration)
+
+    def add(self, sql, duration):
+        try:
+            normalized_sql = self.normalize_cache[sql]
+        except KeyError:
+            normalized_sql = self.normalize_cache[sql] = normalize_sql(sql)
+
+        try:
+            info = self.queries[normalized_sql]
+        except KeyError:
+            info = self.queries[normalized_sql] = QueryInfo(normalized_sql)
+        info.count += 1
+        info.time_sum += duration
+        info.time_max = max(info.time_max, duration)
+
+    def get_costliest(self, max_count):
+        """
+        returns the QueryInfo instances with the highest total time
+        """
+        queries = sorted(self.queries.values(), key=lambda info: info.time_sum, reverse=True)
+        return queries[:max_count]
+
+
+class QueryInfo:
+    def __init__(self, sql):
+        self.sql = sql
+        self.count = 0
+        self.time_sum = 0.0
+        self.time_max = 0.0
+
+    @property
+    def fingerprint(self):
+        return get_fingerprint(self.sql)
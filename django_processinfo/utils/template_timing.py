@@ -0,0 +1,132 @@
+"""
+    django-processinfo - utils
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Measure the render time of the Django templates per request,
+    see: settings.PROCESSINFO.TEMPLATE_TIMING
+
+    django.template.base.Template.render() is wrapped once. The time is only
+    collected if a TemplateCollector is active in the current thread.
+
+    :copyleft: 2011-2022 by the django-processinfo team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import functools
+import threading
+import time
+
+from django.template.base import Template
+
+
+_local = threading.local()
+
+
+def get_template_name(template):
+    """
+    >>> get_template_name(Template("foo"))
+    '<unknown source>'
+    """
+    return getattr(template.origin, "template_name", None) or template.name or "<unknown source>"
+
+
+def instrument_render(render):
+    @functools.wraps(render)
+    def wrapper(self, context):
+        collector = getattr(_local, "collector", None)
+        if collector is None:
+            return render(self, context)
+
+        collector.stack.append(0.0)
+        start_time = time.perf_counter()
+        try:
+            return render(self, context)
+        finally:
+            duration = time.perf_counter() - start_time
+            child_time = collector.stack.pop()
+            collector.add(get_template_name(self), duration - child_time)
+            if collector.stack:
+                collector.stack[-1] += duration  # e.g.: {% include %}
+            else:
+                collector.time += duration
+
+    wrapper._processinfo_instrumented = True
+    return wrapper
+
+
+def install():
+    """
+    Wrap Template.render() (only once)
+    """
+    if not getattr(Template.render, "_processinfo_instrumented", False):
+        Template.render = instrument_render(Template.render)
+
+
+class TemplateCollector:
+    """
+    Collects the render count and the exclusive time per template
+    (the time of included templates is not counted twice).
+    'time' is the total render time of all templates.
+
+    >>> from django.template import Context, Engine
+    >>> install()
+    >>> engine = Engine(loaders=[("django.template.loaders.locmem.Loader", {
+    ...     "base.html": "{% for i in items %}{% include 'item.html' %}{% endfor %}",
+    ...     "item.html": "{{ i }}",
+    ... })])
+    >>> collector = TemplateCollector()
+    >>> with collector:
+    ...     engine.get_template("base.html").render(Context({"items": [1, 2, 3]}))
+    '123'
+    >>> sorted((info.name, info.count) for info in collector.get_costliest(max_count=10))
+    [('base.html', 1), ('item.html', 3)]
+    >>> collector.time >= sum(info.time_sum for info in collector.templates.values())
+    True
+    >>> engine.get_template("base.html").render(Context({"items": [4]}))
+    '4'
+    >>> collector.templates["item.html"].count
+    3
+    """
+
+    def __init__(self):
+        self.templates = {}  # template name -> TemplateInfo
+        self.stack = []  # time of the nested templates per active render() call
+        self.time = 0.0
+
+    def activate(self):
+        _local.collector = self
+
+    def deactivate(self):
+        if getattr(_local, "collector", None) is self:
+            _local.collector = None
+
+    def __enter__(self):
+        self.activate()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.deactivate()
+
+    def add(self, name, duration):
+        try:
+            info = self.templates[name]
+        except KeyError:
+            info = self.templates[name] = TemplateInfo(name)
+        info.count += 1
+        info.time_sum += duration
+        info.time_max = max(info.time_max, duration)
+
+    def get_costliest(self, max_count):
+        """
+        returns the TemplateInfo instances with the highest total time
+        """
+        templates = sorted(self.templates.values(), key=lambda info: info.time_sum, reverse=True)
+        return templates[:max_count]
+
+
+class TemplateInfo:
+    def __init__(self, name):
+        self.name = name
+        self.count = 0
+        self.time_sum = 0.0
+        self.time_max = 0.0
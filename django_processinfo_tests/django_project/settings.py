@@ -68,14 +68,29 @@ DATABASES = {
         # 'NAME': ':memory:'
         # https://docs.djangoproject.com/en/dev/ref/databases/#database-is-locked-errors
         'timeout': 30,
-    }
+    },
+    # Optional database for all django-processinfo tables, see: PROCESSINFO.DATABASE
+    'processinfo': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': str(__Path(PACKAGE_ROOT.parent, 'test-database-processinfo.sqlite3')),
+        'timeout': 30,
+    },
 }
 print(f'Use Database: {DATABASES["default"]["NAME"]!r}', file=__sys.stderr)
 
+DATABASE_ROUTERS = ['django_processinfo.routers.ProcessInfoRouter']
+
 # _____________________________________________________________________________
 
 PROCESSINFO.ADD_INFO = True
 
+# Don't cache the admin summary between the tests, see: PROCESSINFO.SUMMARY_CACHE_TTL
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+    },
+}
+
 # _____________________________________________________________________________
 # Internationalization
 
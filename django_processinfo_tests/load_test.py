@@ -0,0 +1,362 @@
+"""
+    Multi-process load test
+    ~~~~~~~~~~~~~~~~~~~~~~~
+
+    Start the test project with N forked WSGI worker processes (that accept on the
+    same socket, like gunicorn sync workers) on localhost, send a reproducible
+    mix of requests and verify the recorded statistics against the generated load:
+
+        * ProcessInfo.request_count per worker and in total
+        * ViewStatistics.request_count per view
+        * SiteStatistics.process_spawn == number of workers that handled requests
+        * recorded processor times <= processor times of the workers (from wait4())
+
+    The throughput is measured with and without the ProcessInfoMiddleware, e.g.:
+
+        ~/django-processinfo$ python -m django_processinfo_tests.load_test --workers 4 --requests 2000
+
+    Exit code is 1 if a check failed.
+
+    :copyleft: 2011-2022 by the django-processinfo team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import argparse
+import collections
+import http.client
+import json
+import os
+import random
+import signal
+import socket
+import sys
+import tempfile
+import threading
+import time
+import traceback
+from pathlib import Path
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer
+
+
+MIDDLEWARE = "django_processinfo.middlewares.ProcessInfoMiddleware"
+
+# path=weight, "/not/found/" is not resolved (no view name):
+DEFAULT_MIX = "/admin/login/=6,/admin/=3,/not/found/=1"
+
+
+def parse_mix(mix):
+    """
+    >>> parse_mix("/foo/=3,/bar/")
+    [('/foo/', 3), ('/bar/', 1)]
+    """
+    result = []
+    for item in mix.split(","):
+        path, _, weight = item.strip().partition("=")
+        result.append((path, int(weight or 1)))
+    return result
+
+
+def get_paths(mix, count, seed):
+    """
+    returns a reproducible shuffled list of request paths
+
+    >>> get_paths([("/a/", 3), ("/b/", 1)], count=8, seed=1).count("/a/")
+    6
+    """
+    total_weight = sum(weight for path, weight in mix)
+    paths = []
+    for path, weight in mix:
+        paths += [path] * round(count * weight / total_weight)
+    paths = paths[:count]
+    random.Random(seed).shuffle(paths)
+    return paths
+
+
+class QuietHandler(WSGIRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+class PreforkWSGIServer(WSGIServer):
+    """
+    WSGI server that uses a listening socket, shared with the other workers.
+    """
+    timeout = 0.1
+
+    def __init__(self, sock, application):
+        super().__init__(sock.getsockname(), QuietHandler, bind_and_activate=False)
+        self.socket.close()
+        self.socket = sock
+        self.server_name, self.server_port = sock.getsockname()[:2]
+        self.setup_environ()
+        self.set_app(application)
+
+    def get_request(self):
+        # The listening socket is non-blocking: Another worker may accept the connection first.
+        conn, addr = self.socket.accept()
+        conn.setblocking(True)
+        return conn, addr
+
+
+def serve(sock, result_path):
+    """
+    Worker process: Handle requests until SIGTERM and store the number of handled requests.
+    """
+    from django.core.handlers.wsgi import WSGIHandler
+
+    application = WSGIHandler()
+    request_count = 0
+
+    def counting_application(environ, start_response):
+        nonlocal request_count
+        request_count += 1
+        return application(environ, start_response)
+
+    stop = False
+
+    def handle_sigterm(signum, frame):
+        nonlocal stop
+        stop = True
+
+    signal.signal(signal.SIGTERM, handle_sigterm)
+
+    server = PreforkWSGIServer(sock, counting_application)
+    while not stop:
+        server.handle_request()
+
+    result_path.write_text(json.dumps({"pid": os.getpid(), "requests": request_count}))
+
+
+def start_workers(worker_count, sock, result_dir):
+    from django.db import connections
+
+    connections.close_all()  # Don't share the database connections with the workers
+    pids = []
+    for _ in range(worker_count):
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 0
+            try:
+                serve(sock, Path(result_dir, f"worker-{os.getpid()}.json"))
+            except BaseException:
+                exit_code = 1
+                traceback.print_exc()
+            finally:
+                os._exit(exit_code)
+        pids.append(pid)
+    return pids
+
+
+def stop_workers(pids, result_dir):
+    """
+    returns a dict with the handled requests and the processor time of every worker
+    """
+    for pid in pids:
+        os.kill(pid, signal.SIGTERM)
+
+    workers = {}
+    for pid in pids:
+        pid, status, rusage = os.wait4(pid, 0)
+        result_path = Path(result_dir, f"worker-{pid}.json")
+        if os.waitstatus_to_exitcode(status) != 0 or not result_path.exists():
+            raise RuntimeError(f"Worker {pid} failed (exit status: {status})")
+        workers[pid] = {
+            **json.loads(result_path.read_text()),
+            "processor_time": rusage.ru_utime + rusage.ru_stime,
+        }
+        result_path.unlink()
+    return workers
+
+
+def send_requests(address, paths, concurrency):
+    """
+    returns the status codes per path and the needed time
+    """
+    queue = collections.deque(paths)
+    results = collections.Counter()
+    lock = threading.Lock()
+
+    def worker():
+        while True:
+            try:
+                path = queue.popleft()
+            except IndexError:
+                return
+            conn = http.client.HTTPConnection(*address, timeout=60)
+            try:
+                conn.request("GET", path)
+                response = conn.getresponse()
+                response.read()
+            finally:
+                conn.close()
+            with lock:
+                results[(path, response.status)] += 1
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    start_time = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, time.monotonic() - start_time
+
+
+def get_expected_views(paths):
+    """
+    returns the expected ViewStatistics.request_count per view name
+    """
+    from django.urls import Resolver404, resolve
+
+    expected = collections.Counter()
+    for path in paths:
+        try:
+            view_name = resolve(path).view_name
+        except Resolver404:
+            continue
+        expected[view_name] += 1
+    return expected
+
+
+def check_statistics(paths, workers):
+    """
+    returns a list of (check name, ok, details) for the recorded statistics
+    """
+    from django.db.models import Sum
+
+    from django_processinfo.models import ProcessInfo, SiteStatistics, ViewStatistics
+
+    checks = []
+
+    recorded = dict(ProcessInfo.objects.order_by("pid").values_list("pid", "request_count"))
+    handled = {pid: workers[pid]["requests"] for pid in sorted(workers) if workers[pid]["requests"]}
+    checks.append(("requests per worker", recorded == handled, f"recorded {recorded} handled {handled}"))
+
+    total = sum(recorded.values())
+    checks.append(("total requests", total == len(paths), f"recorded {total} sent {len(paths)}"))
+
+    recorded_views = dict(ViewStatistics.objects.values_list("view_name", "request_count"))
+    expected_views = dict(get_expected_views(paths))
+    checks.append((
+        "requests per view", recorded_views == expected_views,
+        f"recorded {recorded_views} expected {expected_views}",
+    ))
+
+    process_spawn = SiteStatistics.objects.aggregate(Sum("process_spawn"))["process_spawn__sum"]
+    checks.append((
+        "process spawn count", process_spawn == len(handled),
+        f"recorded {process_spawn} workers {len(handled)}",
+    ))
+
+    for process_info in ProcessInfo.objects.all():
+        recorded_time = process_info.user_time_total + process_info.system_time_total
+        worker_time = workers[process_info.pid]["processor_time"]
+        checks.append((
+            f"processor time of {process_info.pid}",
+            # os.times() and wait4() are based on the same clock ticks:
+            recorded_time <= worker_time + 0.01,
+            f"recorded {recorded_time:.2f}s of {worker_time:.2f}s",
+        ))
+
+    return checks
+
+
+def run_round(paths, worker_count, concurrency, with_middleware):
+    from django.conf import settings
+    from django.db import connections
+
+    from django_processinfo.storage.orm import OrmStorage
+
+    OrmStorage().reset()
+
+    middleware = [name for name in settings.MIDDLEWARE if name != MIDDLEWARE]
+    if with_middleware:
+        middleware.insert(0, MIDDLEWARE)
+    settings.MIDDLEWARE = middleware
+
+    sock = socket.create_server(("127.0.0.1", 0), backlog=128)
+    sock.setblocking(False)
+    with tempfile.TemporaryDirectory() as result_dir:
+        pids = start_workers(worker_count, sock, result_dir)
+        try:
+            results, duration = send_requests(sock.getsockname()[:2], paths, concurrency)
+        finally:
+            workers = stop_workers(pids, result_dir)
+    sock.close()
+    connections.close_all()
+
+    server_errors = sum(count for (path, status), count in results.items() if status >= 500)
+    checks = [("no server errors", server_errors == 0, f"{server_errors} responses with status >= 500")]
+    if with_middleware:
+        checks += check_statistics(paths, workers)
+    return {
+        "with_middleware": with_middleware,
+        "requests": len(paths),
+        "duration": duration,
+        "throughput": len(paths) / duration,
+        "status_codes": {f"{path} {status}": count for (path, status), count in sorted(results.items())},
+        "checks": [{"name": name, "ok": ok, "details": details} for name, ok, details in checks],
+    }
+
+
+def setup_django(database_dir):
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "django_processinfo_tests.django_project.settings")
+
+    import django
+    from django.conf import settings
+
+    for alias, database in settings.DATABASES.items():
+        database["NAME"] = str(Path(database_dir, f"{alias}.sqlite3"))
+    settings.PROCESSINFO.DATABASE = "processinfo"  # The recommended setup for SQLite
+    settings.DEBUG = False  # e.g.: don't collect all queries in connection.queries
+    settings.ALLOWED_HOSTS = ["127.0.0.1"]
+    settings.LOGGING["loggers"]["django"]["level"] = "ERROR"  # No "Not Found" warnings
+    django.setup()
+
+    from django.core.management import call_command
+    for alias in settings.DATABASES:
+        call_command("migrate", database=alias, verbosity=0)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Multi-process load test of django-processinfo")
+    parser.add_argument("--workers", type=int, default=4, help="Number of forked WSGI workers")
+    parser.add_argument("--requests", type=int, default=1000, help="Number of requests per round")
+    parser.add_argument("--concurrency", type=int, default=8, help="Number of parallel client connections")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"Request mix as path=weight (default: {DEFAULT_MIX})")
+    parser.add_argument("--seed", type=int, default=1, help="Seed for the request order")
+    parser.add_argument("--json", action="store_true", help="Output the results as JSON")
+    args = parser.parse_args(argv)
+
+    paths = get_paths(parse_mix(args.mix), count=args.requests, seed=args.seed)
+
+    with tempfile.TemporaryDirectory() as database_dir:
+        setup_django(database_dir)
+        rounds = [
+            run_round(paths, args.workers, args.concurrency, with_middleware=with_middleware)
+            for with_middleware in (True, False)
+        ]
+
+    with_mw, without_mw = rounds
+    result = {
+        "workers": args.workers,
+        "concurrency": args.concurrency,
+        "rounds": rounds,
+        "overhead": (without_mw["throughput"] - with_mw["throughput"]) / without_mw["throughput"] * 100,
+        "ok": all(check["ok"] for round_result in rounds for check in round_result["checks"]),
+    }
+
+    if args.json:
+        print(json.dumps(result, indent=4))
+    else:
+        for round_result in rounds:
+            title = "with" if round_result["with_middleware"] else "without"
+            print(f"{title} ProcessInfoMiddleware: {round_result['throughput']:.1f} requests/s")
+            for check in round_result["checks"]:
+                print(f"    [{'OK' if check['ok'] else 'FAIL'}] {check['name']}: {check['details']}")
+        print(f"Throughput overhead: {result['overhead']:.1f}%")
+
+    return 0 if result["ok"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,12 +5,31 @@ from unittest import mock
 from bx_django_utils.test_utils.datetime import MockDatetimeGenerator
 from bx_django_utils.test_utils.html_assertion import HtmlAssertionMixin
 from bx_py_utils.test_utils.time import MockTimeMonotonicGenerator
+from django.conf import settings
+from django.contrib import admin
 from django.contrib.auth.models import User
-from django.test import TestCase
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase, override_settings
 from django.utils import timezone
 from model_bakery import baker
 
-from django_processinfo.models import ProcessInfo, SiteStatistics
+from django_processinfo import middlewares
+from django_processinfo.admin import BaseModelAdmin
+from django_processinfo.instrument import measure
+from django_processinfo.models import (
+    ConnectionStatistics,
+    MiddlewareStatistics,
+    OutcomeStatistics,
+    ProcessInfo,
+    QueryFingerprint,
+    SiteStatistics,
+    TemplateStatistics,
+    ViewStatistics,
+    WarmupStatistics,
+)
+from django_processinfo.storage import get_storage
+from django_processinfo.utils.load_average import WorkerLoad
 
 
 class AdminAnonymousTests(TestCase):
@@ -63,6 +82,9 @@ class ProcessinfoAdminTestCase(HtmlAssertionMixin, TestCase):
                 '<title>Select Site statistics to change | Django site admin</title>',
                 '<h2>System information</h2>',
                 '<dt>Living processes (current/avg/max)</dt>',
+                '<dt>GC time share (garbage collector pauses in relation to response time)</dt>',
+                '<dt>Memory leak suspects (living processes)</dt>',
+                '<dt>Warm-up (first 10 requests) vs. steady state response time (avg)</dt>',
                 '<small>django-processinfo: 1000.0 ms of 1000.0 ms (100.0%)</small>',
             ),
         )
@@ -91,3 +113,316 @@ class ProcessinfoAdminTestCase(HtmlAssertionMixin, TestCase):
         )
         assert SiteStatistics.objects.count() == 1
         assert ProcessInfo.objects.count() == 1
+
+    @mock.patch.object(time, 'monotonic', MockTimeMonotonicGenerator(offset=10))
+    @mock.patch.object(middlewares, 'worker_load', WorkerLoad(now=0))
+    def test_processinfo_load_averages(self):
+        self.client.force_login(self.superuser)
+
+        self.client.get('/admin/login/')
+        self.client.get('/admin/login/')
+        process_info = ProcessInfo.objects.get()
+        assert process_info.request_rate_1 > 0
+        assert process_info.response_time_1 > 0
+
+        response = self.client.get(
+            f'/admin/django_processinfo/processinfo/{process_info.pk}/change/'
+        )
+        self.assert_html_parts(
+            response,
+            parts=(
+                '<label>Requests/s (1/5/15 min):</label>',
+                '<label>CPU load (1/5/15 min):</label>',
+            ),
+        )
+
+    def test_sitestatistics_pss(self):
+        self.client.force_login(self.superuser)
+
+        memory_details = {
+            'pss': 10 * 1024 * 1024, 'uss': 8 * 1024 * 1024,
+            'shared_clean': 4 * 1024 * 1024, 'private_dirty': 6 * 1024 * 1024,
+        }
+        with mock.patch.object(middlewares.smaps_throttle, 'get', return_value=memory_details):
+            self.client.get('/admin/login/')
+
+            process_info = ProcessInfo.objects.get()
+            assert process_info.pss_count == 1
+            assert process_info.pss_avg == 10 * 1024 * 1024
+            assert process_info.uss == 8 * 1024 * 1024
+
+            response = self.client.get('/admin/django_processinfo/sitestatistics/')
+
+        # The admin totals use the PSS:
+        self.assert_html_parts(
+            response,
+            parts=(
+                '<dt>Proportional set size (PSS)</dt>',
+                '<dd>10.0\xa0MB / 10.0\xa0MB / 10.0\xa0MB</dd>',
+                '<dt>Non-paged memory (VmRSS, shared pages counted per process)</dt>',
+                '<td class="field-sum_memory_avg">10.0\xa0MB (PSS)</td>',
+            ),
+        )
+
+    @mock.patch.object(settings.PROCESSINFO, 'SMAPS_INTERVAL', None)
+    def test_sitestatistics_without_pss(self):
+        self.client.force_login(self.superuser)
+        self.client.get('/admin/login/')
+        assert ProcessInfo.objects.get().pss_count == 0
+
+        response = self.client.get('/admin/django_processinfo/sitestatistics/')
+        self.assertContains(response, '(VmRSS)</td>')
+        self.assertContains(response, '<dt>Non-paged memory (VmRSS)</dt>', html=True)
+        self.assertNotContains(response, 'Proportional set size (PSS)')
+        self.assertNotContains(response, 'shared pages counted per process')
+
+    def test_summary_memory_totals(self):
+        mb = 1024 * 1024
+        other_site = Site.objects.create(domain='other.tld', name='other')
+        for pid, site, pss in ((4194305, Site.objects.get_current(), 3 * mb), (4194306, other_site, 0)):
+            baker.make(SiteStatistics, site=site, process_spawn=1, process_count_avg=1)
+            baker.make(
+                ProcessInfo, site=site, pid=pid, alive=False,
+                memory_min=2 * mb, memory_avg=2 * mb, memory_max=2 * mb,
+                pss_count=1 if pss else 0, pss_min=pss, pss_avg=pss, pss_max=pss,
+            )
+
+        extra_context, aggregate_data = admin.site._registry[SiteStatistics].compute_summary()
+
+        # The memory of every site is multiplied with the process count of this site:
+        assert extra_context['memory_avg'] == 4 * mb
+        # The PSS of the first site and the VmRSS of the other site:
+        assert extra_context['total_memory_avg'] == 5 * mb
+        assert extra_context['total_memory_title'] == 'Memory (PSS, VmRSS for sites without PSS)'
+
+    def test_queryfingerprint(self):
+        self.client.force_login(self.superuser)
+        baker.make(
+            QueryFingerprint, view_name='foo:bar', sql='SELECT * FROM foo WHERE id = ?',
+            request_count=2, execution_count=30, execution_max=20, n_plus_one_count=1,
+            time_sum=0.3, time_max=0.02,
+        )
+        response = self.client.get('/admin/django_processinfo/queryfingerprint/')
+        self.assert_html_parts(
+            response,
+            parts=(
+                '<title>Select Query fingerprints to change | Django site admin</title>',
+                '<td class="field-sql_short">SELECT * FROM foo WHERE id = ?</td>',
+                '<td class="field-time_avg">10.00 ms / 20.00 ms</td>',
+                '<td class="field-executions_per_request">15.0 / 20</td>',
+            ),
+        )
+
+    def test_outcomestatistics(self):
+        self.client.force_login(self.superuser)
+        baker.make(
+            OutcomeStatistics, view_name='foo:bar', outcome_type='status', outcome='5xx',
+            request_count=2, response_time_avg=1.5, response_time_max=2, response_time_sum=3,
+        )
+        response = self.client.get('/admin/django_processinfo/outcomestatistics/')
+        self.assert_html_parts(
+            response,
+            parts=(
+                '<title>Select Outcome statistics to change | Django site admin</title>',
+                '<td class="field-outcome_type">Status class</td>',
+                '<td class="field-outcome">5xx</td>',
+                '<td class="field-response_time_avg2">1.5\xa0seconds</td>',
+            ),
+        )
+
+    def test_warmupstatistics(self):
+        self.client.force_login(self.superuser)
+        baker.make(WarmupStatistics, request_no=1, process_count=3, response_time_avg=2, response_time_max=5)
+        response = self.client.get('/admin/django_processinfo/warmupstatistics/')
+        self.assert_html_parts(
+            response,
+            parts=(
+                '<title>Select Warm-up statistics to change | Django site admin</title>',
+                '<td class="field-process_count">3</td>',
+                '<td class="field-response_time_avg2">2.0\xa0seconds</td>',
+                '<td class="field-response_time_max2">5.0\xa0seconds</td>',
+            ),
+        )
+
+    def test_templatestatistics(self):
+        self.client.force_login(self.superuser)
+        baker.make(
+            TemplateStatistics, view_name='foo:bar', template_name='foo/item.html',
+            request_count=2, render_count=30, time_sum=0.03, time_max=0.02,
+        )
+        response = self.client.get('/admin/django_processinfo/templatestatistics/')
+        self.assert_html_parts(
+            response,
+            parts=(
+                '<title>Select Template statistics to change | Django site admin</title>',
+                '<td class="field-template_name">foo/item.html</td>',
+                '<td class="field-time_avg">15.00 ms / 20.00 ms</td>',
+                '<td class="field-renders_per_request">15.0</td>',
+            ),
+        )
+
+    def test_middlewarestatistics(self):
+        self.client.force_login(self.superuser)
+        baker.make(
+            MiddlewareStatistics, pid=123, middleware='django.middleware.csrf.CsrfViewMiddleware',
+            request_count=4, inclusive_time_sum=0.2, inclusive_time_max=0.08,
+            exclusive_time_sum=0.004, exclusive_time_max=0.002,
+        )
+        response = self.client.get('/admin/django_processinfo/middlewarestatistics/')
+        self.assert_html_parts(
+            response,
+            parts=(
+                '<title>Select Middleware statistics to change | Django site admin</title>',
+                '<td class="field-pid">123</td>',
+                '<td class="field-exclusive_time">1.00 ms / 2.00 ms</td>',
+                '<td class="field-inclusive_time">50.00 ms / 80.00 ms</td>',
+            ),
+        )
+
+    def test_connectionstatistics(self):
+        self.client.force_login(self.superuser)
+        baker.make(
+            ConnectionStatistics, pid=123, alias='default', vendor='sqlite',
+            connect_count=2, connect_time_sum=0.004, connect_time_max=0.003, request_count=10,
+            close_check_count=4, close_check_time_sum=0.0002, close_count=1,
+        )
+        response = self.client.get('/admin/django_processinfo/connectionstatistics/')
+        self.assert_html_parts(
+            response,
+            parts=(
+                '<title>Select Connection statistics to change | Django site admin</title>',
+                '<td class="field-pid">123</td>',
+                '<td class="field-connect_time">2.00 ms / 3.00 ms</td>',
+                '<td class="field-requests_per_connection">5.0</td>',
+                '<td class="field-conn_max_age">0 sec.</td>',
+                '<td class="field-close_check_time">0.050 ms</td>',
+            ),
+        )
+
+    def test_storage(self):
+        self.client.force_login(self.superuser)
+        baker.make(
+            ViewStatistics, view_name='foo:bar', request_count=2, exception_count=1,
+            response_time_min=0.1, response_time_avg=0.2, response_time_max=0.3, response_time_sum=0.4,
+        )
+        response = self.client.get('/admin/django_processinfo/viewstatistics/storage/')
+        self.assert_html_parts(
+            response,
+            parts=(
+                '<title>Recorded statistics | Django site admin</title>',
+                '<code>django_processinfo.storage.orm.OrmStorage</code>',
+                '<td>foo:bar</td>',
+                '<td>0.100 / 0.200 / 0.300 sec.</td>',
+            ),
+        )
+
+    @mock.patch.object(settings.PROCESSINFO, 'STORAGE_BACKEND', 'django_processinfo.storage.memory.MemoryStorage')
+    def test_summary_from_storage(self):
+        storage = get_storage()
+        storage.reset()
+        self.addCleanup(storage.reset)
+
+        for name in ('summary.a', 'summary.b', 'summary.b'):
+            with measure(name):
+                pass
+
+        assert SiteStatistics.objects.count() == 0
+        extra_context, aggregate_data = admin.site._registry[SiteStatistics].compute_summary()
+        assert aggregate_data == {}
+        assert extra_context['site_count'] == 1
+        assert extra_context['request_count'] == 3
+        assert extra_context['exception_count'] == 0
+        assert 'response_time_avg' in extra_context
+
+    def test_viewstatistics_queue_time(self):
+        self.client.force_login(self.superuser)
+
+        # Use whole seconds: A rounded fractional part could be later than the real start time
+        request_start = int(time.time()) - 1
+        self.client.get('/admin/login/', HTTP_X_REQUEST_START=f't={request_start}')
+        self.client.get('/admin/login/')  # without queue time header
+
+        process_info = ProcessInfo.objects.get()
+        assert process_info.queue_time_count == 1
+        assert 1 <= process_info.queue_time_avg < 10
+
+        view_stats = ViewStatistics.objects.get(view_name='admin:login')
+        assert view_stats.request_count == 2
+        assert view_stats.queue_time_count == 1
+        assert view_stats.queue_time_min == process_info.queue_time_min
+
+        response = self.client.get('/admin/django_processinfo/viewstatistics/')
+        self.assertTemplateUsed(response, 'admin/django_processinfo/change_list.html')
+        self.assert_html_parts(
+            response,
+            parts=(
+                '<title>Select View statistics to change | Django site admin</title>',
+                '<td class="field-request_count">2</td>',
+            ),
+        )
+
+    def test_queue_time_invalid_headers(self):
+        # The header can be sent by any client:
+        for value in ('inf', '-inf', 'nan', '1e400', '1e30', str(time.time() + 60), '1'):
+            with self.subTest(value=value):
+                self.client.get('/admin/login/', HTTP_X_REQUEST_START=f't={value}')
+
+        process_info = ProcessInfo.objects.get()
+        assert process_info.request_count == 7
+        assert process_info.queue_time_count == 0
+        assert ViewStatistics.objects.get(view_name='admin:login').queue_time_count == 0
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class SummaryCacheTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.superuser = baker.make(
+            User, is_staff=True, is_active=True, is_superuser=True
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.superuser)
+
+    def test_cached(self):
+        self.client.get('/admin/login/')  # create SiteStatistics
+
+        with mock.patch.object(
+            BaseModelAdmin, 'compute_summary', autospec=True, side_effect=BaseModelAdmin.compute_summary
+        ) as compute_mock:
+            self.client.get('/admin/django_processinfo/sitestatistics/')
+            assert compute_mock.call_count == 1
+
+            # Shared between the admin classes:
+            response = self.client.get('/admin/django_processinfo/processinfo/')
+            assert compute_mock.call_count == 1
+            self.assertContains(response, 'Living processes (current/avg/max)')
+
+            # "Reset all data" invalidates the cache:
+            self.client.get('/admin/django_processinfo/processinfo/reset/')
+            self.client.get('/admin/django_processinfo/processinfo/')
+            assert compute_mock.call_count == 2
+
+            # "Remove dead PIDs" invalidates the cache:
+            self.client.get('/admin/django_processinfo/processinfo/remove_dead_entries/')
+            self.client.get('/admin/django_processinfo/processinfo/')
+            assert compute_mock.call_count == 3
+
+    @mock.patch.object(settings.PROCESSINFO, 'SUMMARY_CACHE_TTL', None)
+    def test_deactivated(self):
+        with mock.patch.object(
+            BaseModelAdmin, 'compute_summary', autospec=True, side_effect=BaseModelAdmin.compute_summary
+        ) as compute_mock:
+            self.client.get('/admin/django_processinfo/sitestatistics/')
+            self.client.get('/admin/django_processinfo/sitestatistics/')
+            assert compute_mock.call_count == 2
+
+    @mock.patch.object(settings.PROCESSINFO, 'SUMMARY_CACHE_TTL', None)
+    def test_once_per_request(self):
+        request = RequestFactory().get('/')
+        model_admin = admin.site._registry[SiteStatistics]
+        with mock.patch.object(model_admin, 'compute_summary', return_value=({}, {})) as compute_mock:
+            assert model_admin.get_summary(request) == ({}, {})
+            admin.site._registry[ProcessInfo].get_summary(request)
+        assert compute_mock.call_count == 1
@@ -0,0 +1,98 @@
+import datetime
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.utils import timezone
+from model_bakery import baker
+
+from django_processinfo.models import HostSample, ProcessInfo
+
+
+class ApiTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.superuser = baker.make(
+            User, is_staff=True, is_active=True, is_superuser=True
+        )
+
+    def test_anonymous(self):
+        response = self.client.get('/admin/django_processinfo/processinfo/api/')
+        self.assertRedirects(
+            response,
+            '/admin/login/?next=/admin/django_processinfo/processinfo/api/',
+            fetch_redirect_response=False,
+        )
+
+    def test_processinfo(self):
+        self.client.force_login(self.superuser)
+        self.client.get('/admin/login/')  # create ProcessInfo + SiteStatistics
+        process_info = ProcessInfo.objects.get()
+
+        url = '/admin/django_processinfo/processinfo/api/'
+        response = self.client.get(url)
+        assert response.status_code == 200
+        assert response['Content-Type'] == 'application/json'
+        data = response.json()
+        assert {'pid', 'site_id', 'lastupdate_time'} <= set(data['columns'])
+        assert len(data['rows']) == 1
+        row = dict(zip(data['columns'], data['rows'][0]))
+        assert row['pid'] == process_info.pid
+        assert row['request_count'] == 1
+
+        # The API requests are not recorded:
+        assert ProcessInfo.objects.get().request_count == 1
+
+        # Unchanged data -> 304
+        etag = response['ETag']
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304
+        assert response['ETag'] == etag
+
+        # Only whole tags are compared:
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag[:-3] + '"')
+        assert response.status_code == 200
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=f'"foo", W/{etag}')
+        assert response.status_code == 304
+
+        # Only rows updated since the last poll:
+        response = self.client.get(url, {'since': data['last_update']})
+        assert response.status_code == 200
+        data = response.json()
+        assert data['rows'] == []
+        assert data['last_update']
+
+        self.client.get('/admin/login/')
+        response = self.client.get(url, {'since': data['last_update']})
+        data = response.json()
+        assert len(data['rows']) == 1
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+
+    def test_filter_and_errors(self):
+        self.client.force_login(self.superuser)
+        self.client.get('/admin/login/')
+
+        response = self.client.get('/admin/django_processinfo/sitestatistics/api/', {'site': 1})
+        assert len(response.json()['rows']) == 1
+        response = self.client.get('/admin/django_processinfo/sitestatistics/api/', {'site': 2})
+        assert response.json()['rows'] == []
+
+        response = self.client.get('/admin/django_processinfo/sitestatistics/api/', {'since': 'foo'})
+        assert response.status_code == 400
+        assert response.json() == {'error': "Invalid 'since' timestamp: 'foo'"}
+
+        response = self.client.get('/admin/django_processinfo/hostsample/api/', {'site': 1})
+        assert response.status_code == 400
+
+    def test_time_buckets(self):
+        self.client.force_login(self.superuser)
+        now = timezone.now()
+        for minutes in (3, 2, 1):
+            baker.make(HostSample, sample_time=now - datetime.timedelta(minutes=minutes))
+
+        since = (now - datetime.timedelta(minutes=2)).timestamp()
+        response = self.client.get('/admin/django_processinfo/hostsample/api/', {'since': since})
+        data = response.json()
+        assert len(data['rows']) == 1
+        assert 'cpu_user' in data['columns']
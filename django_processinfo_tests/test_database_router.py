@@ -0,0 +1,66 @@
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.db import router
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from django_processinfo.apps import database_check
+from django_processinfo.models import ProcessInfo, SiteStatistics
+
+
+class DatabaseRouterTestCase(TestCase):
+    databases = {'default', 'processinfo'}
+
+    def test_default_database(self):
+        assert router.db_for_write(ProcessInfo) == 'default'
+        assert router.db_for_read(SiteStatistics) == 'default'
+
+        self.client.get('/admin/login/')
+
+        assert ProcessInfo.objects.using('default').count() == 1
+        assert ProcessInfo.objects.using('processinfo').count() == 0
+
+    @mock.patch.object(settings.PROCESSINFO, 'DATABASE', 'processinfo')
+    def test_own_database(self):
+        assert router.db_for_write(ProcessInfo) == 'processinfo'
+        assert router.db_for_read(SiteStatistics) == 'processinfo'
+        assert router.db_for_read(Site) == 'default'
+
+        assert router.allow_migrate('processinfo', 'django_processinfo') is True
+        assert router.allow_migrate('default', 'django_processinfo') is False
+
+        self.client.get('/admin/login/')
+
+        assert ProcessInfo.objects.using('default').count() == 0
+        assert SiteStatistics.objects.using('default').count() == 0
+
+        assert ProcessInfo.objects.count() == 1
+        site_stats = SiteStatistics.objects.get()
+        assert site_stats._state.db == 'processinfo'
+
+        # The related Site will be read from the default database:
+        assert site_stats.site == Site.objects.get_current()
+        assert site_stats.site._state.db == 'default'
+
+
+class DatabaseCheckTestCase(SimpleTestCase):
+    def test_no_database(self):
+        assert database_check() == []
+
+    @mock.patch.object(settings.PROCESSINFO, 'DATABASE', 'processinfo')
+    def test_valid_database(self):
+        assert database_check() == []
+
+    @mock.patch.object(settings.PROCESSINFO, 'DATABASE', 'does-not-exists')
+    def test_missing_database(self):
+        errors = database_check()
+        assert [error.msg for error in errors] == [
+            "Database 'does-not-exists' from settings.PROCESSINFO.DATABASE doesn't exist!"
+        ]
+
+    @mock.patch.object(settings.PROCESSINFO, 'DATABASE', 'processinfo')
+    @override_settings(DATABASE_ROUTERS=[])
+    def test_missing_router(self):
+        errors = database_check()
+        assert [error.msg for error in errors] == ['Missing django-processinfo database router!']
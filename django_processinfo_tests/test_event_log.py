@@ -0,0 +1,163 @@
+import io
+import json
+import os
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock, skipIf
+
+from django.conf import settings
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from django_processinfo import event_log
+from django_processinfo.event_log import (
+    EventLog,
+    analyze,
+    get_event_files,
+    read_events,
+    read_view_names,
+)
+
+
+def make_info(view_name, response_time, status_code=200, kind='request', queue_time=None):
+    return SimpleNamespace(
+        pid=os.getpid(), view_name=view_name, status_code=status_code, kind=kind,
+        response_time=response_time, queue_time=queue_time,
+        user_time=0.01, system_time=0.002, memory=50 * 1024 * 1024,
+    )
+
+
+class EventLogTestCase(TestCase):
+    def setUp(self):
+        super().setUp()
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.directory = temp_dir.name
+
+    def write_events(self, event_log_obj=None):
+        if event_log_obj is None:
+            event_log_obj = EventLog(self.directory, max_size=1024 * 1024, max_files=10)
+        for index in range(10):
+            event_log_obj.write(make_info('foo:bar', response_time=(index + 1) / 10), exception=False, now=60 + index)
+        event_log_obj.write(make_info('foo:bar', response_time=2, status_code=500), exception=True, now=120)
+        event_log_obj.write(make_info(None, response_time=0.5, status_code=404, queue_time=0.25), False, now=121)
+        event_log_obj.write(make_info('job', response_time=3, status_code=None, kind='task'), False, now=122)
+        return event_log_obj
+
+    def test_middleware(self):
+        with mock.patch.object(settings.PROCESSINFO, 'EVENT_LOG_DIR', self.directory):
+            self.client.get('/admin/login/')
+            self.client.get('/admin/login/')
+
+        columns = read_events(get_event_files(self.directory))
+        assert list(columns['pid']) == [os.getpid(), os.getpid()]
+        assert list(columns['status']) == [200, 200]
+        assert list(columns['kind']) == [0, 0]
+        assert all(value > 0 for value in columns['response_time'])
+        assert all(value > 0 for value in columns['rss'])
+        assert set(read_view_names(self.directory).values()) == {'admin:login'}
+
+    def test_deactivated(self):
+        assert settings.PROCESSINFO.EVENT_LOG_DIR is None
+        with mock.patch.object(event_log.EventLog, 'write') as write:
+            self.client.get('/admin/login/')
+        write.assert_not_called()
+
+    def test_read_and_analyze(self):
+        self.write_events()
+
+        columns = read_events(get_event_files(self.directory), use_numpy=False)
+        assert len(columns['time']) == 13
+        assert list(columns['status'][-3:]) == [500, 404, 0]
+        assert list(columns['flags'][-3:]) == [1, 0, 0]
+
+        groups = analyze(columns, group_by='view', percentiles=(50, 90))
+        view_names = read_view_names(self.directory)
+        assert [
+            (event_log.format_key(group['key'], 'view', view_names), group['count'], group['exceptions'])
+            for group in groups
+        ] == [('foo:bar', 11, 1), ('job', 1, 0), ('<unresolved>', 1, 0)]
+        foo_bar = groups[0]
+        assert round(foo_bar['min'], 3) == 0.1
+        assert round(foo_bar['max'], 3) == 2
+        assert round(foo_bar['percentiles'][50], 3) == 0.6
+        assert round(foo_bar['percentiles'][90], 3) == 1.0
+
+        groups = analyze(columns, field='queue_time', group_by='all')
+        assert [(group['count'], group['max']) for group in groups] == [(1, 0.25)]
+
+        groups = analyze(columns, group_by='minute')
+        assert [(group['key'], group['count']) for group in groups] == [(60, 10), (120, 3)]
+
+        columns = read_events(get_event_files(self.directory), start=120, end=122, use_numpy=False)
+        assert list(columns['status']) == [500, 404]
+
+    @skipIf(event_log.numpy is None, 'numpy is not installed')
+    def test_numpy(self):
+        self.write_events()
+        paths = get_event_files(self.directory)
+        for group_by in event_log.GROUP_BY:
+            expected = analyze(read_events(paths, use_numpy=False), group_by=group_by)
+            groups = analyze(read_events(paths, use_numpy=True), group_by=group_by)
+            assert [group['key'] for group in groups] == [group['key'] for group in expected]
+            for group, expected_group in zip(groups, expected):
+                assert group['count'] == expected_group['count']
+                assert group['exceptions'] == expected_group['exceptions']
+                for percent, value in group['percentiles'].items():
+                    assert round(value, 5) == round(expected_group['percentiles'][percent], 5)
+
+    def test_rotation(self):
+        record_count = 4
+        max_size = event_log.HEADER.size + event_log.RECORD.size * record_count
+        self.write_events(EventLog(self.directory, max_size=max_size, max_files=2))
+
+        paths = get_event_files(self.directory)
+        assert len(paths) == 2  # the oldest file was removed
+        assert [path.stat().st_size for path in paths] == [max_size, max_size - event_log.RECORD.size * 3]
+        assert len(read_events(paths, use_numpy=False)['time']) == 5
+
+    def test_incomplete_record(self):
+        self.write_events()
+        path = get_event_files(self.directory)[0]
+        with path.open('ab') as f:
+            f.write(b'\0' * 10)  # e.g.: killed while writing
+
+        assert len(read_events([path], use_numpy=False)['time']) == 13
+
+        Path(self.directory, 'events-0-1-1.bin').write_bytes(b'No event log file')
+        with self.assertRaisesMessage(ValueError, 'is not a event log file of version 1'):
+            read_events(get_event_files(self.directory), use_numpy=False)
+
+    def test_analyze_command(self):
+        self.write_events()
+
+        stdout = io.StringIO()
+        call_command('processinfo_analyze', '--dir', self.directory, '--no-numpy', stdout=stdout)
+        lines = stdout.getvalue().splitlines()
+        assert lines[0].startswith('13 events in 1 files analyzed in ')
+        assert lines[1] == 'from 1970-01-01T00:01:00+00:00 to 1970-01-01T00:02:02+00:00'
+        assert lines[2].split() == [
+            'view', 'count', 'exceptions', 'min', 'ms', 'avg', 'ms', 'p50', 'ms', 'p90', 'ms', 'p99', 'ms', 'max', 'ms'
+        ]
+        assert lines[3].split() == [
+            'foo:bar', '11', '1', '100.00', '681.82', '600.00', '1000.00', '1900.00', '2000.00'
+        ]
+
+        stdout = io.StringIO()
+        call_command(
+            'processinfo_analyze', '--dir', self.directory, '--group-by', 'status', '--field', 'rss',
+            '--percentiles', '50', '--json', stdout=stdout,
+        )
+        result = json.loads(stdout.getvalue())
+        assert result['events'] == 13
+        assert [(group['key'], group['count']) for group in result['groups']] == [
+            ('200', 10), ('-', 1), ('404', 1), ('500', 1)
+        ]
+        assert result['groups'][0]['percentiles'] == {'50.0': 50 * 1024 * 1024}
+
+    def test_analyze_command_errors(self):
+        with self.assertRaisesMessage(CommandError, 'No event log directory'):
+            call_command('processinfo_analyze')
+        with self.assertRaisesMessage(CommandError, 'Percentiles must be between 0 and 100'):
+            call_command('processinfo_analyze', '--dir', self.directory, '--percentiles', '50,101')
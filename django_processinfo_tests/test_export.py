@@ -0,0 +1,83 @@
+import csv
+import datetime
+import gzip
+import io
+import json
+import os
+import tempfile
+
+from django.contrib.auth.models import User
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+from django.utils import timezone
+from model_bakery import baker
+
+from django_processinfo.models import HostSample, ProcessInfo
+
+
+class ExportCommandTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        now = timezone.now()
+        for minutes in (3, 2, 1):
+            baker.make(HostSample, sample_time=now - datetime.timedelta(minutes=minutes), load_1=minutes)
+        cls.now = now
+
+    def test_csv(self):
+        stdout = io.StringIO()
+        call_command('processinfo_export', 'hostsample', stdout=stdout)
+        rows = list(csv.reader(io.StringIO(stdout.getvalue())))
+        assert len(rows) == 4
+        header = rows[0]
+        assert header[0] == 'id'
+        assert 'cpu_user' in header
+        assert [row[header.index('load_1')] for row in rows[1:]] == ['3.0', '2.0', '1.0']
+
+    def test_ndjson_time_range(self):
+        start = (self.now - datetime.timedelta(minutes=2, seconds=30)).isoformat()
+        end = (self.now - datetime.timedelta(minutes=1, seconds=30)).isoformat()
+        stdout = io.StringIO()
+        call_command(
+            'processinfo_export', 'hostsample', '--format', 'ndjson',
+            '--start', start, '--end', end, '--chunk-size', '1',
+            stdout=stdout,
+        )
+        lines = stdout.getvalue().splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])['load_1'] == 2.0
+
+    def test_gzip_file(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filename = os.path.join(temp_dir, 'export.ndjson.gz')
+            stdout = io.StringIO()
+            call_command('processinfo_export', 'hostsample', '--format', 'ndjson', '--output', filename, stdout=stdout)
+            assert f"3 lines written to {filename!r}" in stdout.getvalue()
+
+            with gzip.open(filename, 'rt') as f:
+                lines = f.read().splitlines()
+        assert [json.loads(line)['load_1'] for line in lines] == [3.0, 2.0, 1.0]
+
+    def test_invalid_time(self):
+        with self.assertRaisesMessage(CommandError, "Invalid 'since' timestamp: 'foo'"):
+            call_command('processinfo_export', 'processinfo', '--start', 'foo')
+
+
+class ExportAdminActionTestCase(TestCase):
+    def test_export_csv(self):
+        superuser = baker.make(User, is_staff=True, is_active=True, is_superuser=True)
+        self.client.force_login(superuser)
+        self.client.get('/admin/login/')  # create ProcessInfo
+        process_info = ProcessInfo.objects.get()
+
+        response = self.client.post(
+            '/admin/django_processinfo/processinfo/',
+            {'action': 'export_csv', '_selected_action': [process_info.pk]},
+        )
+        assert response.status_code == 200
+        assert response.streaming
+        assert response['Content-Type'] == 'text/csv'
+        assert response['Content-Disposition'].startswith('attachment; filename="processinfo_')
+        content = b''.join(response.streaming_content).decode('utf-8')
+        rows = list(csv.DictReader(io.StringIO(content)))
+        assert len(rows) == 1
+        assert rows[0]['pid'] == str(process_info.pid)
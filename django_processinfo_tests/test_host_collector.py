@@ -0,0 +1,89 @@
+import io
+import os
+import tempfile
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+from model_bakery import baker
+
+from django_processinfo.host_collector import HostCollector
+from django_processinfo.models import HostSample
+from django_processinfo.sampler import HostSampler
+
+
+class HostCollectorTestCase(TestCase):
+    def test_collect(self):
+        collector = HostCollector()
+        sample = collector.collect()
+        assert isinstance(sample, HostSample)
+        assert sample.pk is None
+        assert sample.mem_used > 0
+        assert sample.load_1 >= 0
+        assert 0 <= sample.cpu_usage() <= 100
+
+    @mock.patch.object(settings.PROCESSINFO, 'MAX_HOST_SAMPLE_COUNT', 2)
+    def test_management_command(self):
+        with mock.patch('django_processinfo.management.commands.processinfo_collect_host.time.sleep'):
+            call_command('processinfo_collect_host', interval=0, count=3, verbosity=0)
+        assert HostSample.objects.count() == 2
+
+    def test_management_command_read_error(self):
+        cpu_times = mock.Mock(side_effect=[
+            (('user', 1),),  # The start values of the HostCollector
+            ValueError("Unexpected first line in /proc/stat: 'intr 123'"),
+        ])
+        stderr = io.StringIO()
+        with mock.patch('django_processinfo.management.commands.processinfo_collect_host.time.sleep'), \
+                mock.patch('django_processinfo.host_collector.cpu_times', cpu_times):
+            call_command('processinfo_collect_host', interval=0, count=1, verbosity=0, stderr=stderr)
+        assert HostSample.objects.count() == 0
+        assert "Can't collect host sample: Unexpected first line in /proc/stat" in stderr.getvalue()
+
+    def test_admin_sparklines(self):
+        for load in (0.5, 1.5, 1.0):
+            baker.make(
+                HostSample, load_1=load, mem_used=1024,
+                cpu_user=10, cpu_system=0, cpu_iowait=0, cpu_steal=0, cpu_idle=30,
+            )
+
+        superuser = User.objects.create_superuser(username='foo', password='bar')
+        self.client.force_login(superuser)
+        response = self.client.get('/admin/django_processinfo/sitestatistics/')
+        self.assertContains(response, '<polyline fill="none"')
+        self.assertContains(response, 'load average (1 min)')
+        self.assertContains(response, '25.0%')  # CPU usage
+
+
+class HostSamplerElectionTestCase(SimpleTestCase):
+    def test_only_one_elected(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            lock_file = os.path.join(temp_dir, 'host-sampler.lock')
+            with mock.patch.object(settings.PROCESSINFO, 'HOST_SAMPLER_LOCK_FILE', lock_file):
+                sampler1 = HostSampler()
+                sampler2 = HostSampler()
+                assert sampler1.is_elected() is True
+                assert sampler2.is_elected() is False
+                assert sampler1.is_elected() is True
+
+                # The lock will be released, e.g. if the process dies:
+                sampler1.lock_file.close()
+                assert sampler2.is_elected() is True
+                sampler2.lock_file.close()
+
+    def test_first_sample_primes_cpu_times(self):
+        sampler = HostSampler()
+        sampler.reset()
+        sampler.sample()
+        assert sampler.latest is None
+        sampler.sample()
+        assert isinstance(sampler.latest, HostSample)
+
+    @mock.patch.object(settings.PROCESSINFO, 'PROC_SAMPLER_BUFFER_SIZE', 1)
+    @mock.patch.object(settings.PROCESSINFO, 'HOST_SAMPLER_BUFFER_SIZE', 2)
+    def test_buffer_size(self):
+        sampler = HostSampler()
+        sampler.reset()
+        assert sampler.buffer.maxlen == 2
@@ -0,0 +1,65 @@
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from django_processinfo.instrument import measure
+from django_processinfo.models import OutcomeStatistics, ProcessInfo, ViewStatistics
+
+
+class InstrumentTestCase(TestCase):
+    def test_context_manager(self):
+        with measure('newsletter.send') as info:
+            User.objects.count()
+
+        assert info.view_name == 'newsletter.send'
+        assert info.response_time > 0
+
+        process_info = ProcessInfo.objects.get()
+        assert process_info.kind == 'task'
+        assert process_info.request_count == 1
+        assert process_info.recycle_reason == ''
+
+        view_stats = ViewStatistics.objects.get()
+        assert view_stats.kind == 'task'
+        assert view_stats.view_name == 'newsletter.send'
+        assert view_stats.request_count == 1
+        assert view_stats.exception_count == 0
+        assert not OutcomeStatistics.objects.exists()  # no status code for tasks
+
+    def test_decorator(self):
+        @measure('myapp.cleanup', kind='command')
+        def cleanup(count):
+            if count:
+                cleanup(count - 1)  # nested calls use own measurements
+            return count
+
+        assert cleanup(2) == 2
+
+        view_stats = ViewStatistics.objects.get()
+        assert view_stats.kind == 'command'
+        assert view_stats.request_count == 3
+        assert ProcessInfo.objects.get().request_count == 3
+
+    def test_exception(self):
+        with self.assertRaisesMessage(ValueError, 'Boom'):
+            with measure('broken.task'):
+                raise ValueError('Boom')
+
+        view_stats = ViewStatistics.objects.get()
+        assert view_stats.exception_count == 1
+        outcome = OutcomeStatistics.objects.get()
+        assert outcome.view_name == 'broken.task'
+        assert outcome.outcome_type == 'exception'
+        assert outcome.outcome == 'ValueError'
+
+    def test_same_name_as_view(self):
+        self.client.get('/admin/login/')
+        with measure('admin:login'):
+            pass
+
+        assert sorted(ViewStatistics.objects.values_list('kind', 'request_count')) == [
+            ('request', 1), ('task', 1)
+        ]
+
+    def test_unknown_kind(self):
+        with self.assertRaisesMessage(ValueError, "Unknown kind 'cron', choices are: request, task, command"):
+            measure('foo', kind='cron')
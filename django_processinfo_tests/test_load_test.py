@@ -0,0 +1,34 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from django_processinfo.publish import PACKAGE_ROOT
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='Needs os.fork()')
+def test_load_test():
+    output = subprocess.check_output(
+        [
+            sys.executable, '-m', 'django_processinfo_tests.load_test',
+            '--workers', '3', '--requests', '60', '--concurrency', '6', '--json',
+        ],
+        cwd=PACKAGE_ROOT,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    result = json.loads(output)
+
+    failed = [check for round in result['rounds'] for check in round['checks'] if not check['ok']]
+    assert failed == []
+    assert result['ok'] is True
+
+    with_middleware, without_middleware = result['rounds']
+    assert with_middleware['with_middleware'] is True
+    assert [check['name'] for check in with_middleware['checks']][:5] == [
+        'no server errors', 'requests per worker', 'total requests', 'requests per view', 'process spawn count',
+    ]
+    assert without_middleware['with_middleware'] is False
+    assert with_middleware['requests'] == without_middleware['requests'] == 60
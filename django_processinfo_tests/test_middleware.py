@@ -0,0 +1,612 @@
+import asyncio
+import gc
+import os
+import threading
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+from asgiref.sync import async_to_sync, sync_to_async
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.core.handlers.base import BaseHandler
+from django.db import close_old_connections, connection
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.urls import resolve
+from django.utils.deprecation import MiddlewareMixin
+from django.utils.module_loading import import_string
+
+from django_processinfo import middlewares, recycle
+from django_processinfo.middlewares import ProcessInfoMiddleware
+from django_processinfo.models import (
+    ConnectionStatistics,
+    MiddlewareStatistics,
+    OutcomeStatistics,
+    ProcessInfo,
+    QueryFingerprint,
+    SiteStatistics,
+    TemplateStatistics,
+    ViewStatistics,
+    WarmupStatistics,
+)
+from django_processinfo.storage.orm import OrmStorage
+from django_processinfo.utils import (
+    cache_instrumentation,
+    db_connections,
+    middleware_timing,
+    template_timing,
+)
+from django_processinfo.utils.concurrency import ConcurrencyGauge
+from django_processinfo.utils.middleware_timing import MiddlewareCollector, instrument_call
+
+
+def other_process_creates_first(model):
+    """
+    Let a other process create the same entries between our read and our bulk_create()
+    """
+    bulk_create = model.objects.bulk_create
+
+    def create_first(objs, **kwargs):
+        for obj in objs:
+            values = {field.attname: getattr(obj, field.attname) for field in model._meta.concrete_fields}
+            del values[model._meta.pk.attname]
+            model.objects.create(**{**values, 'request_count': 1})
+        return bulk_create(objs, **kwargs)
+
+    return mock.patch.object(model.objects, 'bulk_create', create_first)
+
+
+class ThreadedMiddlewareTestCase(SimpleTestCase):
+    @mock.patch.object(middlewares, 'concurrency_gauge', ConcurrencyGauge(now=0))
+    def test_concurrent_requests(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def get_response(request):
+            barrier.wait()  # both requests are in progress at the same time
+            return HttpResponse('OK', content_type='text/plain')
+
+        middleware = ProcessInfoMiddleware(get_response)
+
+        infos = []
+
+        def insert_statistics(request, exception=False):
+            infos.append(request._processinfo)
+
+        def make_request(path):
+            request = RequestFactory().get(path)
+            middleware(request)
+
+        threads = [
+            threading.Thread(target=make_request, args=(f'/{no}/',)) for no in range(2)
+        ]
+        # Note: Patch only once, not in the threads. Otherwise the first finished
+        # thread restores the original method, while the other one still runs.
+        with mock.patch.object(middleware, '_insert_statistics', insert_statistics):
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        # Every request has its own information:
+        assert len(infos) == 2
+        assert infos[0] is not infos[1]
+        assert sorted(info.concurrency for info in infos) == [1, 2]
+        assert middlewares.concurrency_gauge.in_flight == 0
+
+
+class AsyncMiddlewareTestCase(TestCase):
+    async def test_async_client(self):
+        response = await self.async_client.get('/admin/login/')
+        assert response.status_code == 200
+        content = response.content.decode('utf-8')
+        assert '<p class="django-processinfo"><small>django-processinfo:' in content
+
+        process_info = await sync_to_async(ProcessInfo.objects.get)()
+        assert process_info.request_count == 1
+        assert process_info.concurrency_max == 1
+
+
+class IOAccountingTestCase(TestCase):
+    def test_io_accounting(self):
+        self.client.get('/admin/login/')
+        self.client.get('/admin/login/')
+
+        process_info = ProcessInfo.objects.get()
+        assert process_info.io_count == 2
+        assert process_info.io_syscr_max >= process_info.io_syscr_min
+        assert process_info.io_rchar_sum >= process_info.io_rchar_max
+
+        view_stats = ViewStatistics.objects.get(view_name='admin:login')
+        assert view_stats.io_count == 2
+
+    def test_io_deltas(self):
+        start_io = middlewares.get_io_counters()
+        with open(__file__, 'rb') as f:
+            f.read()
+        io_deltas = middlewares.get_io_deltas(start_io)
+        assert io_deltas['syscr'] >= 1
+        assert io_deltas['rchar'] >= 1
+
+        # The counters are per thread:
+        thread_id, counters = start_io
+        assert middlewares.get_io_deltas((thread_id + 1, counters)) is None
+
+    @mock.patch.object(settings.PROCESSINFO, 'IO_ACCOUNTING', False)
+    def test_deactivated(self):
+        with mock.patch.object(middlewares, 'process_io', side_effect=AssertionError):
+            self.client.get('/admin/login/')
+
+        assert ProcessInfo.objects.get().io_count == 0
+        assert ViewStatistics.objects.get().io_count == 0
+
+
+class GCAccountingTestCase(TestCase):
+    def test_gc_accounting(self):
+        def get_response(request):
+            gc.collect(2)
+            return HttpResponse('<html><body>OK</body></html>')
+
+        middleware = ProcessInfoMiddleware(get_response)
+        assert middlewares.gc_monitor.callback in gc.callbacks
+
+        request = RequestFactory().get('/admin/login/')
+        request.resolver_match = resolve('/admin/login/')
+        middleware(request)
+
+        process_info = ProcessInfo.objects.get()
+        assert process_info.gc_count_2 == 1
+        assert process_info.gc_time_2 > 0
+        assert process_info.gc_time_max >= process_info.gc_time_2
+        assert 0 < process_info.get_gc_time_share() <= 100
+
+        view_stats = ViewStatistics.objects.get(view_name='admin:login')
+        assert view_stats.gc_count_2 == 1
+        assert view_stats.gc_time_2 == process_info.gc_time_2
+
+    @mock.patch.object(settings.PROCESSINFO, 'GC_ACCOUNTING', False)
+    def test_deactivated(self):
+        with mock.patch.object(middlewares.gc_monitor, 'snapshot', side_effect=AssertionError):
+            self.client.get('/admin/login/')
+
+        process_info = ProcessInfo.objects.get()
+        assert process_info.gc_count_0 == 0
+        assert process_info.gc_time_0 == 0
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class CacheInstrumentationTestCase(TestCase):
+    def make_request(self):
+        def get_response(request):
+            cache.get('foo')
+            cache.set('foo', 'bar')
+            cache.get_many(['foo', 'bar'])
+            cache.delete('foo')
+            return HttpResponse('<html><body>OK</body></html>')
+
+        middleware = ProcessInfoMiddleware(get_response)
+        request = RequestFactory().get('/admin/login/')
+        request.resolver_match = resolve('/admin/login/')
+        middleware(request)
+
+    @mock.patch.object(settings.PROCESSINFO, 'CACHE_INSTRUMENTATION', True)
+    def test_cache_instrumentation(self):
+        self.make_request()
+
+        process_info = ProcessInfo.objects.get()
+        assert process_info.cache_count == 1
+        assert process_info.cache_hits == 1
+        assert process_info.cache_misses == 2
+        assert process_info.cache_sets == 1
+        assert process_info.cache_deletes == 1
+        assert process_info.cache_time_max == process_info.cache_time_sum > 0
+        assert round(process_info.get_cache_hit_ratio(), 1) == 33.3
+
+        self.make_request()
+        view_stats = ViewStatistics.objects.get(view_name='admin:login')
+        assert view_stats.cache_count == 2
+        assert view_stats.cache_hits == 2
+        assert view_stats.cache_misses == 4
+        assert 0 < view_stats.get_cache_time_share() <= 100
+
+
+class QueryFingerprintTestCase(TestCase):
+    def make_request(self, query_count):
+        def get_response(request):
+            for pk in range(query_count):
+                list(User.objects.filter(pk=pk))
+            User.objects.count()
+            return HttpResponse('<html><body>OK</body></html>')
+
+        middleware = ProcessInfoMiddleware(get_response)
+        request = RequestFactory().get('/admin/login/')
+        request.resolver_match = resolve('/admin/login/')
+        middleware(request)
+
+        # The collector is removed after the request:
+        assert connection.execute_wrappers == []
+
+    @mock.patch.object(settings.PROCESSINFO, 'SQL_FINGERPRINTS', True)
+    @mock.patch.object(settings.PROCESSINFO, 'N_PLUS_ONE_THRESHOLD', 3)
+    def test_fingerprints(self):
+        self.make_request(query_count=2)
+        self.make_request(query_count=5)
+
+        fingerprints = {obj.sql: obj for obj in QueryFingerprint.objects.filter(view_name='admin:login')}
+        user_query = next(obj for sql, obj in fingerprints.items() if 'WHERE "auth_user"."id" = ?' in sql)
+        assert user_query.request_count == 2
+        assert user_query.execution_count == 7
+        assert user_query.execution_max == 5
+        assert user_query.n_plus_one_count == 1
+        assert user_query.time_sum >= user_query.time_max > 0
+
+        count_query = next(obj for sql, obj in fingerprints.items() if 'COUNT(*)' in sql)
+        assert count_query.execution_count == 2
+        assert count_query.n_plus_one_count == 0
+
+        # Our own queries are not collected:
+        assert not any('django_processinfo' in sql for sql in fingerprints)
+
+    @mock.patch.object(settings.PROCESSINFO, 'SQL_FINGERPRINTS', True)
+    @mock.patch.object(settings.PROCESSINFO, 'MAX_FINGERPRINTS_PER_REQUEST', 1)
+    @mock.patch.object(settings.PROCESSINFO, 'MAX_QUERY_FINGERPRINT_COUNT', 1)
+    def test_bounded(self):
+        self.make_request(query_count=1)
+        self.make_request(query_count=1)
+        assert QueryFingerprint.objects.count() == 1
+
+    @mock.patch.object(settings.PROCESSINFO, 'SQL_FINGERPRINTS', True)
+    def test_concurrent_create(self):
+        with other_process_creates_first(QueryFingerprint):
+            self.make_request(query_count=1)
+
+        # No IntegrityError and the request of the other process is not lost:
+        assert set(QueryFingerprint.objects.values_list('request_count', flat=True)) == {2}
+
+
+class TemplateTimingTestCase(TestCase):
+    @mock.patch.object(settings.PROCESSINFO, 'TEMPLATE_TIMING', True)
+    def test_template_timing(self):
+        self.client.get('/admin/login/')
+        self.client.get('/admin/login/')
+
+        view_stats = ViewStatistics.objects.get(view_name='admin:login')
+        assert view_stats.template_count == 2
+        assert view_stats.template_time_max > 0
+        assert view_stats.template_time_sum >= view_stats.template_time_max
+        assert 0 < view_stats.get_template_time_share() <= 100
+
+        template_names = set(
+            TemplateStatistics.objects.filter(view_name='admin:login').values_list('template_name', flat=True)
+        )
+        assert 'admin/login.html' in template_names
+        login_stats = TemplateStatistics.objects.get(view_name='admin:login', template_name='admin/login.html')
+        assert login_stats.request_count == 2
+        assert login_stats.render_count == 2
+        assert login_stats.time_sum >= login_stats.time_max > 0
+
+        # The collector is deactivated after the request:
+        assert getattr(template_timing._local, 'collector', None) is None
+
+    @mock.patch.object(settings.PROCESSINFO, 'TEMPLATE_TIMING', True)
+    @mock.patch.object(settings.PROCESSINFO, 'MAX_TEMPLATES_PER_REQUEST', 1)
+    @mock.patch.object(settings.PROCESSINFO, 'MAX_TEMPLATE_STATISTICS_COUNT', 1)
+    def test_bounded(self):
+        self.client.get('/admin/login/')
+        self.client.get('/admin/')
+        assert TemplateStatistics.objects.count() == 1
+
+    @mock.patch.object(settings.PROCESSINFO, 'TEMPLATE_TIMING', True)
+    def test_concurrent_create(self):
+        with other_process_creates_first(TemplateStatistics):
+            self.client.get('/admin/login/')
+
+        assert set(TemplateStatistics.objects.values_list('request_count', flat=True)) == {2}
+
+
+class MiddlewareTimingTestCase(TestCase):
+    def install(self):
+        """
+        Wrap the middlewares, like AppConfig.ready() and restore the originals after the test.
+        """
+        originals = [
+            (BaseHandler, name, BaseHandler.__dict__[name]) for name in ('_get_response', '_get_response_async')
+        ]
+        for middleware_path in settings.MIDDLEWARE:
+            middleware = import_string(middleware_path)
+            if isinstance(middleware, type):
+                originals.append((middleware, '__call__', middleware.__dict__.get('__call__')))
+
+        def restore():
+            for cls, name, original in originals:
+                if original is None:
+                    if name in cls.__dict__:
+                        delattr(cls, name)
+                else:
+                    setattr(cls, name, original)
+
+        self.addCleanup(restore)
+        middleware_timing.install()
+
+    def assert_statistics(self, request_count):
+        stats = {obj.middleware: obj for obj in MiddlewareStatistics.objects.filter(pid=os.getpid())}
+        assert set(stats) == {*settings.MIDDLEWARE[1:], middleware_timing.VIEW}
+        for obj in stats.values():
+            assert obj.request_count == request_count
+            assert obj.inclusive_time_sum >= obj.exclusive_time_sum > 0
+            assert obj.inclusive_time_max >= obj.exclusive_time_max > 0
+
+        # The inclusive time contains the inner middlewares and the view:
+        inclusive_times = [stats[name].inclusive_time_sum for name in settings.MIDDLEWARE[1:]]
+        assert inclusive_times == sorted(inclusive_times, reverse=True)
+        assert inclusive_times[-1] >= stats[middleware_timing.VIEW].inclusive_time_sum
+
+        # The exclusive times are not counted twice:
+        outer = stats[settings.MIDDLEWARE[1]]
+        exclusive_sum = sum(obj.exclusive_time_sum for obj in stats.values())
+        assert exclusive_sum == pytest.approx(outer.inclusive_time_sum)
+
+    @mock.patch.object(settings.PROCESSINFO, 'MIDDLEWARE_TIMING', True)
+    def test_middleware_timing(self):
+        self.install()
+        self.client.get('/admin/login/')
+        self.client.get('/admin/login/')
+        self.assert_statistics(request_count=2)
+
+        # The collector is deactivated after the request:
+        assert middleware_timing._collector.get() is None
+
+    @mock.patch.object(settings.PROCESSINFO, 'MIDDLEWARE_TIMING', True)
+    async def test_async_middleware_timing(self):
+        self.install()
+        await self.async_client.get('/admin/login/')
+        await self.async_client.get('/admin/login/')
+        await sync_to_async(self.assert_statistics)(request_count=2)
+        assert middleware_timing._collector.get() is None
+
+    def test_async_get_response(self):
+        class Middleware(MiddlewareMixin):
+            __call__ = instrument_call(MiddlewareMixin.__call__, name='Middleware')
+
+        async def get_response(request):
+            await asyncio.sleep(0.01)
+            return HttpResponse(request)
+
+        middleware = Middleware(get_response)
+
+        async def measure(request):
+            with MiddlewareCollector() as collector:
+                response = await middleware(request)
+            assert response.content == request.encode()
+            return collector.middlewares['Middleware']
+
+        async def concurrent_requests():
+            return await asyncio.gather(measure('a'), measure('b'))
+
+        # Every async task has its own collector and the time until the coroutine is done is measured:
+        for info in async_to_sync(concurrent_requests)():
+            assert info.inclusive >= 0.01
+            assert info.exclusive == pytest.approx(info.inclusive)
+
+    def test_long_name(self):
+        name = f'project.middlewares.{"x" * 300}'
+        collector = MiddlewareCollector()
+        collector.add(name, inclusive=0.2, exclusive=0.1)
+        info = SimpleNamespace(pid=os.getpid(), middleware_collector=collector)
+        site = Site.objects.get_current()
+        for __ in range(2):
+            OrmStorage()._save_middleware_statistics(info, site)
+
+        obj = MiddlewareStatistics.objects.get()
+        assert obj.middleware == name[:255]
+        assert obj.request_count == 2
+        assert obj.inclusive_time_sum == pytest.approx(0.4)
+
+
+class ConnectionStatisticsTestCase(TestCase):
+    def get_values(self):
+        return {info.alias: info for info in db_connections.monitor.get_values()}
+
+    @mock.patch.object(settings.PROCESSINFO, 'DB_CONNECTION_STATS', True)
+    def test_connection_statistics(self):
+        db_connections.install()  # Normally done in AppConfig.ready()
+        before = self.get_values().get(connection.alias)
+        request_count = before.request_count if before else 0
+        close_check_count = before.close_check_count if before else 0
+
+        self.client.get('/admin/login/')
+        close_old_connections()  # The test client disconnects it from the request signals
+        self.client.get('/admin/login/')
+
+        after = self.get_values()[connection.alias]
+        assert after.vendor == connection.vendor
+        assert after.request_count == request_count + 2
+        assert after.close_check_count == close_check_count + 1
+        assert after.close_check_time_sum > 0
+
+        obj = ConnectionStatistics.objects.get(pid=os.getpid(), alias=connection.alias)
+        assert obj.vendor == connection.vendor
+        assert obj.request_count == request_count + 2
+        assert obj.close_check_count == close_check_count + 1
+
+
+class DeactivatedInstrumentationTestCase(TestCase):
+    def test_deactivated(self):
+        superuser = User.objects.create_superuser(username='foo', password='bar')
+        self.client.force_login(superuser)
+        with mock.patch.object(cache_instrumentation, 'snapshot', side_effect=AssertionError):
+            response = self.client.get('/admin/')  # SQL queries, templates and middlewares
+        assert response.status_code == 200
+
+        process_info = ProcessInfo.objects.get()
+        view_stats = ViewStatistics.objects.get(view_name='admin:index')
+        for setting, stored in (
+            ('CACHE_INSTRUMENTATION', process_info.cache_count),
+            ('SQL_FINGERPRINTS', QueryFingerprint.objects.count()),
+            ('TEMPLATE_TIMING', view_stats.template_count + TemplateStatistics.objects.count()),
+            ('MIDDLEWARE_TIMING', MiddlewareStatistics.objects.count()),
+            ('DB_CONNECTION_STATS', ConnectionStatistics.objects.count()),
+        ):
+            with self.subTest(setting):
+                assert getattr(settings.PROCESSINFO, setting) is False
+                assert stored == 0
+
+
+class OutcomeStatisticsTestCase(TestCase):
+    def test_status_classes(self):
+        self.client.get('/admin/login/')
+        self.client.get('/admin/login/')
+        self.client.get('/admin/')  # redirect to login
+
+        outcomes = {
+            (obj.view_name, obj.outcome): obj.request_count
+            for obj in OutcomeStatistics.objects.filter(outcome_type='status')
+        }
+        assert outcomes == {('admin:login', '2xx'): 2, ('admin:index', '3xx'): 1}
+        assert not OutcomeStatistics.objects.filter(outcome_type='exception').exists()
+
+    def test_exception_counted_once(self):
+        self.client.force_login(User.objects.create_superuser(username='foo'))
+        response = self.client.get('/admin/unknown/')
+        assert response.status_code == 404
+
+        process_info = ProcessInfo.objects.get()
+        assert process_info.request_count == 1
+        assert process_info.exception_count == 1
+
+        view_stats = ViewStatistics.objects.get()
+        assert view_stats.request_count == 1
+        assert view_stats.exception_count == 1
+
+        outcomes = {
+            (obj.outcome_type, obj.outcome): obj
+            for obj in OutcomeStatistics.objects.filter(view_name=view_stats.view_name)
+        }
+        assert sorted(outcomes) == [
+            ('exception', 'django.http.response.Http404'),
+            ('status', '4xx'),
+        ]
+        status_stats = outcomes['status', '4xx']
+        assert status_stats.request_count == 1
+        assert status_stats.response_time_avg == view_stats.response_time_avg
+
+
+class MemoryGrowthTestCase(TestCase):
+    def make_requests(self, rss_values):
+        def get_response(request):
+            return HttpResponse('<html><body>OK</body></html>')
+
+        middleware = ProcessInfoMiddleware(get_response)
+        for rss in rss_values:
+            process_information = {'Pid': os.getpid(), 'Threads': 2, 'VmPeak': rss * 2, 'VmRSS': rss}
+            with mock.patch.object(middlewares, 'process_information', return_value=process_information.items()):
+                request = RequestFactory().get('/admin/login/')
+                request.resolver_match = resolve('/admin/login/')
+                middleware(request)
+
+        return ProcessInfo.objects.get()
+
+    @mock.patch.object(settings.PROCESSINFO, 'GROWTH_WARMUP_REQUESTS', 2)
+    @mock.patch.object(settings.PROCESSINFO, 'LEAK_MIN_REQUESTS', 5)
+    @mock.patch.object(settings.PROCESSINFO, 'LEAK_MEMORY_BUDGET', 1000 * 1024)
+    def test_leaking_worker(self):
+        process_info = self.make_requests(rss_values=[10_000_000 + no * 10 * 1024 for no in range(10)])
+        assert process_info.request_count == 10
+        assert process_info.growth_count == 8  # without the warmup requests
+        assert round(process_info.get_rss_per_request()) == 10 * 1024
+        assert round(process_info.get_threads_per_request(), 3) == 0
+        assert process_info.is_leak_suspect() is True
+        assert process_info.get_suggested_max_requests() == 100
+        assert process_info.fds_max >= process_info.fds > 0
+
+    @mock.patch.object(settings.PROCESSINFO, 'GROWTH_WARMUP_REQUESTS', 2)
+    @mock.patch.object(settings.PROCESSINFO, 'LEAK_MIN_REQUESTS', 5)
+    def test_stable_worker(self):
+        process_info = self.make_requests(rss_values=[10_000_000] * 10)
+        assert process_info.growth_count == 8
+        assert process_info.get_rss_per_request() == 0
+        assert process_info.is_leak_suspect() is False
+        assert process_info.get_suggested_max_requests() is None
+
+    @mock.patch.object(settings.PROCESSINFO, 'GROWTH_WARMUP_REQUESTS', 2)
+    @mock.patch.object(settings.PROCESSINFO, 'LEAK_MIN_REQUESTS', 5)
+    def test_noisy_worker(self):
+        # The memory jumps up and down: Not a steady growth
+        process_info = self.make_requests(rss_values=[10_000_000, 20_000_000] * 5)
+        assert process_info.get_rss_per_request() > settings.PROCESSINFO.LEAK_THRESHOLD
+        assert process_info.is_leak_suspect() is False
+
+
+class RecycleTestCase(TestCase):
+    def test_max_requests(self):
+        action = mock.Mock()
+        with mock.patch.object(settings.PROCESSINFO, 'RECYCLE_MAX_REQUESTS', 2), \
+                mock.patch.object(settings.PROCESSINFO, 'RECYCLE_ACTION', action):
+            self.client.get('/admin/login/')
+            action.assert_not_called()
+
+            self.client.get('/admin/login/')
+            action.assert_called_once_with(pid=os.getpid(), reason='2 requests handled')
+
+            # Recycle only once:
+            self.client.get('/admin/login/')
+            action.assert_called_once()
+
+        process_info = ProcessInfo.objects.get()
+        assert process_info.recycle_reason == '2 requests handled'
+        site_stats = SiteStatistics.objects.get()
+        assert site_stats.process_recycled == 1
+
+    @mock.patch.object(settings.PROCESSINFO, 'RECYCLE_RSS_LIMIT', 1024)
+    def test_rss_limit_sigterm(self):
+        with mock.patch.object(recycle.os, 'kill') as kill:
+            self.client.get('/admin/login/')
+
+        kill.assert_called_once_with(os.getpid(), recycle.signal.SIGTERM)
+        assert 'exceeds the limit of 1.0\xa0KB' in ProcessInfo.objects.get().recycle_reason
+
+    def test_after_close(self):
+        calls = []
+        response = HttpResponse()
+        response.close = lambda: calls.append('close')
+        with mock.patch.object(settings.PROCESSINFO, 'RECYCLE_ACTION', lambda **kwargs: calls.append(kwargs)):
+            recycle.schedule_recycle(response, pid=123, reason='foo')
+        assert calls == []
+        response.close()
+        assert calls == ['close', {'pid': 123, 'reason': 'foo'}]
+
+    def test_deactivated(self):
+        with mock.patch.object(recycle.os, 'kill', side_effect=AssertionError):
+            self.client.get('/admin/login/')
+            self.client.get('/admin/login/')
+
+        assert ProcessInfo.objects.get().recycle_reason == ''
+        assert SiteStatistics.objects.get().process_recycled == 0
+
+
+class ColdStartTestCase(TestCase):
+    @mock.patch.object(settings.PROCESSINFO, 'WARMUP_REQUESTS', 2)
+    def test_cold_start(self):
+        for no in range(3):
+            self.client.get('/admin/login/')
+
+        process_info = ProcessInfo.objects.get()
+        assert process_info.startup_time >= 0
+        assert process_info.first_response_time > 0
+        assert process_info.warmup_count == 2
+        assert 0 < process_info.warmup_response_time_sum < process_info.response_time_sum
+
+        steady_avg = process_info.get_steady_response_time_avg()
+        assert steady_avg == pytest.approx(process_info.response_time_sum - process_info.warmup_response_time_sum)
+
+        warmup = list(WarmupStatistics.objects.values_list('request_no', 'process_count'))
+        assert warmup == [(1, 1), (2, 1)]
+        assert WarmupStatistics.objects.get(request_no=1).response_time_avg == process_info.first_response_time
+
+    def test_preloaded(self):
+        startup_timer = middlewares.startup_timer
+        with mock.patch.object(startup_timer, 'pid', -1):
+            # e.g. gunicorn --preload: The application was loaded before the worker was forked
+            assert startup_timer.get_startup_time() == 0.0
@@ -0,0 +1,88 @@
+import os
+import time
+from unittest import mock
+
+from django.conf import settings
+from django.test import SimpleTestCase, TestCase
+
+from django_processinfo import middlewares
+from django_processinfo.models import ProcessInfo, ProcessSample
+from django_processinfo.sampler import BaseSampler, ProcSampler, take_sample
+
+
+class ProcSamplerTestCase(TestCase):
+    def test_take_sample(self):
+        sample = take_sample()
+        assert sample.pid == os.getpid()
+        assert sample.memory > 0
+        assert sample.threads >= 1
+        assert sample.fds > 0
+
+    @mock.patch.object(settings.PROCESSINFO, 'MAX_PROCESS_SAMPLE_COUNT', 3)
+    def test_flush(self):
+        sampler = ProcSampler()
+        for __ in range(2):
+            sampler.sample()
+        sampler.flush()
+        assert ProcessSample.objects.count() == 2
+        assert len(sampler.buffer) == 0
+
+        for __ in range(3):
+            sampler.sample()
+        sampler.flush()
+
+        # Oldest entries are deleted:
+        assert ProcessSample.objects.count() == 3
+        assert ProcessSample.objects.filter(pid=os.getpid()).count() == 3
+
+    def test_middleware_use_latest_sample(self):
+        sample = take_sample()._replace(memory=1234, threads=5, fds=7)
+        with mock.patch.object(middlewares.proc_sampler, 'latest', sample), mock.patch.object(
+            middlewares, 'process_information', side_effect=AssertionError
+        ), mock.patch.object(middlewares, 'open_fd_count', side_effect=AssertionError):
+            self.client.get('/admin/login/')
+
+        process_info = ProcessInfo.objects.get()
+        assert process_info.memory_avg == 1234
+        assert process_info.threads_max == 5
+        assert process_info.fds == 7
+
+
+class BaseSamplerTestCase(SimpleTestCase):
+    def test_missing_take_sample(self):
+        class Sampler(BaseSampler):
+            pass
+
+        with self.assertRaises(TypeError):
+            Sampler()
+
+
+class ProcSamplerThreadTestCase(SimpleTestCase):
+    def test_deactivated(self):
+        sampler = ProcSampler()
+        assert settings.PROCESSINFO.PROC_SAMPLER_INTERVAL is None
+        assert sampler.ensure_running() is False
+        assert sampler.thread is None
+
+    @mock.patch.object(settings.PROCESSINFO, 'PROC_SAMPLER_INTERVAL', 0.01)
+    @mock.patch.object(settings.PROCESSINFO, 'PROC_SAMPLER_FLUSH_COUNT', 2)
+    def test_thread(self):
+        sampler = ProcSampler()
+        with mock.patch.object(sampler, 'flush') as flush_mock:
+            assert sampler.ensure_running() is True
+            thread = sampler.thread
+            assert thread.is_alive()
+
+            # Only one thread per process:
+            assert sampler.ensure_running() is True
+            assert sampler.thread is thread
+
+            for __ in range(100):
+                if flush_mock.called:
+                    break
+                time.sleep(0.01)
+            sampler.stop()
+
+        assert not thread.is_alive()
+        assert sampler.latest.pid == os.getpid()
+        assert flush_mock.called
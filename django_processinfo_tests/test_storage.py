@@ -0,0 +1,234 @@
+import datetime
+import os
+import tempfile
+from unittest import mock
+
+from django.conf import settings
+from django.core import checks
+from django.db import connections
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+
+from django_processinfo import middlewares
+from django_processinfo.apps import storage_check
+from django_processinfo.instrument import measure
+from django_processinfo.models import ProcessInfo
+from django_processinfo.storage import get_storage
+from django_processinfo.storage.base import PROCESS_FIELDS, SITE_FIELDS, VIEW_FIELDS, BaseStorage
+from django_processinfo.utils.proc_info import process_information
+
+
+class StorageConformanceMixin:
+    """
+    Tests that all storage backends must pass.
+    """
+    backend = None
+    options = {}
+
+    def setUp(self):
+        super().setUp()
+        patchers = (
+            mock.patch.object(settings.PROCESSINFO, 'STORAGE_BACKEND', self.backend),
+            mock.patch.object(settings.PROCESSINFO, 'STORAGE_OPTIONS', self.get_options()),
+        )
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.storage = get_storage()
+        self.storage.reset()
+        self.addCleanup(self.storage.reset)
+
+    def get_options(self):
+        return self.options
+
+    def test_instance(self):
+        assert isinstance(self.storage, BaseStorage)
+        assert get_storage() is self.storage
+
+    def test_empty(self):
+        assert self.storage.get_process_statistics() == []
+        assert self.storage.get_view_statistics() == []
+
+    def test_statistics(self):
+        for name in ('conformance.a', 'conformance.a', 'conformance.b'):
+            with measure(name):
+                pass
+        with self.assertRaises(ValueError):
+            with measure('conformance.b'):
+                raise ValueError
+
+        processes = self.storage.get_process_statistics()
+        assert len(processes) == 1
+        process = processes[0]
+        assert tuple(process) == PROCESS_FIELDS
+        assert process['pid'] == os.getpid()
+        assert process['site_id'] == settings.SITE_ID
+        assert process['kind'] == 'task'
+        assert process['request_count'] == 4
+        assert process['exception_count'] == 1
+        assert 0 < process['memory_min'] <= process['memory_avg'] <= process['memory_max']
+        assert process['threads_max'] >= 1
+        assert process['user_time_total'] >= 0
+        assert process['system_time_total'] >= 0
+        assert 0 < process['response_time_min'] <= process['response_time_avg'] <= process['response_time_max']
+        assert isinstance(process['start_time'], datetime.datetime)
+        assert process['start_time'] <= process['lastupdate_time']
+
+        views = self.storage.get_view_statistics()
+        assert [tuple(view) for view in views] == [VIEW_FIELDS, VIEW_FIELDS]
+        assert [
+            (view['site_id'], view['kind'], view['view_name'], view['request_count'], view['exception_count'])
+            for view in views
+        ] == [
+            (settings.SITE_ID, 'task', 'conformance.a', 2, 0),
+            (settings.SITE_ID, 'task', 'conformance.b', 2, 1),
+        ]
+        for view in views:
+            assert view['response_time_min'] <= view['response_time_avg'] <= view['response_time_max']
+            assert round(view['response_time_sum'], 9) == round(view['response_time_avg'] * 2, 9)
+
+    def test_site_statistics(self):
+        assert self.storage.get_site_statistics() == []
+        for name in ('conformance.a', 'conformance.b'):
+            with measure(name):
+                pass
+
+        sites = self.storage.get_site_statistics()
+        assert [tuple(site) for site in sites] == [SITE_FIELDS]
+        site = sites[0]
+        assert site['site_id'] == settings.SITE_ID
+        assert site['process_count'] == 1
+        assert site['request_count'] == 2
+        assert site['exception_count'] == 0
+        assert 0 < site['response_time_min'] <= site['response_time_avg'] <= site['response_time_max']
+        assert 0 < site['memory_min'] <= site['memory_avg'] <= site['memory_max']
+        assert site['start_time'] <= site['lastupdate_time']
+
+    def test_kinds(self):
+        with measure('conformance.job', kind='command'):
+            pass
+        with measure('conformance.job', kind='task'):
+            pass
+
+        views = self.storage.get_view_statistics()
+        assert [(view['kind'], view['request_count']) for view in views] == [('command', 1), ('task', 1)]
+
+    def test_reset(self):
+        with measure('conformance.reset'):
+            pass
+        assert len(self.storage.get_view_statistics()) == 1
+
+        self.storage.reset()
+        assert self.storage.get_process_statistics() == []
+        assert self.storage.get_view_statistics() == []
+
+
+class OrmStorageTestCase(StorageConformanceMixin, TestCase):
+    backend = 'django_processinfo.storage.orm.OrmStorage'
+
+    @mock.patch.object(settings.PROCESSINFO, 'MAX_PROCESSINFO_COUNT', 2)
+    def test_max_processinfo_count(self):
+        for pid in range(1, 6):
+            other_worker = {**dict(process_information()), 'Pid': pid}
+            with mock.patch.object(middlewares, 'process_information', return_value=other_worker.items()):
+                with measure('conformance.cleanup'):
+                    pass
+            assert ProcessInfo.objects.count() == min(pid, 2)
+
+        with measure('conformance.cleanup'):
+            pass
+        assert sorted(ProcessInfo.objects.values_list('pid', flat=True)) == [5, os.getpid()]
+
+
+class SqliteWriteLockTestCase(TestCase):
+    databases = {'default', 'processinfo'}
+
+    def get_lock_queries(self, alias):
+        with CaptureQueriesContext(connections[alias]) as queries:
+            with measure('write.lock'):
+                pass
+        return [query['sql'] for query in queries if query['sql'].endswith('WHERE 0')]
+
+    def test_default_database(self):
+        assert settings.PROCESSINFO.DATABASE is None
+        assert self.get_lock_queries('default') == []
+
+    @mock.patch.object(settings.PROCESSINFO, 'DATABASE', 'processinfo')
+    def test_own_database(self):
+        assert self.get_lock_queries('processinfo') == [
+            'UPDATE "django_processinfo_sitestatistics" SET process_spawn = process_spawn WHERE 0'
+        ]
+
+
+class MemoryStorageTestCase(StorageConformanceMixin, TestCase):
+    backend = 'django_processinfo.storage.memory.MemoryStorage'
+
+
+class AppendOnlyFileStorageTestCase(StorageConformanceMixin, TestCase):
+    backend = 'django_processinfo.storage.file.AppendOnlyFileStorage'
+
+    def get_options(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        return {'path': os.path.join(temp_dir.name, 'records.jsonl')}
+
+    def test_incomplete_line(self):
+        with measure('conformance.crash'):
+            pass
+        with open(self.storage.path, 'a') as f:
+            f.write('{"time": 1')  # e.g.: killed while writing
+
+        assert [view['request_count'] for view in self.storage.get_view_statistics()] == [1]
+
+
+class KeyValueStorageTestCase(StorageConformanceMixin, TestCase):
+    backend = 'django_processinfo.storage.kv.KeyValueStorage'
+
+    def test_merge_processes(self):
+        with measure('conformance.merge'):
+            pass
+        other_worker = {**dict(process_information()), 'Pid': 1}
+        with mock.patch.object(middlewares, 'process_information', return_value=other_worker.items()):
+            with measure('conformance.merge'):
+                pass
+
+        assert [process['pid'] for process in self.storage.get_process_statistics()] == [1, os.getpid()]
+        assert [view['request_count'] for view in self.storage.get_view_statistics()] == [2]
+
+
+class IncompleteStorage(BaseStorage):
+    def save(self, info, exception):
+        pass
+
+
+class BaseStorageTestCase(SimpleTestCase):
+    @mock.patch.object(settings.PROCESSINFO, 'STORAGE_BACKEND', IncompleteStorage)
+    def test_incomplete_backend(self):
+        with self.assertRaises(TypeError):
+            get_storage()
+
+
+class StorageCheckTestCase(SimpleTestCase):
+    def test_orm_storage(self):
+        assert settings.PROCESSINFO.STORAGE_BACKEND == 'django_processinfo.storage.orm.OrmStorage'
+        with mock.patch.object(settings.PROCESSINFO, 'RECYCLE_MAX_REQUESTS', 100):
+            assert storage_check() == []
+
+    @mock.patch.object(settings.PROCESSINFO, 'STORAGE_BACKEND', 'django_processinfo.storage.memory.MemoryStorage')
+    def test_other_storage(self):
+        assert storage_check() == []
+
+        with mock.patch.object(settings.PROCESSINFO, 'RECYCLE_MAX_REQUESTS', 100):
+            errors = storage_check()
+        assert [(error.level, error.msg, error.hint) for error in errors] == [(
+            checks.ERROR,
+            'Worker recycling is not supported by MemoryStorage',
+            'Use the ORM storage backend or deactivate: RECYCLE_MAX_REQUESTS',
+        )]
+
+    @mock.patch.object(settings.PROCESSINFO, 'STORAGE_BACKEND', 'django_processinfo.storage.does_not_exists.Storage')
+    def test_import_error(self):
+        errors = storage_check()
+        assert [error.level for error in errors] == [checks.ERROR]
+        assert errors[0].msg.startswith("Can't import settings.PROCESSINFO.STORAGE_BACKEND:")